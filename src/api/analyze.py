@@ -5,6 +5,7 @@ ATS Analysis route — scores a resume against a job description.
 from typing import Optional
 
 from fastapi import APIRouter, Form, HTTPException
+from fastapi.responses import Response
 
 from ..exceptions import SessionNotFoundError, LLMProviderError
 from ..llm.client import extract_keywords
@@ -83,4 +84,6 @@ async def analyze_resume(
     except Exception as exc:
         logger.warning("Failed to persist analysis to Supabase: %s", exc)
 
-    return analysis.model_dump()
+    # Serialize straight to JSON bytes in pydantic-core — returning a dict
+    # would send the nested analysis lists through jsonable_encoder
+    return Response(content=analysis.model_dump_json(), media_type="application/json")
@@ -5,18 +5,48 @@ In-memory dicts are the fast path. On cache miss, we fall back to Supabase.
 On write, data is saved to both memory AND Supabase so it survives restarts.
 """
 
+import heapq
 import time
-from typing import Optional
+from typing import Iterator, Optional
 
 from ..models import ResumeData, ATSAnalysisResult, ResumeVersion
 from ..logger import logger
 
 
+class SessionTimestamps(dict):
+    """
+    session_id → creation epoch, with an expiry heap kept alongside.
+
+    Every assignment also pushes ``(timestamp, session_id)`` onto a min-heap,
+    so ``pop_expired`` only touches sessions that actually expired instead of
+    scanning the whole dict. Re-registering a session leaves its old heap
+    entry behind; stale entries are recognised (the dict no longer holds that
+    timestamp) and discarded as they reach the top.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._heap: list[tuple[float, str]] = []
+
+    def __setitem__(self, session_id: str, created_at: float) -> None:
+        super().__setitem__(session_id, created_at)
+        heapq.heappush(self._heap, (created_at, session_id))
+
+    def pop_expired(self, cutoff: float) -> Iterator[str]:
+        """Remove and yield sessions created before ``cutoff``, oldest first."""
+        heap = self._heap
+        while heap and heap[0][0] < cutoff:
+            created_at, session_id = heapq.heappop(heap)
+            if self.get(session_id) == created_at:
+                del self[session_id]
+                yield session_id
+
+
 # ── In-memory caches (fast path) ──
 resume_data_cache: dict[str, ResumeData] = {}
 resume_versions: dict[str, list[ResumeVersion]] = {}  # session_id → versions
 analysis_cache: dict[str, ATSAnalysisResult] = {}       # session_id:jd_hash → analysis
-session_timestamps: dict[str, float] = {}                # session_id → creation epoch
+session_timestamps = SessionTimestamps()                 # session_id → creation epoch
 
 
 def register_session(session_id: str) -> None:
@@ -38,7 +38,10 @@ _api_key_query = APIKeyQuery(name="api_key", auto_error=False)
 
 # ── In-memory key store (loaded from config + Supabase) ──
 
-_valid_keys: Set[str] = set()
+# Keys are held only as keyed BLAKE2b digests under a per-process secret, so
+# set membership never compares attacker-controlled prefixes of a real key.
+_DIGEST_KEY = secrets.token_bytes(16)
+_valid_keys: Set[bytes] = set()
 _key_metadata: Dict[str, dict] = {}  # key_hash -> metadata
 _key_usage: Dict[str, dict] = {}     # key_hash -> usage counters
 
@@ -48,6 +51,11 @@ def _hash_key(key: str) -> str:
     return hashlib.sha256(key.encode()).hexdigest()[:32]
 
 
+def _key_digest(key: str) -> bytes:
+    """Keyed digest used for in-memory key lookups."""
+    return hashlib.blake2b(key.encode(), key=_DIGEST_KEY, digest_size=16).digest()
+
+
 def _load_static_keys():
     """Load API keys from environment config."""
     raw = getattr(settings, "api_keys", "")
@@ -55,7 +63,7 @@ def _load_static_keys():
         for key in raw.split(","):
             key = key.strip()
             if key:
-                _valid_keys.add(key)
+                _valid_keys.add(_key_digest(key))
                 _key_metadata[_hash_key(key)] = {
                     "source": "env",
                     "created_at": time.time(),
@@ -87,7 +95,7 @@ def generate_api_key(prefix: str = "ats") -> str:
 
 def add_api_key(key: str, metadata: Optional[dict] = None) -> None:
     """Register a new API key."""
-    _valid_keys.add(key)
+    _valid_keys.add(_key_digest(key))
     _key_metadata[_hash_key(key)] = {
         "source": "runtime",
         "created_at": time.time(),
@@ -97,8 +105,9 @@ def add_api_key(key: str, metadata: Optional[dict] = None) -> None:
 
 def revoke_api_key(key: str) -> bool:
     """Revoke an API key. Returns True if found and removed."""
-    if key in _valid_keys:
-        _valid_keys.discard(key)
+    digest = _key_digest(key)
+    if digest in _valid_keys:
+        _valid_keys.discard(digest)
         _key_metadata.pop(_hash_key(key), None)
         _key_usage.pop(_hash_key(key), None)
         return True
@@ -116,7 +125,7 @@ def validate_key(key: str) -> bool:
     _init_auth()
     if not _valid_keys:
         return True  # No keys configured → open access
-    return key in _valid_keys
+    return _key_digest(key) in _valid_keys
 
 
 def record_usage(key: str, endpoint: str) -> None:
@@ -5,6 +5,7 @@ Runs as an asyncio background task started on app startup.
 """
 
 import asyncio
+import os
 import time
 from pathlib import Path
 
@@ -23,35 +24,42 @@ def _cleanup_old_files(directory: Path, max_age_seconds: int) -> int:
     if not directory.exists():
         return 0
 
-    now = time.time()
+    cutoff = time.time() - max_age_seconds
     deleted = 0
-    for f in directory.iterdir():
-        if f.is_file():
-            age = now - f.stat().st_mtime
-            if age > max_age_seconds:
+    # scandir answers is_file() from the directory listing itself, leaving
+    # one stat() per file instead of two
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
                 try:
-                    f.unlink()
+                    os.unlink(entry.path)
                     deleted += 1
                 except OSError as e:
-                    logger.warning("Failed to delete %s: %s", f, e)
+                    logger.warning("Failed to delete %s: %s", entry.path, e)
     return deleted
 
 
+def _cleanup_finished_tasks() -> int:
+    """Drop finished background tasks past their result TTL from memory."""
+    from .tasks import task_queue
+    return task_queue.cleanup_old_tasks()
+
+
+def _cleanup_llm_disk_cache() -> int:
+    """Delete expired LLM rewrite files from the optional disk cache."""
+    from .core.cache import cleanup_disk_cache
+    return cleanup_disk_cache()
+
+
 def _cleanup_expired_sessions(max_age_seconds: int) -> int:
     """Remove expired sessions from in-memory caches."""
     from .api.deps import resume_data_cache, resume_versions, analysis_cache, session_timestamps
 
-    now = time.time()
-    expired = []
-
-    for session_id, created_at in list(session_timestamps.items()):
-        if now - created_at > max_age_seconds:
-            expired.append(session_id)
+    expired = list(session_timestamps.pop_expired(time.time() - max_age_seconds))
 
     for session_id in expired:
         resume_data_cache.pop(session_id, None)
         resume_versions.pop(session_id, None)
-        session_timestamps.pop(session_id, None)
         # Clean analysis cache entries for this session
         keys_to_remove = [k for k in analysis_cache if k.startswith(session_id)]
         for k in keys_to_remove:
@@ -75,13 +83,18 @@ async def cleanup_loop() -> None:
             output_deleted = _cleanup_old_files(OUTPUT_DIR, FILE_MAX_AGE_SECONDS)
             upload_deleted = _cleanup_old_files(UPLOAD_DIR, FILE_MAX_AGE_SECONDS)
             sessions_expired = _cleanup_expired_sessions(SESSION_MAX_AGE_SECONDS)
+            tasks_expired = _cleanup_finished_tasks()
+            rewrites_deleted = _cleanup_llm_disk_cache()
 
-            if output_deleted or upload_deleted or sessions_expired:
+            if output_deleted or upload_deleted or sessions_expired or tasks_expired or rewrites_deleted:
                 logger.info(
-                    "🧹 Cleanup: %d output files, %d upload files deleted; %d sessions expired",
+                    "🧹 Cleanup: %d output files, %d upload files, %d cached rewrites deleted; "
+                    "%d sessions, %d tasks expired",
                     output_deleted,
                     upload_deleted,
+                    rewrites_deleted,
                     sessions_expired,
+                    tasks_expired,
                 )
         except Exception as e:
             logger.error("Cleanup task error: %s", e, exc_info=True)
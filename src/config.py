@@ -69,6 +69,14 @@ class Settings(BaseSettings):
     )
     llm_timeout: int = Field(default=60, description="LLM request timeout in seconds")
     llm_max_retries: int = Field(default=2, description="LLM call retries before giving up")
+    llm_concurrency: int = Field(
+        default=16,
+        description="Max in-flight async LLM requests per process (stay under provider RPM caps)",
+    )
+    llm_cache_dir: str = Field(
+        default="",
+        description="Directory for the persistent LLM rewrite cache (empty = in-memory only)",
+    )
 
     # ── Rate limiting ──
     rate_limit_requests: int = Field(
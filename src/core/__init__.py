@@ -5,11 +5,11 @@ No direct LLM calls here; LLM interaction goes through src.llm.
 """
 
 from .ats_scorer import analyze_resume_ats
-from .resume_parser import parse_resume, parse_resume_from_text
+from .resume_parser import parse_resume, parse_resumes, parse_resume_from_text
 from .cache import cache_get, cache_set, cache_keywords
 
 __all__ = [
     "analyze_resume_ats",
-    "parse_resume", "parse_resume_from_text",
+    "parse_resume", "parse_resumes", "parse_resume_from_text",
     "cache_get", "cache_set", "cache_keywords",
 ]
@@ -115,6 +115,41 @@ ATS_DATE_PATTERNS = [
 ]
 
 
+# ═══════════════════════════════════════════════════════════
+# Compiled patterns
+# ═══════════════════════════════════════════════════════════
+
+_DATE_RES = tuple(re.compile(p, re.IGNORECASE) for p in ATS_DATE_PATTERNS)
+_MONTH_YEAR_RE = _DATE_RES[0]
+_NUMERIC_DATE_RE = _DATE_RES[1]
+
+_REPEATED_CHAR_RE = re.compile(r'(.)\1{10,}')
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PHONE_RE = re.compile(r'[\+]?[(]?\d{1,4}[)]?[-\s\.]?\d{1,4}[-\s\.]?\d{1,9}')
+_HEADER_PHONE_RE = re.compile(r'[\(]?\d{3}[\)]?[-.\s]?\d{3}[-.\s]?\d{4}')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_LOCATION_RE = re.compile(r'\b[A-Z][a-z]+(?:\s[A-Z][a-z]+)?,\s*[A-Z]{2}\b')
+# C0 control characters other than \t, \n and \r
+_CONTROL_CHAR_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+_BULLET_CHAR_RE = re.compile(r'^\s*[\u2022\u2023\u25cf\u25cb\u25aa\u25ab]')
+
+# sanitize_for_ats: every single-character substitution in one regex pass
+# (str.translate would be slower here: multi-character replacements push
+# it off its fast path)
+_SANITIZE_MAP = {
+    **ATS_BREAKING_CHARS,
+    '\u2018': "'", '\u2019': "'",  # smart single quotes
+    '\u201c': '"', '\u201d': '"',  # smart double quotes
+    '\u2014': '--',                  # em dash
+    '\u2013': '-',                   # en dash
+}
+_SANITIZE_RE = re.compile('[' + ''.join(map(re.escape, _SANITIZE_MAP)) + ']')
+_MULTI_SPACE_RE = re.compile(r'[\t ][\t ]+')
+_EXCESS_NEWLINES_RE = re.compile(r'\n\n\n+')
+# \u200b and \ufeff are already gone after the character pass
+_ZERO_WIDTH_RE = re.compile(r'[\u200c\u200d]')
+
+
 # ═══════════════════════════════════════════════════════════
 # Main Validation Function
 # ═══════════════════════════════════════════════════════════
@@ -211,7 +246,8 @@ def _check_text_readability(text: str, result: ATSValidationResult) -> bool:
         return False
 
     # Check for garbled text (high ratio of non-ASCII characters)
-    non_ascii_count = sum(1 for c in text if ord(c) > 127)
+    # Encoding drops every non-ASCII code point in one C pass
+    non_ascii_count = len(text) - len(text.encode('ascii', 'ignore'))
     non_ascii_ratio = non_ascii_count / len(text) if text else 0
     if non_ascii_ratio > 0.1:
         result.issues.append(ATSValidationIssue(
@@ -235,7 +271,7 @@ def _check_text_readability(text: str, result: ATSValidationResult) -> bool:
         passed = False
 
     # Check for repeated characters (garbled output)
-    if re.search(r'(.)\1{10,}', text):
+    if _REPEATED_CHAR_RE.search(text):
         result.issues.append(ATSValidationIssue(
             severity="warning",
             check="text_readability",
@@ -292,8 +328,7 @@ def _check_contact_parsing(
     passed = True
 
     # Email detection
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    emails = re.findall(email_pattern, text)
+    emails = _EMAIL_RE.findall(text)
     result.contact_parsed["email"] = len(emails) > 0
 
     if not emails:
@@ -306,10 +341,9 @@ def _check_contact_parsing(
         passed = False
 
     # Phone detection
-    phone_pattern = r'[\+]?[(]?\d{1,4}[)]?[-\s\.]?\d{1,4}[-\s\.]?\d{1,9}'
-    phones = re.findall(phone_pattern, text)
+    phones = _PHONE_RE.findall(text)
     # Filter out short numbers (years, metrics)
-    phones = [p for p in phones if len(re.sub(r'[^\d]', '', p)) >= 10]
+    phones = [p for p in phones if len(_NON_DIGIT_RE.sub('', p)) >= 10]
     result.contact_parsed["phone"] = len(phones) > 0
 
     if not phones:
@@ -326,8 +360,7 @@ def _check_contact_parsing(
     result.contact_parsed["linkedin"] = linkedin_found
 
     # Location detection
-    location_pattern = r'\b[A-Z][a-z]+(?:\s[A-Z][a-z]+)?,\s*[A-Z]{2}\b'
-    locations = re.findall(location_pattern, text)
+    locations = _LOCATION_RE.findall(text)
     result.contact_parsed["location"] = len(locations) > 0
 
     # Verify against original data if available
@@ -341,8 +374,8 @@ def _check_contact_parsing(
         passed = False
 
     if resume_data and resume_data.phone:
-        phone_digits = re.sub(r'[^\d]', '', resume_data.phone)
-        if phone_digits and phone_digits not in re.sub(r'[^\d]', '', text):
+        phone_digits = _NON_DIGIT_RE.sub('', resume_data.phone)
+        if phone_digits and phone_digits not in _NON_DIGIT_RE.sub('', text):
             result.issues.append(ATSValidationIssue(
                 severity="warning",
                 check="contact_parsing",
@@ -360,8 +393,8 @@ def _check_date_formats(text: str, result: ATSValidationResult) -> bool:
 
     # Find all dates in the text
     dates_found = []
-    for pattern in ATS_DATE_PATTERNS:
-        dates_found.extend(re.findall(pattern, text, re.IGNORECASE))
+    for pattern in _DATE_RES:
+        dates_found.extend(pattern.findall(text))
 
     if not dates_found:
         result.issues.append(ATSValidationIssue(
@@ -373,11 +406,8 @@ def _check_date_formats(text: str, result: ATSValidationResult) -> bool:
         passed = False
 
     # Check for inconsistent date formats
-    month_year = len(re.findall(
-        r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}\b',
-        text, re.IGNORECASE
-    ))
-    numeric_dates = len(re.findall(r'\b\d{1,2}/\d{4}\b', text))
+    month_year = len(_MONTH_YEAR_RE.findall(text))
+    numeric_dates = len(_NUMERIC_DATE_RE.findall(text))
 
     if month_year > 0 and numeric_dates > 0:
         result.issues.append(ATSValidationIssue(
@@ -396,9 +426,12 @@ def _check_special_characters(text: str, result: ATSValidationResult) -> bool:
     passed = True
 
     found_chars = {}
-    for char, replacement in ATS_BREAKING_CHARS.items():
-        if char in text:
-            found_chars[char] = replacement
+    # Every breaking character is non-ASCII, and isascii() is answered from
+    # the string's stored width without scanning it
+    if not text.isascii():
+        for char, replacement in ATS_BREAKING_CHARS.items():
+            if char in text:
+                found_chars[char] = replacement
 
     if found_chars:
         char_list = ", ".join(f"'{c}'" for c in list(found_chars.keys())[:5])
@@ -411,7 +444,7 @@ def _check_special_characters(text: str, result: ATSValidationResult) -> bool:
         passed = False
 
     # Check for invisible characters
-    invisible = [c for c in text if ord(c) < 32 and c not in '\n\r\t']
+    invisible = _CONTROL_CHAR_RE.findall(text)
     if invisible:
         result.issues.append(ATSValidationIssue(
             severity="warning",
@@ -492,10 +525,14 @@ def _check_keyword_density(
 
     present = 0
     total = len(keywords)
+    # Keywords differing only in case share one count
+    counts: Dict[str, int] = {}
 
     for kw in keywords:
         kw_lower = kw.lower()
-        count = text_lower.count(kw_lower)
+        count = counts.get(kw_lower)
+        if count is None:
+            count = counts[kw_lower] = text_lower.count(kw_lower)
         result.keyword_density[kw] = count
 
         if count > 0:
@@ -538,7 +575,7 @@ def _check_contact_completeness(text: str, result: ATSValidationResult) -> bool:
     header_text = '\n'.join(lines[:8]).lower()  # First 8 lines = header area
 
     # Email in header
-    if not re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '\n'.join(lines[:8])):
+    if not _EMAIL_RE.search('\n'.join(lines[:8])):
         result.issues.append(ATSValidationIssue(
             severity="warning",
             check="contact_completeness",
@@ -548,7 +585,7 @@ def _check_contact_completeness(text: str, result: ATSValidationResult) -> bool:
         passed = False
 
     # Phone in header
-    phone_in_header = re.search(r'[\(]?\d{3}[\)]?[-.\s]?\d{3}[-.\s]?\d{4}', '\n'.join(lines[:8]))
+    phone_in_header = _HEADER_PHONE_RE.search('\n'.join(lines[:8]))
     if not phone_in_header:
         result.issues.append(ATSValidationIssue(
             severity="info",
@@ -568,7 +605,7 @@ def _check_bullet_format(text: str, result: ATSValidationResult) -> bool:
     lines = text.split('\n')
     bullet_lines = [l.strip() for l in lines if l.strip() and (
         l.strip().startswith(('•', '-', '*', '–', '—', '►', '▪', '●'))
-        or re.match(r'^\s*[\u2022\u2023\u25cf\u25cb\u25aa\u25ab]', l)
+        or _BULLET_CHAR_RE.match(l)
     )]
 
     if bullet_lines:
@@ -649,23 +686,18 @@ def sanitize_for_ats(text: str) -> str:
     Clean text for ATS compatibility.
     Replaces problematic characters and normalizes formatting.
     """
-    # Replace ATS-breaking characters
-    for char, replacement in ATS_BREAKING_CHARS.items():
-        text = text.replace(char, replacement)
-
-    # Normalize quotes
-    text = text.replace('\u2018', "'").replace('\u2019', "'")  # smart single quotes
-    text = text.replace('\u201c', '"').replace('\u201d', '"')  # smart double quotes
-
-    # Normalize dashes
-    text = text.replace('\u2014', '--')  # em dash
-    text = text.replace('\u2013', '-')   # en dash
+    # Replace ATS-breaking characters, quotes and dashes
+    text = _SANITIZE_RE.sub(lambda m: _SANITIZE_MAP[m.group()], text)
 
-    # Normalize whitespace
-    text = re.sub(r'[\t ]{2,}', ' ', text)       # collapse multiple spaces
-    text = re.sub(r'\n{3,}', '\n\n', text)        # max 2 newlines
+    # Normalize whitespace. Each pass is a full regex scan, so skip it when
+    # a plain substring check (a C-speed search) shows nothing to do
+    if '  ' in text or '\t' in text:
+        text = _MULTI_SPACE_RE.sub(' ', text)       # collapse multiple spaces
+    if '\n\n\n' in text:
+        text = _EXCESS_NEWLINES_RE.sub('\n\n', text)  # max 2 newlines
 
     # Remove zero-width characters
-    text = re.sub(r'[\u200b\u200c\u200d\ufeff]', '', text)
+    if '\u200c' in text or '\u200d' in text:
+        text = _ZERO_WIDTH_RE.sub('', text)
 
     return text
@@ -1,13 +1,25 @@
 """
 Simple in-memory cache for expensive operations.
 In production, use Redis or similar for distributed caching.
+
+LLM section rewrites can additionally be persisted to disk (see
+``settings.llm_cache_dir``) so they survive restarts and are shared by
+every worker on the host.
 """
 
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable
 import hashlib
 import json
+import os
+import tempfile
+import threading
+import time
 from datetime import datetime, timedelta
 
+from ..config import settings
+
 # Simple in-memory cache with TTL
 _cache: Dict[str, tuple[Any, datetime]] = {}
 CACHE_TTL = timedelta(hours=24)  # Cache for 24 hours
@@ -17,7 +29,7 @@ def _generate_key(*args, **kwargs) -> str:
     """Generate a cache key from arguments."""
     # Create a hash of the arguments
     key_data = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True)
-    return hashlib.md5(key_data.encode()).hexdigest()
+    return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
 
 
 def cache_get(key: str) -> Optional[Any]:
@@ -51,6 +63,8 @@ set = cache_set
 def clear() -> None:
     """Clear all cache entries."""
     _cache.clear()
+    with _persistent_lock:
+        _persistent.clear()
 
 
 def cache_keywords(job_description: str) -> str:
@@ -62,3 +76,121 @@ def cache_resume_rewrite(session_id: str, job_description: str, content_type: st
     """Generate cache key for resume content rewriting."""
     return f"rewrite:{session_id}:{content_type}:{_generate_key(job_description)}"
 
+
+def cache_parsed_resume(content: bytes, file_type: str) -> str:
+    """Generate a content-addressed cache key for a parsed resume file."""
+    return f"parsed:{file_type}:{hashlib.blake2b(content, digest_size=16).hexdigest()}"
+
+
+def cache_section_rewrite(section_text: str, job_description: str, keywords: Iterable[str], model: str) -> str:
+    """
+    Generate a content-addressed cache key for an LLM section rewrite.
+
+    Unlike cache_resume_rewrite this is not tied to a session: the same
+    section rewritten for the same JD, keywords and model hits the same key.
+    """
+    key_data = json.dumps([section_text, job_description, sorted(keywords), model])
+    return f"section:{hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()}"
+
+
+# ═══════════════════════════════════════════════════════════
+# Persistent (memory + disk) cache
+# ═══════════════════════════════════════════════════════════
+
+_DISK_DIR: Optional[Path] = Path(settings.llm_cache_dir) if settings.llm_cache_dir else None
+
+# One entry per (section, JD, keywords, model), so the memory tier is an LRU
+# instead of the unbounded _cache; the disk tier is pruned by cleanup_disk_cache
+PERSISTENT_CACHE_SIZE = 1024
+_persistent: "OrderedDict[str, tuple[Any, float]]" = OrderedDict()  # key -> (value, expiry epoch)
+_persistent_lock = threading.Lock()
+
+
+def _disk_path(key: str) -> Path:
+    return _DISK_DIR / f"{key.replace(':', '_')}.json"
+
+
+def _memory_get(key: str) -> Optional[Any]:
+    with _persistent_lock:
+        entry = _persistent.get(key)
+        if entry is None:
+            return None
+        value, expiry = entry
+        if time.time() > expiry:
+            del _persistent[key]
+            return None
+        _persistent.move_to_end(key)
+        return value
+
+
+def _memory_set(key: str, value: Any) -> None:
+    with _persistent_lock:
+        _persistent[key] = (value, time.time() + CACHE_TTL.total_seconds())
+        _persistent.move_to_end(key)
+        if len(_persistent) > PERSISTENT_CACHE_SIZE:
+            _persistent.popitem(last=False)
+
+
+def _copy_out(value: Any) -> Any:
+    """Give each caller its own list so mutating a result can't alter the cache."""
+    return list(value) if isinstance(value, list) else value
+
+
+def persistent_get(key: str) -> Optional[Any]:
+    """Get a value from memory, falling back to the disk cache if configured."""
+    value = _memory_get(key)
+    if value is not None or _DISK_DIR is None:
+        return _copy_out(value)
+    
+    path = _disk_path(key)
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL.total_seconds():
+            return None
+        value = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    
+    _memory_set(key, value)
+    return _copy_out(value)
+
+
+def persistent_set(key: str, value: Any) -> None:
+    """Set a value in memory and, if configured, write it through to disk."""
+    _memory_set(key, _copy_out(value))
+    if _DISK_DIR is None:
+        return
+    
+    path = _disk_path(key)
+    try:
+        _DISK_DIR.mkdir(parents=True, exist_ok=True)
+        # Unique per writer: threads of one process may store the same key
+        fd, tmp_name = tempfile.mkstemp(dir=_DISK_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as out:
+                json.dump(value, out)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        # Disk cache is best-effort; the in-memory entry is already set
+        pass
+
+
+def cleanup_disk_cache() -> int:
+    """Delete disk cache files older than the TTL; returns how many were removed."""
+    if _DISK_DIR is None or not _DISK_DIR.is_dir():
+        return 0
+    
+    cutoff = time.time() - CACHE_TTL.total_seconds()
+    deleted = 0
+    with os.scandir(_DISK_DIR) as entries:
+        for entry in entries:
+            # Stale *.tmp files from interrupted writes go too
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                try:
+                    os.unlink(entry.path)
+                    deleted += 1
+                except OSError:
+                    pass
+    return deleted
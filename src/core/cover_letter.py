@@ -13,7 +13,7 @@ import os
 from typing import List, Optional
 
 from ..models import ResumeData, CoverLetterResponse
-from ..llm.provider import async_client, ASYNC_MODEL as MODEL
+from ..llm.provider import async_client, llm_semaphore, ASYNC_MODEL as MODEL
 
 
 async def generate_cover_letter(
@@ -103,18 +103,19 @@ Return ONLY the cover letter text, no headers or formatting instructions."""
         return _generate_fallback_cover_letter(resume_data, job_description, company_name, job_title, keywords)
 
     try:
-        response = await async_client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert cover letter writer. Write compelling, specific cover letters that connect candidate experience to job requirements. Return only the letter text."
-                },
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=800,
-        )
+        async with llm_semaphore:
+            response = await async_client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert cover letter writer. Write compelling, specific cover letters that connect candidate experience to job requirements. Return only the letter text."
+                    },
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.7,
+                max_tokens=800,
+            )
 
         cover_letter = response.choices[0].message.content.strip()
 
@@ -16,18 +16,28 @@ ATS-Critical Format Rules Enforced:
   ✓ Consistent formatting throughout
 """
 
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import asyncio
+import io
+import os
+import re
+import tempfile
+import zipfile
+from xml.sax.saxutils import escape as xml_escape
 
 from docx import Document
 from docx.enum.section import WD_ORIENT
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 from docx.shared import Pt, Inches
 
-from ..models import ResumeData, Experience
-from ..utils import deduplicate_preserve_order, normalize_keyword
-from ..llm.client import rewrite_experience_bullets, rewrite_project_description, match_experience_with_jd
+from ..models import ResumeData, Experience, Project
+from ..utils import deduplicate_preserve_order, normalize_keyword, split_sentences
+from ..llm.client import match_experience_with_jd
+from ..llm.client_async import rewrite_all_sections_async
 
 # Try to import optimized version first (faster)
 try:
@@ -88,13 +98,73 @@ FONT_NAME = "Calibri"         # Most ATS-compatible sans-serif font
 FONT_SIZE_NAME = Pt(14)       # Name: 14pt bold (ATS rule: 14-16pt)
 FONT_SIZE_CONTACT = Pt(10)    # Contact line: 10pt
 FONT_SIZE_SECTION = Pt(11)    # Section headings: 11pt bold
-FONT_SIZE_BODY = Pt(10)       # Body text: 10pt
-FONT_SIZE_BULLET = Pt(10)     # Bullet items: 10pt
+FONT_SIZE_BODY = Pt(10)       # Body text + bullets: 10pt (set once on the Normal style)
 
 # Spacing
 LINE_SPACING = Pt(12)
 PARAGRAPH_SPACING = Pt(2)     # Tighter spacing for 1-page fit
 
+# Page budget: paragraphs that fit on one page (plus a little slack).
+# Letter (8.5x11): ~65-70 paragraphs, C3 (7.17x10.51): ~55-60
+MAX_PARAGRAPHS = 70 if USE_LETTER_SIZE else 60
+
+# Run properties for every non-body style, built once at import. Body runs
+# carry no <w:rPr> (font/size come from Normal); styled runs embed one of
+# these strings.
+def _rpr(size=None, bold: bool = False, italic: bool = False) -> str:
+    xml = "<w:rPr>"
+    if bold:
+        xml += "<w:b/>"
+    if italic:
+        xml += "<w:i/>"
+    if size is not None:
+        xml += f'<w:sz w:val="{int(size.pt * 2)}"/>'
+    return xml + "</w:rPr>"
+
+
+def _spacing(before: int, after: int) -> str:
+    """Paragraph spacing in points (Normal already defaults to 0/0)."""
+    return f'<w:spacing w:before="{before * 20}" w:after="{after * 20}"/>'
+
+
+_RPR_NAME = _rpr(FONT_SIZE_NAME, bold=True)
+_RPR_CONTACT = _rpr(FONT_SIZE_CONTACT)
+_RPR_SECTION = _rpr(FONT_SIZE_SECTION, bold=True)
+_RPR_BOLD = _rpr(bold=True)
+_RPR_ITALIC = _rpr(italic=True)
+
+# Paragraph properties, concatenated in schema order (pBdr, spacing, ind, jc)
+_PPR_RULE = '<w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="333333"/></w:pBdr>'
+_PPR_LEFT = '<w:jc w:val="left"/>'
+_PPR_NAME = _spacing(0, 2) + _PPR_LEFT
+_PPR_HEADING = _PPR_RULE + _spacing(6, 2) + _PPR_LEFT
+_PPR_ENTRY = _spacing(3, 0)
+_PPR_JOB_TITLE = _spacing(4, 0)
+_PPR_COMPANY = _spacing(0, 1)
+
+# Bullet paragraph: left indent only, body formatting from Normal. The
+# ATS-safe dash is baked into the template, so bullet text is formatted
+# into it once with no separate prefix/run/paragraph assembly.
+BULLET_INDENT = Inches(0.25)
+BULLET_PREFIX = "- "
+_BULLET_XML = (
+    f'<w:p><w:pPr><w:ind w:left="{BULLET_INDENT.twips}"/></w:pPr>'
+    f'<w:r><w:t xml:space="preserve">{BULLET_PREFIX}{{}}</w:t></w:r></w:p>'
+)
+
+# Skip the LLM bullet rewrite when this share of JD keywords already appears
+REWRITE_SKIP_COVERAGE = 0.6
+
+# Text fragments shared by every build (joined once per call, never rebuilt)
+CONTACT_SEP = " | "
+INLINE_SEP = "  |  "
+LIST_SEP = ", "
+COURSEWORK_PREFIX = "Relevant Coursework: "
+
+# Skills listed per category line (and on the catch-all "Other" line)
+SKILLS_PER_CATEGORY = 20
+OTHER_SKILLS_LIMIT = 15
+FALLBACK_CONTACT = "email@domain.com | (555) 123-4567 | linkedin.com/in/name | City, State"
 
 async def generate_resume(
     output_path: str,
@@ -120,29 +190,12 @@ async def generate_resume(
     # OPTIMIZED: Run condensation and parallel data preparation simultaneously!
     # This saves 2-5 seconds by running them in parallel instead of sequentially
     
-    # Create new document first (no async needed)
-    document = Document()
+    # SMART CONDENSATION: Only condense if the content won't fit the page
+    # budget — skips a full LLM round trip for already-compact resumes
+    should_condense = bool(resume_data) and _estimate_paragraphs(resume_data) > MAX_PARAGRAPHS
     
-    # Set page size (C3 or Letter - Letter is bigger for more content)
-    if USE_LETTER_SIZE:
-        _set_letter_page_size(document)
-    else:
-        _set_c3_page_size(document)
-    
-    # Set margins
-    _set_margins(document)
-    
-    # SMART CONDENSATION: Only condense if content is actually too large
-    # Skip condensation if resume is already compact (saves 1-2 seconds!)
-    should_condense = False
-    if resume_data:
-        total_bullets = sum(len(exp.bullets) for exp in resume_data.experience)
-        # Only condense if:
-        # - More than 4 experiences, OR
-        # - More than 20 total bullets, OR
-        # - More than 4 projects
-        if len(resume_data.experience) > 4 or total_bullets > 20 or len(resume_data.projects) > 4:
-            should_condense = True
+    # Set once the parallel prep has already rewritten experiences/projects
+    personalized = False
     
     # Run condensation and parallel data preparation in parallel (if both enabled)
     if resume_data:
@@ -198,6 +251,7 @@ async def generate_resume(
                         prioritized_experiences, personalized_projects = results[i]
                         resume_data.experience = prioritized_experiences
                         resume_data.projects = personalized_projects
+                        personalized = True
                     elif task_type == "prepare" and isinstance(results[i], Exception):
                         print(f"Parallel LLM processing error: {results[i]}. Using original data.")
             except Exception as e:
@@ -216,23 +270,168 @@ async def generate_resume(
                     )
                 resume_data.experience = prioritized_experiences
                 resume_data.projects = personalized_projects
+                personalized = True
             except Exception as e:
                 print(f"Parallel LLM processing error: {e}. Using sequential processing.")
     
-    # Build resume sections (with more content now)
-    _build_header(document, resume_data)
-    _build_education(document, resume_data)
-    _build_skills(document, resume_data, keywords)
-    # Build sections (data already prepared in parallel above if enabled)
-    _build_experience(document, resume_data, keywords, job_description)
-    _build_projects(document, resume_data, keywords, job_description)
-    _build_certifications(document, resume_data)
+    # Build resume sections against a shared 1-page paragraph budget —
+    # once it runs out, later sections are skipped
+    budget = _Budget(MAX_PARAGRAPHS)
+    body = _Body()
+    if resume_data is None:
+        # No parsed resume: placeholder header + JD keywords as skills
+        _build_fallback_header(body, budget)
+        _build_skills(body, {}, keywords, budget)
+    else:
+        # Prioritize most relevant experiences
+        if job_description and len(resume_data.experience) > 4:
+            experiences = match_experience_with_jd(resume_data.experience, job_description, top_n=4)
+        else:
+            experiences = resume_data.experience[:5]
+        projects = resume_data.projects[:4]
+        
+        # PERSONALIZE using LLM if JD available and the parallel prep didn't
+        # already — one batched request instead of one per section. The
+        # sections that don't depend on it are built on a worker thread
+        # while the request is in flight.
+        if job_description and keywords and not personalized:
+            (experiences, projects), _ = await asyncio.gather(
+                _personalize_sections(experiences, projects, job_description, keywords),
+                asyncio.to_thread(_build_leading_sections, body, resume_data, keywords, budget),
+            )
+        else:
+            _build_leading_sections(body, resume_data, keywords, budget)
+        
+        _build_experience(body, experiences, budget)
+        _build_projects(body, projects, budget)
+        _build_certifications(body, resume_data, budget)
     
-    # Enforce 1-page limit (smarter enforcement)
-    _enforce_one_page_smart(document)
+    # Splice the built paragraphs into a pooled template document and save
+    document = _acquire_document()
+    inserted = []
+    try:
+        inserted = body.write_to(document)
+        _save_document(document, output_file)
+    finally:
+        _release_document(document, inserted)
+
+
+async def _personalize_sections(
+    experiences: List[Experience],
+    projects: List[Project],
+    job_description: str,
+    keywords: List[str]
+) -> Tuple[List[Experience], List[Project]]:
+    """
+    Return copies of the experiences/projects with LLM-rewritten text.
     
-    # Save document
-    document.save(str(output_file))
+    Experiences whose bullets already cover REWRITE_SKIP_COVERAGE of the
+    keywords are left out of the request and kept as-is.
+    """
+    pending = [
+        i for i, exp in enumerate(experiences)
+        if _keyword_coverage(exp.bullets, keywords) < REWRITE_SKIP_COVERAGE
+    ]
+    new_bullets, new_descriptions = await rewrite_all_sections_async(
+        [experiences[i] for i in pending], projects, job_description, keywords
+    )
+    
+    experiences = list(experiences)
+    for n, i in enumerate(pending):
+        if n in new_bullets:
+            experiences[i] = experiences[i].model_copy(update={"bullets": new_bullets[n]})
+    projects = [
+        project.model_copy(update={"description": new_descriptions[i]}) if i in new_descriptions else project
+        for i, project in enumerate(projects)
+    ]
+    return experiences, projects
+
+
+def _estimate_paragraphs(resume_data: ResumeData) -> int:
+    """Paragraphs the builders would emit for this resume, before any trimming."""
+    skills = resume_data.skills
+    sections = (
+        (resume_data.education, lambda edu: 1 + bool(edu.university or edu.location) + bool(edu.coursework)),
+        (resume_data.experience, lambda exp: 1 + bool(exp.company) + min(len(exp.bullets), 6)),
+        (resume_data.projects, lambda project: 1 + len(split_sentences(project.description, limit=3))),
+        (resume_data.certifications, lambda cert: 1),
+    )
+    total = 2 + 1 + (len(skills) if isinstance(skills, dict) else 1)  # header + skills
+    for items, lines in sections:
+        if items:
+            total += 1 + sum(lines(item) for item in items)
+    return total
+
+
+class _Budget:
+    """Paragraphs still allowed on the page; builders stop emitting at zero."""
+    __slots__ = ("remaining",)
+
+    def __init__(self, remaining: int) -> None:
+        self.remaining = remaining
+
+    def take(self) -> bool:
+        """Claim one paragraph; False once the page is full."""
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
+
+
+class _Body:
+    """
+    Paragraph XML for one resume, parsed and spliced into the document in
+    one lxml operation instead of a python-docx add_paragraph() per line.
+    """
+    __slots__ = ("paragraphs",)
+
+    def __init__(self) -> None:
+        self.paragraphs: List[str] = []
+
+    def add_paragraph(self, *runs: str, ppr: str = "") -> None:
+        """Append a paragraph of _run() strings with optional pPr children."""
+        if ppr:
+            ppr = f"<w:pPr>{ppr}</w:pPr>"
+        self.paragraphs.append(f"<w:p>{ppr}{''.join(runs)}</w:p>")
+
+    def write_to(self, document: Document) -> list:
+        """Insert every paragraph ahead of the body's section properties; return them."""
+        paragraphs = list(parse_xml(f"<w:body {nsdecls('w')}>{''.join(self.paragraphs)}</w:body>"))
+        body = document.element.body
+        sect_pr = body.sectPr
+        index = body.index(sect_pr) if sect_pr is not None else len(body)
+        body[index:index] = paragraphs
+        return paragraphs
+
+
+def _run(text: str, rpr: str = "") -> str:
+    """A run's XML: escaped text plus an optional prebuilt ``<w:rPr>``."""
+    return f'<w:r>{rpr}<w:t xml:space="preserve">{xml_escape(text)}</w:t></w:r>'
+
+
+def _save_document(document: Document, output_file: Path) -> None:
+    """Write the DOCX by cloning the cached skeleton parts and splicing in the body."""
+    buffer = io.BytesIO()
+    if len(document.part.rels) != _SKELETON_REL_COUNT:
+        # Body references parts the skeleton doesn't have (images, links...)
+        document.save(buffer)
+    else:
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, data in _SKELETON_PARTS:
+                if name == _DOCUMENT_PART_NAME:
+                    data = document.part.blob
+                archive.writestr(name, data)
+
+    # Zip in memory, then one write and an atomic rename: a download never
+    # sees a half-written file
+    fd, tmp_name = tempfile.mkstemp(dir=output_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(buffer.getbuffer())
+        os.replace(tmp_name, output_file)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
 
 
 def _set_c3_page_size(document: Document) -> None:
@@ -260,7 +459,80 @@ def _set_margins(document: Document) -> None:
     section.right_margin = MARGIN_RIGHT
 
 
-def _build_header(document: Document, resume_data: Optional[ResumeData]) -> None:
+# ═══════════════════════════════════════════════════════════════
+# DOCX package skeleton
+# ═══════════════════════════════════════════════════════════════
+# Every generated resume shares the same package parts (styles, theme,
+# settings, fonts...) — only word/document.xml differs. Load the template
+# and apply page setup once at import; each request opens a clone of the
+# cached bytes, and on save only the body part is re-serialized instead
+# of letting python-docx re-zip ~800KB of static XML.
+_DOCUMENT_PART_NAME = "word/document.xml"
+
+
+def _load_template() -> Tuple[bytes, List[Tuple[str, bytes]], int]:
+    """
+    Return the page-configured template as DOCX bytes, its ``(name, bytes)``
+    parts, and the body part's relationship count.
+    """
+    template = Document(str(TEMPLATE_PATH)) if TEMPLATE_PATH.exists() else Document()
+    if USE_LETTER_SIZE:
+        _set_letter_page_size(template)
+    else:
+        _set_c3_page_size(template)
+    _set_margins(template)
+    # Runs inherit font + body size from Normal; only headings/contact override
+    normal = template.styles["Normal"]
+    normal.font.name = FONT_NAME
+    normal.font.size = FONT_SIZE_BODY
+    # ...and zero paragraph spacing, so only paragraphs that need a gap
+    # carry their own <w:spacing>
+    normal.paragraph_format.space_before = Pt(0)
+    normal.paragraph_format.space_after = Pt(0)
+    
+    buffer = io.BytesIO()
+    template.save(buffer)
+    with zipfile.ZipFile(buffer) as archive:
+        parts = [(name, archive.read(name)) for name in archive.namelist()]
+    return buffer.getvalue(), parts, len(template.part.rels)
+
+
+_TEMPLATE_BYTES, _SKELETON_PARTS, _SKELETON_REL_COUNT = _load_template()
+
+# Opened template documents, reused across requests instead of re-parsing
+# the template package each time. A document is only held between
+# _acquire_document() and _release_document() with no await in between, so
+# a plain list (atomic pop/append) is enough — no asyncio.Queue needed.
+DOCUMENT_POOL_SIZE = 8
+_DOCUMENT_POOL: List[Document] = []
+
+
+def _acquire_document() -> Document:
+    """Take a pristine template document from the pool, or open a new one."""
+    try:
+        return _DOCUMENT_POOL.pop()
+    except IndexError:
+        return Document(io.BytesIO(_TEMPLATE_BYTES))
+
+
+def _release_document(document: Document, inserted: list) -> None:
+    """Strip the paragraphs one build inserted and return the document to the pool."""
+    body = document.element.body
+    for paragraph in inserted:
+        body.remove(paragraph)
+    # Only pristine skeletons go back (same relationships as the template)
+    if len(document.part.rels) == _SKELETON_REL_COUNT and len(_DOCUMENT_POOL) < DOCUMENT_POOL_SIZE:
+        _DOCUMENT_POOL.append(document)
+
+
+def _build_leading_sections(body: _Body, resume_data: ResumeData, keywords: List[str], budget: _Budget) -> None:
+    """Header, education and skills — everything ahead of the LLM-rewritten sections."""
+    _build_header(body, resume_data, budget)
+    _build_education(body, resume_data, budget)
+    _build_skills(body, resume_data.skills, keywords, budget)
+
+
+def _build_header(body: _Body, resume_data: ResumeData, budget: _Budget) -> None:
     """
     Build ATS-compliant resume header.
     
@@ -270,54 +542,39 @@ def _build_header(document: Document, resume_data: Optional[ResumeData]) -> None
     - NO images, NO tables, NO text boxes
     - ALL content in main document body
     """
-    if resume_data:
-        # Name — 14pt, Bold, left-aligned (ATS: 14-16pt, plain text)
-        name_para = document.add_paragraph()
-        name_run = name_para.add_run(resume_data.name.upper())
-        name_run.font.name = FONT_NAME
-        name_run.font.size = FONT_SIZE_NAME
-        name_run.bold = True
-        name_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        _set_paragraph_spacing(name_para, before=0, after=2)
-        
-        # Contact info — ALL on ONE line separated by |
-        # ATS Critical: Workday/Taleo parse contact from a single line
-        contact_parts = []
-        if resume_data.email:
-            contact_parts.append(resume_data.email)
-        if resume_data.phone:
-            contact_parts.append(resume_data.phone)
-        if resume_data.linkedin:
-            linkedin_clean = resume_data.linkedin.replace("https://", "").replace("http://", "").rstrip("/")
-            contact_parts.append(linkedin_clean)
-        if resume_data.github:
-            github_clean = resume_data.github.replace("https://", "").replace("http://", "").rstrip("/")
-            contact_parts.append(github_clean)
-        if resume_data.location:
-            contact_parts.append(resume_data.location)
-        
-        if contact_parts:
-            contact_para = document.add_paragraph()
-            contact_run = contact_para.add_run(" | ".join(contact_parts))
-            contact_run.font.name = FONT_NAME
-            contact_run.font.size = FONT_SIZE_CONTACT
-            contact_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            _set_paragraph_spacing(contact_para, before=0, after=0)
-    else:
-        # Fallback header
-        name_para = document.add_paragraph()
-        name_run = name_para.add_run("YOUR NAME")
-        name_run.font.name = FONT_NAME
-        name_run.font.size = FONT_SIZE_NAME
-        name_run.bold = True
-        
-        contact_para = document.add_paragraph()
-        contact_run = contact_para.add_run("email@domain.com | (555) 123-4567 | linkedin.com/in/name | City, State")
-        contact_run.font.name = FONT_NAME
-        contact_run.font.size = FONT_SIZE_CONTACT
+    # Name — 14pt, Bold, left-aligned (ATS: 14-16pt, plain text)
+    budget.take()
+    body.add_paragraph(_run(resume_data.name.upper(), _RPR_NAME), ppr=_PPR_NAME)
+    
+    # Contact info — ALL on ONE line separated by |
+    # ATS Critical: Workday/Taleo parse contact from a single line
+    contact_parts = tuple(part for part in (
+        resume_data.email,
+        resume_data.phone,
+        _display_url(resume_data.linkedin),
+        _display_url(resume_data.github),
+        resume_data.location,
+    ) if part)
+    
+    if contact_parts and budget.take():
+        body.add_paragraph(_run(CONTACT_SEP.join(contact_parts), _RPR_CONTACT), ppr=_PPR_LEFT)
+
+
+def _build_fallback_header(body: _Body, budget: _Budget) -> None:
+    """Placeholder name + contact lines for when no resume was parsed."""
+    budget.remaining -= 2
+    body.add_paragraph(_run("YOUR NAME", _RPR_NAME))
+    body.add_paragraph(_run(FALLBACK_CONTACT, _RPR_CONTACT))
+
 
+def _display_url(url: Optional[str]) -> str:
+    """Drop the scheme and trailing slash from a profile URL for display."""
+    if not url:
+        return ""
+    return url.removeprefix("https://").removeprefix("http://").rstrip("/")
 
-def _build_education(document: Document, resume_data: Optional[ResumeData]) -> None:
+
+def _build_education(body: _Body, resume_data: ResumeData, budget: _Budget) -> None:
     """
     Build education section — ATS-standard format.
     
@@ -325,54 +582,41 @@ def _build_education(document: Document, resume_data: Optional[ResumeData]) -> N
       Degree Name in Major
       University Name, City, State | Graduation Month Year
     """
-    if not resume_data or not resume_data.education:
+    if not resume_data.education:
         return
     
-    _add_section_heading(document, "EDUCATION")
+    if not _add_section_heading(body, "EDUCATION", budget):
+        return
     
     for edu in resume_data.education:
         # Line 1: Degree (bold) — dates on same line
-        degree_para = document.add_paragraph()
-        degree_run = degree_para.add_run(edu.degree)
-        degree_run.font.name = FONT_NAME
-        degree_run.font.size = FONT_SIZE_BODY
-        degree_run.bold = True
+        if not budget.take():
+            return
+        degree_runs = [_run(edu.degree, _RPR_BOLD)]
         if edu.dates:
-            dates_run = degree_para.add_run(f"  |  {edu.dates}")
-            dates_run.font.name = FONT_NAME
-            dates_run.font.size = FONT_SIZE_BODY
-        _set_paragraph_spacing(degree_para, before=3, after=0)
+            degree_runs.append(_run(INLINE_SEP + edu.dates))
+        body.add_paragraph(*degree_runs, ppr=_PPR_ENTRY)
         
         # Line 2: University, Location (italic) + GPA
-        uni_parts = []
-        if edu.university:
-            uni_parts.append(edu.university)
-        if edu.location:
-            uni_parts.append(edu.location)
+        uni_parts = tuple(part for part in (edu.university, edu.location) if part)
         
-        if uni_parts:
-            uni_para = document.add_paragraph()
-            uni_run = uni_para.add_run(", ".join(uni_parts))
-            uni_run.font.name = FONT_NAME
-            uni_run.font.size = FONT_SIZE_BODY
-            uni_run.italic = True
+        if uni_parts and budget.take():
+            uni_runs = [_run(LIST_SEP.join(uni_parts), _RPR_ITALIC)]
             if edu.gpa:
-                gpa_run = uni_para.add_run(f"  |  GPA: {edu.gpa}")
-                gpa_run.font.name = FONT_NAME
-                gpa_run.font.size = FONT_SIZE_BODY
-            _set_paragraph_spacing(uni_para, before=0, after=0)
+                uni_runs.append(_run(f"{INLINE_SEP}GPA: {edu.gpa}"))
+            body.add_paragraph(*uni_runs)
         
         # Coursework (on one line, italic)
-        if edu.coursework:
-            cw_para = document.add_paragraph()
-            cw_run = cw_para.add_run("Relevant Coursework: " + ", ".join(edu.coursework[:8]))
-            cw_run.font.name = FONT_NAME
-            cw_run.font.size = FONT_SIZE_BODY
-            cw_run.italic = True
-            _set_paragraph_spacing(cw_para, before=0, after=0)
+        if edu.coursework and budget.take():
+            body.add_paragraph(_run(COURSEWORK_PREFIX + LIST_SEP.join(edu.coursework[:8]), _RPR_ITALIC))
 
 
-def _build_skills(document: Document, resume_data: Optional[ResumeData], keywords: List[str]) -> None:
+def _build_skills(
+    body: _Body,
+    skills: Dict[str, List[str]],
+    keywords: List[str],
+    budget: _Budget
+) -> None:
     """
     Build technical skills section — ATS-optimized.
     
@@ -382,16 +626,20 @@ def _build_skills(document: Document, resume_data: Optional[ResumeData], keyword
     
     Simple comma-separated lists are the most ATS-parseable format.
     """
-    _add_section_heading(document, "TECHNICAL SKILLS")
+    if not _add_section_heading(body, "TECHNICAL SKILLS", budget):
+        return
     
+    # Keyword additions are collected separately and merged into fresh
+    # lists below, so the caller's skill lists are never mutated
     categorized_skills = {}
+    added_skills = {}
     uncategorized = []
     
-    if resume_data and resume_data.skills:
-        if isinstance(resume_data.skills, dict):
-            categorized_skills = resume_data.skills.copy()
+    if skills:
+        if isinstance(skills, dict):
+            categorized_skills = skills
         else:
-            for skill in resume_data.skills:
+            for skill in skills:
                 skill_lower = str(skill).lower()
                 category = _categorize_skill(skill_lower)
                 if category:
@@ -399,23 +647,34 @@ def _build_skills(document: Document, resume_data: Optional[ResumeData], keyword
                 else:
                     uncategorized.append(skill)
     
-    # Inject missing keywords into appropriate categories
+    # Inject missing keywords into appropriate categories — normalized
+    # membership sets are built once per category, not once per keyword
+    present = {
+        category: {normalize_keyword(str(s)) for s in skill_list}
+        for category, skill_list in categorized_skills.items()
+    }
+    present_other = {normalize_keyword(str(s)) for s in uncategorized}
     for keyword in keywords:
         normalized_keyword = normalize_keyword(keyword)
-        keyword_lower = keyword.lower()
-        category = _categorize_skill(keyword_lower)
+        category = _categorize_skill(keyword)
         
         if category:
-            existing_skills = categorized_skills.get(category, [])
-            if normalized_keyword not in [normalize_keyword(str(s)) for s in existing_skills]:
-                categorized_skills.setdefault(category, []).append(keyword)
-        else:
-            if normalized_keyword not in [normalize_keyword(str(s)) for s in uncategorized]:
-                uncategorized.append(keyword)
-    
-    # Deduplicate
-    for category in categorized_skills:
-        categorized_skills[category] = deduplicate_preserve_order([str(s) for s in categorized_skills[category]])
+            seen = present.setdefault(category, set())
+            if normalized_keyword not in seen:
+                seen.add(normalized_keyword)
+                added_skills.setdefault(category, []).append(keyword)
+        elif normalized_keyword not in present_other:
+            present_other.add(normalized_keyword)
+            uncategorized.append(keyword)
+    
+    # Merge + deduplicate + cap — one new list per category, ready to join
+    categorized_skills = {
+        category: deduplicate_preserve_order(
+            map(str, chain(categorized_skills.get(category, ()), added_skills.get(category, ()))),
+            limit=SKILLS_PER_CATEGORY,
+        )
+        for category in {**categorized_skills, **added_skills}
+    }
     
     # Preferred category order (ATS-standard names)
     category_order = [
@@ -434,70 +693,56 @@ def _build_skills(document: Document, resume_data: Optional[ResumeData], keyword
     rendered = set()
     for category in category_order:
         if category in categorized_skills and categorized_skills[category] and category not in rendered:
-            skills_para = document.add_paragraph()
-            cat_run = skills_para.add_run(f"{category}: ")
-            cat_run.font.name = FONT_NAME
-            cat_run.font.size = FONT_SIZE_BODY
-            cat_run.bold = True
-            skills_run = skills_para.add_run(", ".join(categorized_skills[category][:20]))
-            skills_run.font.name = FONT_NAME
-            skills_run.font.size = FONT_SIZE_BODY
-            _set_paragraph_spacing(skills_para, before=0, after=0)
+            if not budget.take():
+                return
+            body.add_paragraph(
+                _run(f"{category}: ", _RPR_BOLD),
+                _run(LIST_SEP.join(categorized_skills[category])),
+            )
             rendered.add(category)
     
     # Remaining categories
     for category, skill_list in categorized_skills.items():
         if category not in rendered and skill_list:
-            skills_para = document.add_paragraph()
-            cat_run = skills_para.add_run(f"{category}: ")
-            cat_run.font.name = FONT_NAME
-            cat_run.font.size = FONT_SIZE_BODY
-            cat_run.bold = True
-            skills_run = skills_para.add_run(", ".join(skill_list[:20]))
-            skills_run.font.name = FONT_NAME
-            skills_run.font.size = FONT_SIZE_BODY
-            _set_paragraph_spacing(skills_para, before=0, after=0)
-    
-    if uncategorized:
-        skills_para = document.add_paragraph()
-        other_run = skills_para.add_run("Other: ")
-        other_run.font.name = FONT_NAME
-        other_run.font.size = FONT_SIZE_BODY
-        other_run.bold = True
-        skills_run = skills_para.add_run(", ".join(deduplicate_preserve_order([str(s) for s in uncategorized])[:15]))
-        skills_run.font.name = FONT_NAME
-        skills_run.font.size = FONT_SIZE_BODY
-        _set_paragraph_spacing(skills_para, before=0, after=0)
+            if not budget.take():
+                return
+            body.add_paragraph(_run(f"{category}: ", _RPR_BOLD), _run(LIST_SEP.join(skill_list)))
+    
+    if uncategorized and budget.take():
+        body.add_paragraph(
+            _run("Other: ", _RPR_BOLD),
+            _run(LIST_SEP.join(deduplicate_preserve_order(map(str, uncategorized), limit=OTHER_SKILLS_LIMIT))),
+        )
 
 
+# One precompiled alternation per category, checked in priority order —
+# a single C-level scan per category instead of ~10 Python substring tests
+_SKILL_CATEGORIES: Tuple[Tuple[str, re.Pattern], ...] = tuple(
+    (category, re.compile("|".join(re.escape(kw) for kw in kws)))
+    for category, kws in (
+        ("Programming Languages", ['python', 'java', 'sql', 'javascript', 'typescript', 'c++', 'go', 'rust', 'pyspark', 'scala', 'r']),
+        ("AI/ML & LLMs", ['tensorflow', 'pytorch', 'hugging', 'llm', 'gpt', 'bert', 'ml', 'ai', 'machine learning', 'deep learning', 'neural']),
+        ("Cloud Platforms", ['aws', 'azure', 'gcp', 'cloud', 'sagemaker', 'lambda', 'glue', 'ec2', 's3']),
+        ("Data Engineering", ['spark', 'databricks', 'kafka', 'etl', 'data engineering', 'airflow', 'flink']),
+        ("DevOps & MLOps", ['docker', 'kubernetes', 'terraform', 'ci/cd', 'devops', 'mlops', 'jenkins', 'gitlab']),
+        ("Databases & Storage", ['postgresql', 'mongodb', 'redis', 'mysql', 'database', 'storage', 'dynamodb', 'redshift']),
+        ("Frameworks & APIs", ['fastapi', 'django', 'flask', 'react', 'node', 'api', 'framework', 'express', 'spring']),
+        ("Monitoring & Analytics", ['datadog', 'new relic', 'splunk', 'monitoring', 'analytics', 'grafana', 'prometheus']),
+    )
+)
+
+
+@lru_cache(maxsize=2048)
 def _categorize_skill(skill: str) -> Optional[str]:
     """Categorize a skill based on keywords."""
     skill_lower = skill.lower()
-    if any(kw in skill_lower for kw in ['python', 'java', 'sql', 'javascript', 'typescript', 'c++', 'go', 'rust', 'pyspark', 'scala', 'r']):
-        return "Programming Languages"
-    elif any(kw in skill_lower for kw in ['tensorflow', 'pytorch', 'hugging', 'llm', 'gpt', 'bert', 'ml', 'ai', 'machine learning', 'deep learning', 'neural']):
-        return "AI/ML & LLMs"
-    elif any(kw in skill_lower for kw in ['aws', 'azure', 'gcp', 'cloud', 'sagemaker', 'lambda', 'glue', 'ec2', 's3']):
-        return "Cloud Platforms"
-    elif any(kw in skill_lower for kw in ['spark', 'databricks', 'kafka', 'etl', 'data engineering', 'airflow', 'flink']):
-        return "Data Engineering"
-    elif any(kw in skill_lower for kw in ['docker', 'kubernetes', 'terraform', 'ci/cd', 'devops', 'mlops', 'jenkins', 'gitlab']):
-        return "DevOps & MLOps"
-    elif any(kw in skill_lower for kw in ['postgresql', 'mongodb', 'redis', 'mysql', 'database', 'storage', 'dynamodb', 'redshift']):
-        return "Databases & Storage"
-    elif any(kw in skill_lower for kw in ['fastapi', 'django', 'flask', 'react', 'node', 'api', 'framework', 'express', 'spring']):
-        return "Frameworks & APIs"
-    elif any(kw in skill_lower for kw in ['datadog', 'new relic', 'splunk', 'monitoring', 'analytics', 'grafana', 'prometheus']):
-        return "Monitoring & Analytics"
+    for category, pattern in _SKILL_CATEGORIES:
+        if pattern.search(skill_lower):
+            return category
     return None
 
 
-def _build_experience(
-    document: Document,
-    resume_data: Optional[ResumeData],
-    keywords: List[str],
-    job_description: Optional[str]
-) -> None:
+def _build_experience(body: _Body, experiences: List[Experience], budget: _Budget) -> None:
     """
     Build work experience section — ATS-optimized.
     
@@ -507,65 +752,42 @@ def _build_experience(
       - Bullet point with action verb and result
       - 4-6 bullets per job
     """
-    if not resume_data or not resume_data.experience:
+    if not experiences:
         return
     
     # Section heading — ATS standard: "WORK EXPERIENCE"
-    _add_section_heading(document, "WORK EXPERIENCE")
-    
-    # Prioritize most relevant experiences
-    if job_description and len(resume_data.experience) > 4:
-        experiences = match_experience_with_jd(resume_data.experience, job_description, top_n=4)
-    else:
-        experiences = resume_data.experience[:5]
+    if not _add_section_heading(body, "WORK EXPERIENCE", budget):
+        return
     
     for exp in experiences:
         # Line 1: Job Title (bold) — right-aligned dates
-        title_para = document.add_paragraph()
-        title_run = title_para.add_run(exp.title)
-        title_run.font.name = FONT_NAME
-        title_run.font.size = FONT_SIZE_BODY
-        title_run.bold = True
+        if not budget.take():
+            return
+        title_runs = [_run(exp.title, _RPR_BOLD)]
         if exp.dates:
             # Add tab + dates on same line (ATS-parseable layout)
-            dates_run = title_para.add_run(f"  |  {exp.dates}")
-            dates_run.font.name = FONT_NAME
-            dates_run.font.size = FONT_SIZE_BODY
-        _set_paragraph_spacing(title_para, before=4, after=0)
+            title_runs.append(_run(INLINE_SEP + exp.dates))
+        body.add_paragraph(*title_runs, ppr=_PPR_JOB_TITLE)
         
         # Line 2: Company name (italic)
-        if exp.company:
-            company_para = document.add_paragraph()
-            company_run = company_para.add_run(exp.company)
-            company_run.font.name = FONT_NAME
-            company_run.font.size = FONT_SIZE_BODY
-            company_run.italic = True
-            _set_paragraph_spacing(company_para, before=0, after=1)
-        
-        # Bullet points — PERSONALIZE using LLM if JD available
-        if job_description and keywords:
-            personalized_bullets = rewrite_experience_bullets(exp, job_description, keywords)
-            bullets = personalized_bullets[:6]
-        else:
-            bullets = exp.bullets[:6]
+        if exp.company and budget.take():
+            body.add_paragraph(_run(exp.company, _RPR_ITALIC), ppr=_PPR_COMPANY)
         
-        for bullet in bullets:
-            # ATS-safe bullet: use simple dash or bullet character
-            bullet_para = document.add_paragraph()
-            bullet_run = bullet_para.add_run(f"- {bullet}")
-            bullet_run.font.name = FONT_NAME
-            bullet_run.font.size = FONT_SIZE_BULLET
-            _set_paragraph_spacing(bullet_para, before=0, after=0)
-            # Indent bullets
-            bullet_para.paragraph_format.left_indent = Inches(0.25)
-
-
-def _build_projects(
-    document: Document,
-    resume_data: Optional[ResumeData],
-    keywords: List[str],
-    job_description: Optional[str]
-) -> None:
+        # ATS-safe bullet: use simple dash or bullet character
+        if not _add_bullets(body, exp.bullets[:6], budget):
+            return
+
+
+def _keyword_coverage(bullets: List[str], keywords: List[str]) -> float:
+    """Fraction of keywords found (case-insensitive substring) in the bullets."""
+    if not bullets or not keywords:
+        return 0.0
+    corpus = " ".join(bullets).lower()
+    hits = sum(1 for keyword in keywords if keyword.lower() in corpus)
+    return hits / len(keywords)
+
+
+def _build_projects(body: _Body, projects: List[Project], budget: _Budget) -> None:
     """
     Build projects section — ATS-optimized.
     
@@ -573,87 +795,72 @@ def _build_projects(
       Project Name | Tech1, Tech2
       - Description bullet with impact
     """
-    if not resume_data or not resume_data.projects:
+    if not projects:
         return
     
-    _add_section_heading(document, "PROJECTS")
-    
-    projects = resume_data.projects[:4]
+    if not _add_section_heading(body, "PROJECTS", budget):
+        return
     
     for project in projects:
         # Project name (bold) + technologies
-        name_para = document.add_paragraph()
-        name_run = name_para.add_run(project.name)
-        name_run.font.name = FONT_NAME
-        name_run.font.size = FONT_SIZE_BODY
-        name_run.bold = True
-        
+        if not budget.take():
+            return
+        name_runs = [_run(project.name, _RPR_BOLD)]
         if project.technologies:
-            tech_run = name_para.add_run(f"  |  {', '.join(project.technologies[:10])}")
-            tech_run.font.name = FONT_NAME
-            tech_run.font.size = FONT_SIZE_BODY
-            tech_run.italic = True
-        _set_paragraph_spacing(name_para, before=3, after=0)
+            name_runs.append(_run(INLINE_SEP + LIST_SEP.join(project.technologies[:10]), _RPR_ITALIC))
+        body.add_paragraph(*name_runs, ppr=_PPR_ENTRY)
         
         # Description as bullet points
         if project.description:
-            description = project.description
-            if job_description and keywords:
-                try:
-                    description = rewrite_project_description(project, job_description, keywords)
-                except Exception:
-                    pass
-            
             # Split into sentences for bullet points
-            sentences = [s.strip() for s in description.replace('. ', '.\n').split('\n') if s.strip()]
-            for sentence in sentences[:3]:
-                bullet_para = document.add_paragraph()
-                clean = sentence.rstrip('.')
-                bullet_run = bullet_para.add_run(f"- {clean}.")
-                bullet_run.font.name = FONT_NAME
-                bullet_run.font.size = FONT_SIZE_BULLET
-                _set_paragraph_spacing(bullet_para, before=0, after=0)
-                bullet_para.paragraph_format.left_indent = Inches(0.25)
-
-
-def _build_certifications(document: Document, resume_data: Optional[ResumeData]) -> None:
+            if not _add_bullets(body, split_sentences(project.description, limit=3), budget):
+                return
+
+
+def _build_certifications(body: _Body, resume_data: ResumeData, budget: _Budget) -> None:
     """
     Build certifications section — ATS-standard.
     
     ATS FORMAT:
       Cert Name - Issuer (Year)
     """
-    if not resume_data or not resume_data.certifications:
+    if not resume_data.certifications:
         return
     
-    _add_section_heading(document, "CERTIFICATIONS")
+    if not _add_section_heading(body, "CERTIFICATIONS", budget):
+        return
     
     for cert in resume_data.certifications:
-        cert_para = document.add_paragraph()
+        if not budget.take():
+            return
         cert_text = cert.name
         if cert.issuer:
             cert_text += f" - {cert.issuer}"
         if cert.year:
             cert_text += f" ({cert.year})"
         
-        cert_run = cert_para.add_run(cert_text)
-        cert_run.font.name = FONT_NAME
-        cert_run.font.size = FONT_SIZE_BODY
-        _set_paragraph_spacing(cert_para, before=0, after=0)
+        body.add_paragraph(_run(cert_text))
 
 
-def _set_paragraph_spacing(para, before: int = 0, after: int = 2) -> None:
-    """Set paragraph spacing in points."""
-    from docx.shared import Pt as PtSpacing
-    pf = para.paragraph_format
-    pf.space_before = PtSpacing(before)
-    pf.space_after = PtSpacing(after)
+def _add_bullets(body: _Body, lines: List[str], budget: _Budget) -> bool:
+    """
+    Append indented, dash-prefixed bullet paragraphs.
+    
+    Returns False if the page budget cut the list short.
+    """
+    fits = lines[:max(budget.remaining, 0)]
+    budget.remaining -= len(fits)
+    body.paragraphs.extend(_BULLET_XML.format(xml_escape(line)) for line in fits)
+    return len(fits) == len(lines)
 
 
-def _add_section_heading(document: Document, heading_text: str) -> None:
+def _add_section_heading(body: _Body, heading_text: str, budget: _Budget) -> bool:
     """
     Add an ATS-standard section heading.
     
+    Returns False (adding nothing) when the page budget can't fit the
+    heading plus at least one line of content.
+    
     ATS RULES:
     - Use EXACT standard names: WORK EXPERIENCE, EDUCATION, TECHNICAL SKILLS
     - Bold, slightly larger than body (11pt)
@@ -661,63 +868,11 @@ def _add_section_heading(document: Document, heading_text: str) -> None:
     - Simple horizontal rule (not special characters)
     - NO fancy formatting, NO colors, NO icons
     """
-    # Section heading — 11pt, Bold, UPPERCASE
-    heading_para = document.add_paragraph()
-    heading_run = heading_para.add_run(heading_text.upper())
-    heading_run.font.name = FONT_NAME
-    heading_run.font.size = FONT_SIZE_SECTION
-    heading_run.bold = True
-    heading_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    _set_paragraph_spacing(heading_para, before=6, after=2)
-    
-    # Simple horizontal line via paragraph border (ATS-safe)
-    from docx.oxml.ns import qn
-    from docx.oxml import OxmlElement
-    pPr = heading_para._element.get_or_add_pPr()
-    pBdr = OxmlElement('w:pBdr')
-    bottom = OxmlElement('w:bottom')
-    bottom.set(qn('w:val'), 'single')
-    bottom.set(qn('w:sz'), '6')
-    bottom.set(qn('w:space'), '1')
-    bottom.set(qn('w:color'), '333333')
-    pBdr.append(bottom)
-    pPr.append(pBdr)
-
-
-def _enforce_one_page_smart(document: Document) -> None:
-    """
-    Smarter 1-page enforcement that preserves maximum content.
-    
-    Uses better heuristics and only removes content if absolutely necessary.
-    """
-    # Count paragraphs
-    total_paragraphs = len(document.paragraphs)
-    
-    # With Letter size and optimized formatting, we can fit more
-    # Letter (8.5x11): ~60-70 paragraphs
-    # C3 (7.17x10.51): ~50-60 paragraphs
-    if USE_LETTER_SIZE:
-        max_paragraphs = 65  # Increased for Letter size
-    else:
-        max_paragraphs = 55  # Increased for C3
-    
-    if total_paragraphs > max_paragraphs:
-        # Only remove if significantly over
-        excess = total_paragraphs - max_paragraphs
-        if excess > 5:  # Only remove if more than 5 paragraphs over
-            # Remove excess paragraphs (usually spacing or less critical content)
-            paragraphs_to_remove = min(excess, 10)  # Don't remove more than 10
-            for _ in range(paragraphs_to_remove):
-                if len(document.paragraphs) > 15:  # Keep at least header and core content
-                    # Remove last paragraph (usually spacing)
-                    last_para = document.paragraphs[-1]
-                    p_element = last_para._element
-                    p_element.getparent().remove(p_element)
-    
-    # If still too long, slightly reduce font sizes (minimal impact)
-    if len(document.paragraphs) > max_paragraphs + 5:
-        # Reduce body font size slightly (only if really needed)
-        for para in document.paragraphs[5:]:  # Skip header
-            for run in para.runs:
-                if run.font.size and run.font.size > Pt(9):
-                    run.font.size = Pt(9)  # Slight reduction
+    if budget.remaining < 2:
+        return False
+    budget.take()
+    
+    # Section heading — 11pt, Bold, UPPERCASE, with a simple horizontal
+    # line via paragraph border (ATS-safe)
+    body.add_paragraph(_run(heading_text.upper(), _RPR_SECTION), ppr=_PPR_HEADING)
+    return True
@@ -35,17 +35,19 @@ ATS Rules Enforced:
   ✓ Dates in "Month YYYY" format
 """
 
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+import re
 import subprocess
 import shutil
+import tempfile
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..models import ResumeData, Experience, Project, Education, Certification
-from ..llm.client import (
-    rewrite_experience_bullets,
-    rewrite_project_description,
-    match_experience_with_jd,
-)
+from ..utils import split_sentences
+from ..llm.client import rewrite_all_sections, match_experience_with_jd
 
 
 from ..config import BASE_DIR, OUTPUT_DIR
@@ -54,40 +56,38 @@ from ..config import BASE_DIR, OUTPUT_DIR
 # LaTeX character escaping
 # ═══════════════════════════════════════════════════════════════
 
-def escape_latex(text: str) -> str:
-    """Escape special LaTeX characters safely.
+# Every special character and its LaTeX form, applied in one regex pass.
+# Replacements are never rescanned, so commands containing {} (like
+# \\textbackslash{}) cannot be double-escaped.
+_LATEX_ESCAPES = {
+    '\\': r'\textbackslash{}',
+    '^': r'\textasciicircum{}',
+    '~': r'\textasciitilde{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    # Common Unicode chars that ATS may choke on
+    '\u2192': r'$\rightarrow$',   # →
+    '\u2014': '---',              # —
+    '\u2013': '--',               # –
+    '\u2018': "'",                # '
+    '\u2019': "'",                # '
+    '\u201c': "``",               # "
+    '\u201d': "''",               # "
+    '\u2022': r'\textbullet{}',   # •
+}
+_LATEX_ESCAPE_RE = re.compile("[" + "".join(re.escape(char) for char in _LATEX_ESCAPES) + "]")
 
-    Uses a placeholder strategy so that commands containing {}
-    (like \\textbackslash{}) are not double-escaped.
-    """
+
+def escape_latex(text: str) -> str:
+    """Escape special LaTeX characters safely, in a single scan of the text."""
     if not text:
         return ""
-    # Step 1 — replace chars whose LaTeX commands contain {} with placeholders
-    text = text.replace('\\', '\x00BACKSLASH\x00')
-    text = text.replace('^', '\x00CARET\x00')
-    text = text.replace('~', '\x00TILDE\x00')
-    # Step 2 — escape the rest (including braces)
-    text = text.replace('&', r'\&')
-    text = text.replace('%', r'\%')
-    text = text.replace('$', r'\$')
-    text = text.replace('#', r'\#')
-    text = text.replace('_', r'\_')
-    text = text.replace('{', r'\{')
-    text = text.replace('}', r'\}')
-    # Step 3 — restore placeholders with proper LaTeX commands
-    text = text.replace('\x00BACKSLASH\x00', r'\textbackslash{}')
-    text = text.replace('\x00CARET\x00', r'\textasciicircum{}')
-    text = text.replace('\x00TILDE\x00', r'\textasciitilde{}')
-    # Replace common Unicode chars that ATS may choke on
-    text = text.replace('\u2192', r'$\rightarrow$')   # →
-    text = text.replace('\u2014', '---')                # —
-    text = text.replace('\u2013', '--')                 # –
-    text = text.replace('\u2018', "'")                  # '
-    text = text.replace('\u2019', "'")                  # '
-    text = text.replace('\u201c', "``")                 # "
-    text = text.replace('\u201d', "''")                 # "
-    text = text.replace('\u2022', r'\textbullet{}')     # •
-    return text
+    return _LATEX_ESCAPE_RE.sub(lambda m: _LATEX_ESCAPES[m.group(0)], text)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -114,19 +114,94 @@ def generate_resume_latex(
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Build the full LaTeX document string
-    latex = _build_document(resume_data, keywords, job_description)
+    # Build the full LaTeX source, encoded once for both hashing and writing
+    source = _build_document(resume_data, keywords, job_description).encode('utf-8')
 
-    # Write .tex
+    # Identical source → identical PDF: reuse a previous compile if we have one
+    pdf_file = output_file.with_suffix('.pdf')
+    cached_pdf = PDF_CACHE_DIR / f"{hashlib.blake2b(source, digest_size=16).hexdigest()}.pdf"
+    if _copy_cached_pdf(cached_pdf, pdf_file):
+        return str(pdf_file)
+
+    # Write .tex in one call (only the compiler reads it)
     tex_file = output_file.with_suffix('.tex')
-    with open(tex_file, 'w', encoding='utf-8') as fh:
-        fh.write(latex)
+    tex_file.write_bytes(source)
 
     # Compile .tex → .pdf
-    pdf_file = _compile_latex(tex_file, output_file.with_suffix('.pdf'))
+    pdf_file = _compile_latex(tex_file, pdf_file)
+    _store_cached_pdf(pdf_file, cached_pdf)
     return str(pdf_file)
 
 
+def generate_resumes_latex_batch(
+    jobs: List[Tuple[str, List[str], Optional[ResumeData], Optional[str]]],
+    max_workers: Optional[int] = None,
+) -> List[str]:
+    """Generate several LaTeX resumes concurrently.
+
+    Each LaTeX compile is a separate engine process dominated by startup
+    cost, so running them side by side on a thread pool amortizes that
+    wait across the batch instead of paying it serially.
+
+    Args:
+        jobs: ``(output_path, keywords, resume_data, job_description)`` tuples.
+        max_workers: Concurrent compiles (defaults to the CPU count).
+
+    Returns:
+        Paths of the generated PDF files, in the same order as ``jobs``.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return list(pool.map(lambda job: generate_resume_latex(*job), jobs))
+
+
+# ═══════════════════════════════════════════════════════════════
+# Preamble
+# ═══════════════════════════════════════════════════════════════
+
+# Fixed for every resume (10pt, Letter), so it is assembled once at import
+# rather than appended line by line on each build.
+FONT_SIZE = "10pt"
+
+_PREAMBLE = "\n".join([
+    f"\\documentclass[{FONT_SIZE},letterpaper]{{article}}",
+    "",
+    "% ── Packages",
+    "\\usepackage[utf8]{inputenc}",
+    "\\usepackage[T1]{fontenc}",
+    "\\usepackage{helvet}",
+    "\\renewcommand{\\familydefault}{\\sfdefault}",
+    "\\usepackage[letterpaper, margin=0.5in, top=0.4in, bottom=0.4in]{geometry}",
+    "\\usepackage{hyperref}",
+    "\\usepackage{enumitem}",
+    "\\usepackage{titlesec}",
+    "\\usepackage{xcolor}",
+    "",
+    "% ── Page style",
+    "\\pagestyle{empty}",
+    "",
+    "% ── Colors",
+    "\\definecolor{linkblue}{HTML}{0563BB}",
+    "\\definecolor{ruleline}{HTML}{333333}",
+    "",
+    "% ── Hyperlinks",
+    "\\hypersetup{colorlinks=true, urlcolor=linkblue, linkcolor=linkblue, pdfborder={0 0 0}}",
+    "",
+    "% ── Section headings",
+    "\\titleformat{\\section}{\\vspace{-6pt}\\large\\bfseries\\scshape}{}{0em}{}",
+    "    [\\vspace{-6pt}\\color{ruleline}\\titlerule\\vspace{-4pt}]",
+    "\\titlespacing{\\section}{0pt}{8pt}{4pt}",
+    "",
+    "% ── Compact lists",
+    "\\setlist[itemize]{leftmargin=0.15in, topsep=1pt, parsep=0pt, partopsep=0pt, itemsep=1pt, label=\\textbullet}",
+    "",
+    "% ── Spacing",
+    "\\setlength{\\parskip}{0pt}",
+    "\\setlength{\\parindent}{0pt}",
+    "\\setlength{\\tabcolsep}{0pt}",
+    "",
+])
+
+
 # ═══════════════════════════════════════════════════════════════
 # Document builder
 # ═══════════════════════════════════════════════════════════════
@@ -138,47 +213,8 @@ def _build_document(
 ) -> str:
     """Assemble the complete LaTeX source."""
 
-    # Decide font size: try 10pt, fall back note for compiler
-    font_size = "10pt"
-
     # ---------- Preamble ----------
-    lines: List[str] = []
-    lines.append(f"\\documentclass[{font_size},letterpaper]{{article}}")
-    lines.append("")
-    lines.append("% ── Packages")
-    lines.append("\\usepackage[utf8]{inputenc}")
-    lines.append("\\usepackage[T1]{fontenc}")
-    lines.append("\\usepackage{helvet}")
-    lines.append("\\renewcommand{\\familydefault}{\\sfdefault}")
-    lines.append("\\usepackage[letterpaper, margin=0.5in, top=0.4in, bottom=0.4in]{geometry}")
-    lines.append("\\usepackage{hyperref}")
-    lines.append("\\usepackage{enumitem}")
-    lines.append("\\usepackage{titlesec}")
-    lines.append("\\usepackage{xcolor}")
-    lines.append("")
-    lines.append("% ── Page style")
-    lines.append("\\pagestyle{empty}")
-    lines.append("")
-    lines.append("% ── Colors")
-    lines.append("\\definecolor{linkblue}{HTML}{0563BB}")
-    lines.append("\\definecolor{ruleline}{HTML}{333333}")
-    lines.append("")
-    lines.append("% ── Hyperlinks")
-    lines.append("\\hypersetup{colorlinks=true, urlcolor=linkblue, linkcolor=linkblue, pdfborder={0 0 0}}")
-    lines.append("")
-    lines.append("% ── Section headings")
-    lines.append("\\titleformat{\\section}{\\vspace{-6pt}\\large\\bfseries\\scshape}{}{0em}{}")
-    lines.append("    [\\vspace{-6pt}\\color{ruleline}\\titlerule\\vspace{-4pt}]")
-    lines.append("\\titlespacing{\\section}{0pt}{8pt}{4pt}")
-    lines.append("")
-    lines.append("% ── Compact lists")
-    lines.append("\\setlist[itemize]{leftmargin=0.15in, topsep=1pt, parsep=0pt, partopsep=0pt, itemsep=1pt, label=\\textbullet}")
-    lines.append("")
-    lines.append("% ── Spacing")
-    lines.append("\\setlength{\\parskip}{0pt}")
-    lines.append("\\setlength{\\parindent}{0pt}")
-    lines.append("\\setlength{\\tabcolsep}{0pt}")
-    lines.append("")
+    lines: List[str] = [_PREAMBLE]
 
     # ---------- Begin document ----------
     lines.append("\\begin{document}")
@@ -193,9 +229,13 @@ def _build_document(
         lines.append(_section_placeholder("Technical Skills", keywords))
         lines.append(_section_placeholder("Certifications", keywords))
     else:
+        experiences = _select_experiences(resume_data.experience, job_description)
+        projects = resume_data.projects[:4]  # max 4 projects
+        bullets, descriptions = _rewrite_sections(experiences, projects, keywords, job_description)
+
         lines.append(_build_header(resume_data))
-        lines.append(_build_experience(resume_data, keywords, job_description))
-        lines.append(_build_projects(resume_data, keywords, job_description))
+        lines.append(_build_experience(experiences, bullets))
+        lines.append(_build_projects(projects, descriptions))
         lines.append(_build_education(resume_data))
         lines.append(_build_skills(resume_data, keywords))
         lines.append(_build_certifications(resume_data))
@@ -229,12 +269,12 @@ def _build_header(data: ResumeData) -> str:
 
     if data.linkedin:
         url = data.linkedin if data.linkedin.startswith("http") else f"https://{data.linkedin}"
-        display = data.linkedin.replace("https://", "").replace("http://", "").rstrip("/")
+        display = data.linkedin.removeprefix("https://").removeprefix("http://").rstrip("/")
         parts.append(f"\\href{{{escape_latex(url)}}}{{{escape_latex(display)}}}")
 
     if data.github:
         url = data.github if data.github.startswith("http") else f"https://{data.github}"
-        display = data.github.replace("https://", "").replace("http://", "").rstrip("/")
+        display = data.github.removeprefix("https://").removeprefix("http://").rstrip("/")
         parts.append(f"\\href{{{escape_latex(url)}}}{{{escape_latex(display)}}}")
 
     contact_line = " \\enspace\\textbar\\enspace ".join(parts)
@@ -253,26 +293,42 @@ def _build_header(data: ResumeData) -> str:
 # Experience Section
 # ═══════════════════════════════════════════════════════════════
 
-def _build_experience(
-    data: ResumeData,
+def _select_experiences(experiences: List[Experience], job_description: Optional[str]) -> List[Experience]:
+    """Up to four experiences, prioritized by relevance when a JD is available."""
+    if job_description and len(experiences) > 3:
+        try:
+            return match_experience_with_jd(experiences, job_description, top_n=4)
+        except Exception:
+            pass
+    return experiences[:4]
+
+
+def _rewrite_sections(
+    experiences: List[Experience],
+    projects: List[Project],
     keywords: List[str],
     job_description: Optional[str],
-) -> str:
-    if not data.experience:
+) -> Tuple[Dict[int, List[str]], Dict[int, str]]:
+    """
+    Rewrite every experience and project for the JD in one batched LLM call.
+
+    Returns (bullets, descriptions) keyed by position; empty when there is
+    nothing to tailor or the rewrite fails, so the originals are used.
+    """
+    if not (job_description and keywords):
+        return {}, {}
+    try:
+        return rewrite_all_sections(experiences, projects, job_description, keywords)
+    except Exception:
+        return {}, {}  # keep original content
+
+
+def _build_experience(experiences: List[Experience], rewritten: Dict[int, List[str]]) -> str:
+    if not experiences:
         return ""
 
     lines = ["\\section{Work Experience}", ""]
 
-    # Prioritize relevant experiences if JD available
-    experiences = data.experience
-    if job_description and len(experiences) > 3:
-        try:
-            experiences = match_experience_with_jd(experiences, job_description, top_n=4)
-        except Exception:
-            experiences = experiences[:4]
-    else:
-        experiences = experiences[:4]
-
     for i, exp in enumerate(experiences):
         title = escape_latex(exp.title)
         company = escape_latex(exp.company)
@@ -282,13 +338,8 @@ def _build_experience(
         lines.append(f"\\textit{{{company}}}")
         lines.append("")
 
-        # Get bullets — optionally rewrite for JD
-        bullets = exp.bullets
-        if job_description and keywords:
-            try:
-                bullets = rewrite_experience_bullets(exp, job_description, keywords)
-            except Exception:
-                pass  # keep original bullets
+        # Bullets rewritten for the JD when available
+        bullets = rewritten.get(i, exp.bullets)
 
         if bullets:
             lines.append("\\begin{itemize}")
@@ -308,16 +359,11 @@ def _build_experience(
 # Projects Section
 # ═══════════════════════════════════════════════════════════════
 
-def _build_projects(
-    data: ResumeData,
-    keywords: List[str],
-    job_description: Optional[str],
-) -> str:
-    if not data.projects:
+def _build_projects(projects: List[Project], rewritten: Dict[int, str]) -> str:
+    if not projects:
         return ""
 
     lines = ["\\section{Projects}", ""]
-    projects = data.projects[:4]  # max 4 projects
 
     for i, proj in enumerate(projects):
         name = escape_latex(proj.name)
@@ -333,20 +379,13 @@ def _build_projects(
         lines.append("")
 
         # Description bullets
-        description = proj.description
-        if job_description and keywords:
-            try:
-                description = rewrite_project_description(proj, job_description, keywords)
-            except Exception:
-                pass
+        description = rewritten.get(i, proj.description)
 
         if description:
             # Split description into bullet-able sentences
-            sentences = [s.strip() for s in description.replace(". ", ".\n").split("\n") if s.strip()]
             lines.append("\\begin{itemize}")
-            for sent in sentences[:3]:  # max 3 bullets per project
-                clean = sent.rstrip(".")
-                lines.append(f"    \\item {escape_latex(clean)}.")
+            for sent in split_sentences(description, limit=3):  # max 3 bullets per project
+                lines.append(f"    \\item {escape_latex(sent)}")
             lines.append("\\end{itemize}")
 
         if i < len(projects) - 1:
@@ -405,25 +444,51 @@ def _build_education(data: ResumeData) -> str:
 # Technical Skills Section
 # ═══════════════════════════════════════════════════════════════
 
+# Preferred category order
+SKILL_CATEGORY_ORDER = (
+    "Languages", "Programming Languages",
+    "Backend", "Frameworks & APIs", "Frameworks",
+    "Frontend",
+    "Cloud", "Cloud Platforms",
+    "Databases", "Databases & Storage",
+    "AI/ML", "AI/ML & LLMs",
+    "DevOps", "DevOps & MLOps",
+    "Tools",
+    "Monitoring & Analytics",
+)
+
+# Known category labels are constants, so escape them once at import
+_ESCAPED_CATEGORY_LABELS = {label: escape_latex(label) for label in SKILL_CATEGORY_ORDER}
+
+
+def _category_label(cat_name: str) -> str:
+    """Escaped label for a skills category."""
+    label = _ESCAPED_CATEGORY_LABELS.get(cat_name)
+    return label if label is not None else escape_latex(cat_name)
+
+
 def _build_skills(data: ResumeData, keywords: List[str]) -> str:
-    skills = dict(data.skills) if data.skills else {}
+    # Copy the lists too — keywords are appended below and must not leak
+    # into the caller's ResumeData
+    skills = {cat: list(skill_list) for cat, skill_list in data.skills.items()} if data.skills else {}
 
-    # Collect all existing skills (lowercase) across every category to avoid duplicates
-    # Store both exact names AND the lowercase version for substring matching
-    all_existing_lower: List[str] = []
-    for skill_list in skills.values():
-        for s in skill_list:
-            all_existing_lower.append(s.lower())
+    # All existing skills (lowercase) across every category, to avoid duplicates:
+    # a set for exact hits plus one newline-joined corpus so "keyword inside an
+    # existing skill" is a single C-level substring scan
+    existing_lower = [s.lower() for skill_list in skills.values() for s in skill_list]
+    existing_set = set(existing_lower)
+    existing_corpus = "\n".join(existing_lower)
 
     def _skill_already_present(keyword: str) -> bool:
         """Check if a keyword is already covered by an existing skill.
         Handles cases like keyword='AWS' matching skill='AWS (Lambda, S3)'.
         """
         kl = keyword.lower()
-        for existing in all_existing_lower:
-            if kl == existing or kl in existing or existing in kl:
-                return True
-        return False
+        return (
+            kl in existing_set
+            or kl in existing_corpus
+            or any(existing in kl for existing in existing_lower)
+        )
 
     # Inject missing keywords into appropriate categories
     for kw in keywords:
@@ -431,43 +496,31 @@ def _build_skills(data: ResumeData, keywords: List[str]) -> str:
             continue  # already present in some category
         cat = _categorize_skill(kw)
         if cat:
-            if cat not in skills:
-                skills[cat] = []
-            skills[cat].append(kw)
-            all_existing_lower.append(kw.lower())
+            skills.setdefault(cat, []).append(kw)
+            kl = kw.lower()
+            existing_lower.append(kl)
+            existing_set.add(kl)
+            existing_corpus += "\n" + kl
 
     if not skills:
         return ""
 
     lines = ["\\section{Technical Skills}", ""]
 
-    # Preferred category order
-    preferred_order = [
-        "Languages", "Programming Languages",
-        "Backend", "Frameworks & APIs", "Frameworks",
-        "Frontend",
-        "Cloud", "Cloud Platforms",
-        "Databases", "Databases & Storage",
-        "AI/ML", "AI/ML & LLMs",
-        "DevOps", "DevOps & MLOps",
-        "Tools",
-        "Monitoring & Analytics",
-    ]
-
     rendered = set()
     skill_lines = []
 
-    for cat_name in preferred_order:
+    for cat_name in SKILL_CATEGORY_ORDER:
         if cat_name in skills and cat_name not in rendered:
             skill_text = ", ".join(escape_latex(s) for s in skills[cat_name])
-            skill_lines.append(f"\\textbf{{{escape_latex(cat_name)}:}} {skill_text}")
+            skill_lines.append(f"\\textbf{{{_category_label(cat_name)}:}} {skill_text}")
             rendered.add(cat_name)
 
     # Any remaining categories
     for cat_name, skill_list in skills.items():
         if cat_name not in rendered and skill_list:
             skill_text = ", ".join(escape_latex(s) for s in skill_list)
-            skill_lines.append(f"\\textbf{{{escape_latex(cat_name)}:}} {skill_text}")
+            skill_lines.append(f"\\textbf{{{_category_label(cat_name)}:}} {skill_text}")
 
     lines.append("\\\\".join(skill_lines))
     lines.append("")
@@ -565,43 +618,89 @@ def _categorize_skill(skill: str) -> Optional[str]:
 
 
 # ═══════════════════════════════════════════════════════════════
-# LaTeX Compilation
+# Compiled PDF cache
 # ═══════════════════════════════════════════════════════════════
 
-def _compile_latex(tex_file: Path, pdf_file: Path) -> Path:
-    """Compile .tex → .pdf using the first available LaTeX engine."""
+# Compiled PDFs keyed by a hash of the .tex source. Kept in a subdirectory
+# so the output cleanup task (top-level files only) leaves it alone; the
+# least recently used entries beyond PDF_CACHE_MAX_FILES are evicted.
+PDF_CACHE_DIR = OUTPUT_DIR / ".pdf_cache"
+PDF_CACHE_MAX_FILES = 200
+
+
+def _copy_cached_pdf(cached_pdf: Path, pdf_file: Path) -> bool:
+    """Copy a cached PDF to ``pdf_file``; False on a cache miss."""
+    try:
+        shutil.copyfile(cached_pdf, pdf_file)
+        os.utime(cached_pdf)  # mark as recently used
+    except OSError:
+        return False
+    return True
 
-    engines = ['pdflatex', 'xelatex', 'lualatex']
-    out_dir = str(pdf_file.parent)
 
-    for engine in engines:
-        if not shutil.which(engine):
-            continue  # engine not installed
+def _store_cached_pdf(pdf_file: Path, cached_pdf: Path) -> None:
+    """Add a freshly compiled PDF to the cache and evict the oldest entries (best-effort)."""
+    try:
+        PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # A unique temp name per writer: batch jobs run in threads of one
+        # process, and two of them may store the same source at once
+        fd, tmp_name = tempfile.mkstemp(dir=PDF_CACHE_DIR, suffix=".tmp")
         try:
-            result = subprocess.run(
-                [engine, '-interaction=nonstopmode', '-output-directory', out_dir, str(tex_file)],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode == 0:
-                # Clean up aux files
-                for ext in ['.aux', '.log', '.out']:
-                    aux = tex_file.with_suffix(ext)
-                    if aux.exists():
-                        aux.unlink()
-                return pdf_file
-        except (subprocess.TimeoutExpired, OSError):
-            continue
-
-    # If we get here, no engine succeeded
-    available = [e for e in engines if shutil.which(e)]
-    if not available:
+            with os.fdopen(fd, "wb") as out, open(pdf_file, "rb") as src:
+                shutil.copyfileobj(src, out)
+            os.replace(tmp_name, cached_pdf)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+        entries = sorted(PDF_CACHE_DIR.glob("*.pdf"), key=lambda f: f.stat().st_mtime, reverse=True)
+        for stale in entries[PDF_CACHE_MAX_FILES:]:
+            stale.unlink()
+    except OSError:
+        pass
+
+
+# ═══════════════════════════════════════════════════════════════
+# LaTeX Compilation
+# ═══════════════════════════════════════════════════════════════
+
+# First installed engine, resolved once at import instead of probing PATH
+# for every compile
+LATEX_ENGINE = next(
+    (engine for engine in ('pdflatex', 'xelatex', 'lualatex') if shutil.which(engine)),
+    None,
+)
+
+
+def _compile_latex(tex_file: Path, pdf_file: Path) -> Path:
+    """Compile .tex → .pdf using the installed LaTeX engine."""
+    if LATEX_ENGINE is None:
         raise RuntimeError(
             "No LaTeX engine found.  Install TeX Live (macOS: brew install --cask mactex-no-gui) "
             "or MiKTeX (Windows).  The .tex file has been generated and can be compiled manually."
         )
-    raise RuntimeError(
-        f"LaTeX compilation failed with engines: {', '.join(available)}.  "
-        "Check the .log file next to the .tex for details."
-    )
+
+    try:
+        # The engine's transcript goes to the .log file anyway — don't buffer
+        # its console copy in memory
+        result = subprocess.run(
+            [LATEX_ENGINE, '-interaction=nonstopmode', '-output-directory', str(pdf_file.parent), str(tex_file)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30,
+        )
+    except (subprocess.TimeoutExpired, OSError) as e:
+        raise RuntimeError(f"LaTeX compilation with {LATEX_ENGINE} failed: {e}") from e
+
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"LaTeX compilation failed with {LATEX_ENGINE}.  "
+            "Check the .log file next to the .tex for details."
+        )
+
+    # Clean up aux files (the .log is kept only on failure)
+    for ext in ['.aux', '.log', '.out']:
+        aux = tex_file.with_suffix(ext)
+        if aux.exists():
+            aux.unlink()
+    return pdf_file
@@ -10,11 +10,18 @@ This module parses resumes to extract:
 - Certifications
 """
 
+import os
 import re
+import threading
+import zipfile
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from docx import Document
+from lxml import etree
 
 from ..models import (
     ResumeData,
@@ -24,6 +31,7 @@ from ..models import (
     Certification,
 )
 from ..logger import logger
+from .cache import cache_parsed_resume
 
 # Try to import LLM parser, fallback if not available
 try:
@@ -36,9 +44,139 @@ except ImportError:
 from .pdf_extractor import extract_text_from_pdf as _smart_pdf_extract, extract_pdf_links
 
 
+# ═══════════════════════════════════════════════════════════
+# Compiled patterns (built once at import, reused for every parse)
+# ═══════════════════════════════════════════════════════════
+
+_SECTION_PATTERNS = {
+    "experience": re.compile(r"^(?:work\s+)?experience|^employment|^professional\s+experience|^relevant\s+experience", re.IGNORECASE),
+    "education": re.compile(r"^education", re.IGNORECASE),
+    "skills": re.compile(r"^(?:technical\s+)?skills?$", re.IGNORECASE),
+    "projects": re.compile(r"^(?:personal\s+|academic\s+|side\s+|key\s+|selected\s+|relevant\s+|notable\s+)?projects?(?:\s*(?:&|and)\s*\w+)?$", re.IGNORECASE),
+    "certifications": re.compile(r"^certifications?|^licenses?\s*(?:&|and)?\s*certifications?", re.IGNORECASE),
+    "summary": re.compile(r"^(?:professional\s+)?summary|^objective|^profile", re.IGNORECASE),
+}
+
+# Line classification
+_SECTION_LABEL_RE = re.compile(
+    r'^(?:work\s+)?experience$|^education$|^(?:technical\s+)?skills?$|'
+    r'^(?:personal\s+|academic\s+|key\s+|selected\s+)?projects?(?:\s*(?:&|and)\s*\w+)?$|'
+    r'^certifications?$|^(?:professional\s+)?summary$|^objective$',
+    re.IGNORECASE,
+)
+_CONTACT_EMAIL_RE = re.compile(r'[\w.-]+@[\w.-]+\.\w+')
+_CONTACT_PHONE_RE = re.compile(r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}')
+_SKILL_LINE_RE = re.compile(r'^[\w\s/&]+:\s*\w+.*,\s*\w+')
+_EDUCATION_KEYWORDS_RE = re.compile(r'(?:bachelor|master|b\.?s\.?|m\.?s\.?|ph\.?d|associate|diploma|degree|university|college|institute)', re.IGNORECASE)
+_CERT_KEYWORDS_RE = re.compile(r'(?:certified|certification|certificate|license|credential|aws\s+solutions|google\s+cloud|azure|pmp|comptia|cisco)', re.IGNORECASE)
+_ANY_DATE_RE = re.compile(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\.?\s+\d{4}|Present|Current|\d{4}\s*[-–—]\s*(?:\d{4}|Present)', re.IGNORECASE)
+_PROJECT_PIPE_LINE_RE = re.compile(r'^[A-Z][\w\s&\'-]+\s*\|\s*')
+_PROJECT_DASH_LINE_RE = re.compile(r'^[A-Z][\w\s&\'-]+\s*[—–]\s*')
+
+# Bullets
+_BULLET_RE = re.compile(r'^[•\-\*◦▪►]')
+_BULLET_SPACE_RE = re.compile(r'^[•\-\*◦▪►]\s+')
+_BULLET_TEXT_RE = re.compile(r'^[•\-\*◦▪►]\s*(.*)')
+_BULLET_PREFIX_RE = re.compile(r'^[•\-\*◦▪►]\s*')
+
+# Contact information
+_NAME_PHONE_RE = re.compile(r'\d{3}.*\d{4}')
+_NAME_EXCLUDED_WORDS = ("email", "phone", "resume", "http")
+_EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+_PHONE_RES = (
+    re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
+    re.compile(r'\+?1[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
+)
+_LINKEDIN_RE = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'(?:https?://)?(?:www\.)?github\.com/[\w-]+', re.IGNORECASE)
+_LOCATION_STATE_CODE_RE = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})\b')
+_LOCATION_STATE_NAME_RE = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)')
+
+# Experience
+_MONTH_RANGE_RE = re.compile(
+    r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\.?\s+\d{4})\s*[-–—]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\.?\s+\d{4}|Present|Current)',
+    re.IGNORECASE,
+)
+_DATE_LINE_RES = (
+    # "May 2024 - Aug 2024", "Jan 2020 – Present"
+    _MONTH_RANGE_RE,
+    # "08/2023 - 05/2025", "2023 - Present"
+    re.compile(r'(\d{1,2}/\d{4})\s*[-–—]\s*(\d{1,2}/\d{4}|Present|Current)', re.IGNORECASE),
+    re.compile(r'(\d{4})\s*[-–—]\s*(\d{4}|Present|Current)', re.IGNORECASE),
+)
+_COMPANY_LOCATION_RE = re.compile(r'^([A-Z][\w\s&.\'-]+?)(?:\s*,\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),?\s*([A-Z]{2})?)?\s*$')
+_TITLE_SKILL_LINE_RE = re.compile(r'^[\w\s/&]+:\s*\w+.*,')
+_TITLE_KEYWORDS_RE = re.compile(r'(?:engineer|developer|intern|analyst|manager|lead|architect|consultant|assistant|associate|specialist|coordinator|director|designer|scientist|administrator|technician|researcher|fellow)', re.IGNORECASE)
+# "Title [|,] Company [|,spaces] Date"
+_EXP_TITLE_COMPANY_DATE_RE = re.compile(r'^([A-Z][\w\s/&-]+?)\s*[,]\s*([A-Z][\w\s&.\'-]+?)(?:\s{2,}|\s*[,]\s*|\s+)((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[\w\s–\-]+(?:Present|\d{4}))?\s*$')
+# "Title, Company, Location, Date"
+_EXP_TITLE_COMPANY_LOCATION_DATE_RE = re.compile(
+    r'^([A-Z][\w\s/&-]+?)\s*,\s*([A-Z][\w\s&.\'-]+?)\s*,\s*(?:[A-Z][\w\s]+,\s*[A-Z]{2}\s*,?\s*)?((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[\w\s–\-]+(?:Present|\d{4}))\s*$',
+    re.IGNORECASE,
+)
+# "Title at/@ Company"
+_EXP_TITLE_AT_COMPANY_RE = re.compile(r'^([A-Z][\w\s/&-]+?)\s+(?:at|@)\s+([A-Z][\w\s&.\'-]+)')
+# "Company, City, ST  |  Date"
+_EXP_COMPANY_DATE_RE = re.compile(
+    r'^([A-Z][\w\s&.\'-]+?)\s*(?:,\s*[A-Z][\w\s]+(?:,\s*[A-Z]{2})?)?\s*[|]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec).*)',
+    re.IGNORECASE,
+)
+_EXP_ENTRY_START_RE = re.compile(r'^[A-Z][\w\s/&-]+?\s*[|,@]')
+
+# Education
+_DEGREE_WORD_RE = re.compile(
+    r"\b(Master'?s?|Bachelor'?s?|PhD|Ph\.D\.?|Doctorate|Associate'?s?|MBA)"
+    r"(?:\s+(?:of|in|degree\s+in))?\s*(.*)",
+    re.IGNORECASE,
+)
+_DEGREE_ABBREV_RE = re.compile(
+    r"^\s*(B\.S\.?|M\.S\.?|B\.A\.?|M\.A\.?|B\.Tech\.?|M\.Tech\.?|B\.E\.?|M\.E\.?)"
+    r"(?:\s+(?:in|of))?\s*(.*)",
+    re.IGNORECASE,
+)
+_UNIVERSITY_RE = re.compile(r'(?:university|college|institute|school|academy|polytechnic|JNTU|IIT|NIT|MIT|Stanford|Harvard|Georgia\s+Tech)', re.IGNORECASE)
+_DASH_SPLIT_RE = re.compile(r'\s*[—–]\s*')
+_PAREN_YEAR_RE = re.compile(r'\((\d{4})\)')
+_TRAILING_LOCATION_RE = re.compile(r',\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),?\s*([A-Z]{2})?\s*$')
+_YEAR_RANGE_RE = re.compile(r'(\d{4})\s*[-–—]\s*(\d{4}|Present)')
+_YEAR_ONLY_RE = re.compile(r'^\d{4}$')
+_GPA_RE = re.compile(r'GPA[:\s]+([\d.]+)', re.IGNORECASE)
+_COURSEWORK_LABEL_RE = re.compile(r'(?:coursework|courses)\s*:?\s*', re.IGNORECASE)
+_COURSEWORK_SPLIT_RE = re.compile(r'[,;•]')
+
+# Skills
+_SKILL_CATEGORY_SPLIT_RE = re.compile(r'(?:\s*[•|]\s+|\s{3,})(?=[A-Z][\w/&\s]+?:\s)')
+_SKILL_CATEGORY_RE = re.compile(r'^([A-Z][\w/&\s]+?):\s*(.*)')
+# Item delimiters are single characters: fold them onto "," and str.split
+_SKILL_ITEM_DELIMS = str.maketrans({";": ","})
+_SKILL_UNLABELED_DELIMS = str.maketrans({";": ",", "|": ","})
+
+# Projects
+_PROJECT_DASH_HEADER_RE = re.compile(r'^([A-Z][\w\s&\'-]+?)(?:\s*[—–|-]\s*(.+))?$')
+_PROJECT_PIPE_HEADER_RE = re.compile(r'^([A-Z][\w\s&\'-]+?)\s*\|\s*(.+)$')
+_PROJECT_PLAIN_HEADER_RE = re.compile(r'^([A-Z][\w\s&\'-]+?)(?:\s*\(([^)]+)\))?$')
+_PROJECT_URL_RE = re.compile(r'\(?([a-z][\w.-]+\.[a-z]{2,})\)?')
+_PROJECT_TECH_PREFIX_RE = re.compile(r'(?:using|with|built\s+with|tech(?:nologies)?:?)\s+(.+)', re.IGNORECASE)
+_PROJECT_TECH_SPLIT_RE = re.compile(r'[,;+]')
+_PROJECT_INLINE_TECH_RE = re.compile(r'(?:using|with|built\s+with|technologies?:?|powered\s+by)\s+([^.]+?)(?:\.|$)', re.IGNORECASE)
+
+# Certifications
+_CERT_YEAR_RE = re.compile(r'\(?(\d{4})\)?')
+_CERT_SPLIT_RE = re.compile(r'\s*[|–—]\s*')
+_VIEW_CREDENTIAL_RE = re.compile(r'\s*\|?\s*View\s+Credential.*', re.IGNORECASE)
+
+
+# Parsed resumes by file content (LRU). Only complete parses are stored, so
+# a sparse result from a failed LLM escalation is retried on re-upload.
+PARSED_CACHE_SIZE = 256
+_parsed_cache: "OrderedDict[str, ResumeData]" = OrderedDict()
+_parsed_cache_lock = threading.Lock()
+
+
 def parse_resume(file_path: str) -> ResumeData:
     """
     Parse a resume file (PDF, DOCX, or TXT) and extract structured data.
+    Results are cached by file content, so re-uploading the same file is free.
     
     Args:
         file_path: Path to the resume file (PDF, DOCX, or TXT)
@@ -51,6 +189,35 @@ def parse_resume(file_path: str) -> ResumeData:
     if not path.exists():
         raise FileNotFoundError(f"Resume file not found: {file_path}")
     
+    # Byte-identical re-uploads skip extraction and parsing entirely. Callers
+    # may mutate the result, so the cache holds (and hands out) copies.
+    cache_key = cache_parsed_resume(path.read_bytes(), path.suffix.lower())
+    with _parsed_cache_lock:
+        cached = _parsed_cache.get(cache_key)
+        if cached is not None:
+            _parsed_cache.move_to_end(cache_key)
+    if cached is not None:
+        logger.info("Parsed resume cache hit for %s", path.name)
+        return cached.model_copy(deep=True)
+
+    result, complete = _parse_resume_file(path)
+    if complete:
+        with _parsed_cache_lock:
+            _parsed_cache[cache_key] = result.model_copy(deep=True)
+            _parsed_cache.move_to_end(cache_key)
+            if len(_parsed_cache) > PARSED_CACHE_SIZE:
+                _parsed_cache.popitem(last=False)
+    return result
+
+
+def _parse_resume_file(path: Path) -> Tuple[ResumeData, bool]:
+    """
+    Extract text from a resume file and parse it (uncached).
+
+    Returns the parsed data and whether the parse was complete (see
+    _parse_text_checked).
+    """
+    file_path = str(path)
     pdf_links: dict = {}
 
     if path.suffix.lower() == '.pdf':
@@ -64,7 +231,7 @@ def parse_resume(file_path: str) -> ResumeData:
         raise ValueError(f"Unsupported file format: {path.suffix}. Supported: PDF, DOCX, TXT.")
     
     logger.info("Extracted %d chars from %s", len(text), path.name)
-    result = _parse_text(text)
+    result, complete = _parse_text_checked(text)
 
     # Enrich with PDF hyperlinks if the text only had labels (e.g., "LinkedIn", "GitHub")
     if pdf_links:
@@ -73,7 +240,30 @@ def parse_resume(file_path: str) -> ResumeData:
         if pdf_links.get("github") and (not result.github or result.github == "GitHub"):
             result.github = pdf_links["github"]
 
-    return result
+    return result, complete
+
+
+def parse_resumes(file_paths: List[str], max_workers: Optional[int] = None) -> List[ResumeData]:
+    """
+    Parse several resume files in parallel worker processes.
+
+    Text extraction and regex parsing are CPU-bound pure Python that holds
+    the GIL, so files are spread across processes rather than threads.
+
+    Args:
+        file_paths: Paths to resume files (PDF, DOCX, or TXT)
+        max_workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        List[ResumeData]: Parsed resumes, in the same order as ``file_paths``
+    """
+    if len(file_paths) <= 1:
+        return [parse_resume(path) for path in file_paths]
+    workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+    # Hand each worker a few files per task to amortize pickling overhead
+    chunksize = max(1, len(file_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(parse_resume, file_paths, chunksize=chunksize))
 
 
 def parse_resume_from_text(text: str) -> ResumeData:
@@ -92,6 +282,11 @@ def parse_resume_from_text(text: str) -> ResumeData:
 
 
 def _parse_text(text: str) -> ResumeData:
+    """Parse resume text with the hybrid regex/LLM parser (see _parse_text_checked)."""
+    return _parse_text_checked(text)[0]
+
+
+def _parse_text_checked(text: str) -> Tuple[ResumeData, bool]:
     """
     Smart hybrid parser — regex first (free + instant), LLM only when needed.
 
@@ -100,6 +295,10 @@ def _parse_text(text: str) -> ResumeData:
       2. If result looks complete (has name + experience + skills), return it
       3. If result is sparse/incomplete, escalate to LLM for better extraction
     This saves LLM quota for the rewriting step where it matters most.
+
+    The flag is True for a complete regex parse or a successful LLM parse,
+    and False when a sparse regex result is returned because the LLM was
+    unavailable or failed.
     """
     # Step 1: Try regex parser first (always free)
     regex_result = _parse_text_to_resume_data(text)
@@ -121,24 +320,24 @@ def _parse_text(text: str) -> ResumeData:
             quality_score, regex_result.name, len(regex_result.experience),
             len(regex_result.projects), sum(len(v) for v in regex_result.skills.values()),
         )
-        return regex_result
+        return regex_result, True
 
     # Step 3: Regex result is sparse — use LLM for better extraction
     if LLM_PARSER_AVAILABLE:
         try:
-            llm_result = parse_resume_with_llm(text)
+            llm_result = parse_resume_with_llm(text, fallback=False)
             logger.info(
                 "LLM parser used (regex quality=%d/4): %s, %d exp, %d projects",
                 quality_score, llm_result.name, len(llm_result.experience),
                 len(llm_result.projects),
             )
-            return llm_result
+            return llm_result, True
         except Exception as e:
             logger.warning("LLM parser failed: %s — using regex result", e)
-            return regex_result
+            return regex_result, False
     else:
         logger.info("LLM parser not available, using regex result (quality=%d/4)", quality_score)
-        return regex_result
+        return regex_result, False
 
 
 def _extract_text_from_txt(file_path: str) -> str:
@@ -147,8 +346,91 @@ def _extract_text_from_txt(file_path: str) -> str:
     return path.read_text(encoding="utf-8", errors="replace")
 
 
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_XML_PARSER = etree.XMLParser(resolve_entities=False)
+# Text equivalents of run content, as in python-docx's Run.text
+_DOCX_RUN_TEXT = {f"{_W}tab": "\t", f"{_W}ptab": "\t", f"{_W}cr": "\n", f"{_W}noBreakHyphen": "-"}
+
+
 def _extract_text_from_docx(file_path: str) -> str:
-    """Extract text from DOCX file."""
+    """
+    Extract text from DOCX file.
+
+    Reads word/document.xml straight out of the zip instead of building the
+    python-docx object model; the output matches _extract_text_from_docx_document
+    (body paragraphs, then one " | "-joined line per table row).
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            root = etree.fromstring(archive.read("word/document.xml"), _DOCX_XML_PARSER)
+    except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError):
+        return _extract_text_from_docx_document(file_path)
+
+    body = root.find(f"{_W}body")
+    if body is None:
+        return ""
+    text_parts = [text for text in map(_docx_paragraph_text, body.iterchildren(f"{_W}p")) if text.strip()]
+
+    # Also extract text from tables
+    for table in body.iterchildren(f"{_W}tbl"):
+        above: Dict[int, str] = {}  # grid column -> cell text, for vertical merges
+        for row in table.iterchildren(f"{_W}tr"):
+            cells: List[str] = []
+            row_cells: Dict[int, str] = {}
+            offset = _docx_int(row.find(f"{_W}trPr/{_W}gridBefore"), 0)
+            for tc in row.iterchildren(f"{_W}tc"):
+                span = _docx_int(tc.find(f"{_W}tcPr/{_W}gridSpan"), 1)
+                v_merge = tc.find(f"{_W}tcPr/{_W}vMerge")
+                if v_merge is not None and v_merge.get(f"{_W}val", "continue") == "continue":
+                    text = above.get(offset, "")
+                else:
+                    text = "\n".join(_docx_paragraph_text(p) for p in tc.iterchildren(f"{_W}p"))
+                cells.extend([text] * span)  # a spanning cell repeats, as in python-docx
+                row_cells[offset] = text
+                offset += span
+            above = row_cells
+            row_text = " | ".join([cell.strip() for cell in cells if cell.strip()])
+            if row_text:
+                text_parts.append(row_text)
+
+    return "\n".join(text_parts)
+
+
+def _docx_int(element, default: int) -> int:
+    """Integer w:val of an optional element."""
+    if element is None:
+        return default
+    try:
+        return int(element.get(f"{_W}val"))
+    except (TypeError, ValueError):
+        return default
+
+
+def _docx_run_text(run) -> str:
+    parts = []
+    for child in run:
+        if child.tag == f"{_W}t":
+            parts.append(child.text or "")
+        elif child.tag == f"{_W}br":
+            if child.get(f"{_W}type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(_DOCX_RUN_TEXT.get(child.tag, ""))
+    return "".join(parts)
+
+
+def _docx_paragraph_text(paragraph) -> str:
+    parts = []
+    for child in paragraph:
+        if child.tag == f"{_W}r":
+            parts.append(_docx_run_text(child))
+        elif child.tag == f"{_W}hyperlink":
+            parts.extend(_docx_run_text(run) for run in child.iterchildren(f"{_W}r"))
+    return "".join(parts)
+
+
+def _extract_text_from_docx_document(file_path: str) -> str:
+    """Extract text from DOCX file through python-docx (fallback)."""
     doc = Document(file_path)
     text_parts = []
     
@@ -171,33 +453,31 @@ def _find_section_boundaries(lines: List[str]) -> Dict[str, int]:
     Find the start line index of each major resume section.
     Returns a dict like {'experience': 5, 'education': 30, 'skills': 35, ...}
     """
-    section_patterns = {
-        "experience": r"^(?:work\s+)?experience|^employment|^professional\s+experience|^relevant\s+experience",
-        "education": r"^education",
-        "skills": r"^(?:technical\s+)?skills?$",
-        "projects": r"^(?:personal\s+|academic\s+|side\s+|key\s+|selected\s+|relevant\s+|notable\s+)?projects?(?:\s*(?:&|and)\s*\w+)?$",
-        "certifications": r"^certifications?|^licenses?\s*(?:&|and)?\s*certifications?",
-        "summary": r"^(?:professional\s+)?summary|^objective|^profile",
-    }
     boundaries: Dict[str, int] = {}
     for i, line in enumerate(lines):
         stripped = line.strip()
-        for section, pattern in section_patterns.items():
-            if section not in boundaries and re.search(pattern, stripped, re.IGNORECASE):
+        for section, pattern in _SECTION_PATTERNS.items():
+            if section not in boundaries and pattern.search(stripped):
                 boundaries[section] = i
+        if len(boundaries) == len(_SECTION_PATTERNS):
+            break  # every header found — nothing left to look for
     return boundaries
 
 
-def _get_section_lines(lines: List[str], boundaries: Dict[str, int], section: str) -> List[str]:
-    """Get all lines belonging to a section (from its header to the next section header)."""
-    if section not in boundaries:
-        return []
-    start = max(0, boundaries[section] + 1)  # skip the header/boundary line; clamp to 0
-    # Find the next section that starts after this one
+def _split_sections(lines: List[str], boundaries: Dict[str, int]) -> Dict[str, List[str]]:
+    """
+    Slice the lines belonging to every section in one go
+    (from each header to the next section header).
+    """
     all_starts = sorted(boundaries.values())
-    idx = all_starts.index(boundaries[section])
-    end = all_starts[idx + 1] if idx + 1 < len(all_starts) else len(lines)
-    return lines[start:end]
+    sections: Dict[str, List[str]] = {}
+    for section, boundary in boundaries.items():
+        start = max(0, boundary + 1)  # skip the header/boundary line; clamp to 0
+        # Find the next section that starts after this one
+        idx = bisect_left(all_starts, boundary)
+        end = all_starts[idx + 1] if idx + 1 < len(all_starts) else len(lines)
+        sections[section] = lines[start:end]
+    return sections
 
 
 def _classify_line(line: str) -> Optional[str]:
@@ -212,51 +492,38 @@ def _classify_line(line: str) -> Optional[str]:
         return None
 
     # ── Section headers (explicit labels like "EDUCATION", "WORK EXPERIENCE") ──
-    section_kw = re.match(
-        r'^(?:work\s+)?experience$|^education$|^(?:technical\s+)?skills?$|'
-        r'^(?:personal\s+|academic\s+|key\s+|selected\s+)?projects?(?:\s*(?:&|and)\s*\w+)?$|'
-        r'^certifications?$|^(?:professional\s+)?summary$|^objective$',
-        stripped, re.IGNORECASE,
-    )
-    if section_kw:
+    if _SECTION_LABEL_RE.match(stripped):
         return "section_header"
 
     # ── Contact line (email, phone, linkedin, url combos) ──
-    email_pat = re.search(r'[\w.-]+@[\w.-]+\.\w+', stripped)
-    phone_pat = re.search(r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}', stripped)
-    if email_pat or phone_pat:
+    if _CONTACT_EMAIL_RE.search(stripped) or _CONTACT_PHONE_RE.search(stripped):
         return "contact"
 
     # ── Bullet point ──
-    if re.match(r'^[•\-\*◦▪►]\s+', stripped):
+    if _BULLET_SPACE_RE.match(stripped):
         return "bullet"
 
     # ── Skill line ("Category: item1, item2, item3") ──
-    if re.match(r'^[\w\s/&]+:\s*\w+.*,\s*\w+', stripped):
+    if _SKILL_LINE_RE.match(stripped):
         return "skill"
 
     # ── Education-like ("degree ... university" or "university ... degree") ──
-    edu_keywords = r'(?:bachelor|master|b\.?s\.?|m\.?s\.?|ph\.?d|associate|diploma|degree|university|college|institute)'
-    if re.search(edu_keywords, stripped, re.IGNORECASE):
+    if _EDUCATION_KEYWORDS_RE.search(stripped):
         return "education"
 
     # ── Certification-like ("AWS Certified", "Google Cloud", etc.) ──
-    cert_keywords = r'(?:certified|certification|certificate|license|credential|aws\s+solutions|google\s+cloud|azure|pmp|comptia|cisco)'
-    if re.search(cert_keywords, stripped, re.IGNORECASE) and len(stripped.split()) <= 15:
+    if _CERT_KEYWORDS_RE.search(stripped) and len(stripped.split()) <= 15:
         return "certification"
 
     # ── Experience header (Title, Company, Date pattern) ──
-    date_pat = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\.?\s+\d{4}|Present|Current|\d{4}\s*[-–—]\s*(?:\d{4}|Present)'
-    if re.search(date_pat, stripped, re.IGNORECASE) and len(stripped.split()) <= 20:
-        # Could be experience or education — if it has a company-like pattern, it's experience
-        if re.search(r'[|,]\s*[A-Z]', stripped):
-            return "experience_header"
-        return "experience_header"  # default to experience for date lines
+    if _ANY_DATE_RE.search(stripped) and len(stripped.split()) <= 20:
+        # Could be experience or education — default to experience for date lines
+        return "experience_header"
 
     # ── Project header (Name | Tech or Name — description) ──
-    if re.match(r'^[A-Z][\w\s&\'-]+\s*\|\s*', stripped):
+    if _PROJECT_PIPE_LINE_RE.match(stripped):
         return "project_header"
-    if re.match(r'^[A-Z][\w\s&\'-]+\s*[—–]\s*', stripped) and len(stripped.split()) <= 15:
+    if _PROJECT_DASH_LINE_RE.match(stripped) and len(stripped.split()) <= 15:
         return "project_header"
 
     return None
@@ -270,7 +537,7 @@ def _smart_section_boundaries(lines: List[str], boundaries: Dict[str, int]) -> D
     lines looking for content that reveals the section type.
 
     Boundary convention: boundary points to the line BEFORE the first content
-    line, so _get_section_lines(start = boundary + 1) includes the content.
+    line, so _split_sections(start = boundary + 1) includes the content.
     When a real header exists, the header IS the boundary line.
     When no header exists, we use (first_content_line - 1) as a virtual boundary.
     """
@@ -309,8 +576,8 @@ def _smart_section_boundaries(lines: List[str], boundaries: Dict[str, int]) -> D
             if i > 0 and _classify_line(lines[i - 1]) == "section_header":
                 boundaries[section] = i - 1
             else:
-                # No header — set boundary to (i - 1) so _get_section_lines includes line i
-                # Use -1 if i == 0; _get_section_lines handles max(0, ...) via start calc
+                # No header — set boundary to (i - 1) so _split_sections includes line i
+                # Use -1 if i == 0; _split_sections handles max(0, ...) via start calc
                 boundaries[section] = i - 1
             assigned_starts.add(boundaries[section])
 
@@ -326,7 +593,7 @@ def _parse_text_to_resume_data(text: str) -> ResumeData:
       1. Header-based section detection (fast, exact)
       2. Content-based line classification (smart, fills gaps)
     """
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [line for line in map(str.strip, text.split('\n')) if line]
     full_text = '\n'.join(lines)
 
     # Pass 1: Find section boundaries by headers
@@ -344,25 +611,27 @@ def _parse_text_to_resume_data(text: str) -> ResumeData:
     location = _extract_location(full_text)
 
     # Extract sections using enhanced boundaries
-    education = _extract_education(lines, boundaries)
-    skills = _extract_skills(lines, boundaries)
-    experience = _extract_experience(lines, boundaries)
-    projects = _extract_projects(lines, boundaries)
-    certifications = _extract_certifications(lines, boundaries)
-
-    return ResumeData(
-        name=name or "Your Name",
-        email=email or "",
-        phone=phone or "",
-        linkedin=linkedin or "",
-        github=github or "",
-        location=location or "",
-        education=education,
-        skills=skills,
-        experience=experience,
-        projects=projects,
-        certifications=certifications,
-    )
+    sections = _split_sections(lines, boundaries)
+    education = _extract_education(sections.get("education", []))
+    skills = _extract_skills(sections.get("skills", []))
+    experience = _extract_experience(sections.get("experience", []))
+    projects = _extract_projects(sections.get("projects", []))
+    certifications = _extract_certifications(sections.get("certifications", []))
+
+    # Every field below is produced by this module, so skip re-validation
+    return ResumeData.from_trusted({
+        "name": name or "Your Name",
+        "email": email or "",
+        "phone": phone or "",
+        "linkedin": linkedin or "",
+        "github": github or "",
+        "location": location or "",
+        "education": education,
+        "skills": skills,
+        "experience": experience,
+        "projects": projects,
+        "certifications": certifications,
+    })
 
 
 # ═══════════════════════════════════════════════════════════
@@ -379,34 +648,32 @@ def _extract_name(lines: List[str], boundaries: Dict[str, int]) -> Optional[str]
 
     for line in lines[:min(first_section, 5)]:
         # Skip lines that look like contact info
-        if "@" in line or "linkedin" in line.lower() or "github" in line.lower():
+        line_lower = line.lower()
+        if "@" in line or "linkedin" in line_lower or "github" in line_lower:
             continue
-        if re.search(r'\d{3}.*\d{4}', line):  # phone number
+        if _NAME_PHONE_RE.search(line):  # phone number
             continue
         # Name: 2-4 words, no special characters except hyphens
         words = line.split()
         if 1 <= len(words) <= 5:
             # Remove pipe-separated contact info from the line
             clean = line.split("|")[0].strip()
-            if clean and not any(kw in clean.lower() for kw in ["email", "phone", "resume", "http"]):
+            clean_lower = clean.lower()
+            if clean and not any(kw in clean_lower for kw in _NAME_EXCLUDED_WORDS):
                 return clean
     return None
 
 
 def _extract_email(text: str) -> Optional[str]:
     """Extract email address using regex."""
-    match = re.search(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}', text)
+    match = _EMAIL_RE.search(text)
     return match.group(0) if match else None
 
 
 def _extract_phone(text: str) -> Optional[str]:
     """Extract phone number — handles many formats."""
-    patterns = [
-        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-        r'\+?1[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for pattern in _PHONE_RES:
+        match = pattern.search(text)
         if match:
             return match.group(0).strip()
     return None
@@ -414,7 +681,7 @@ def _extract_phone(text: str) -> Optional[str]:
 
 def _extract_linkedin(text: str) -> Optional[str]:
     """Extract LinkedIn profile URL."""
-    match = re.search(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+', text, re.IGNORECASE)
+    match = _LINKEDIN_RE.search(text)
     if match:
         url = match.group(0)
         return url if url.startswith("http") else f"https://{url}"
@@ -424,7 +691,7 @@ def _extract_linkedin(text: str) -> Optional[str]:
 
 def _extract_github(text: str) -> Optional[str]:
     """Extract GitHub profile URL."""
-    match = re.search(r'(?:https?://)?(?:www\.)?github\.com/[\w-]+', text, re.IGNORECASE)
+    match = _GITHUB_RE.search(text)
     if match:
         url = match.group(0)
         return url if url.startswith("http") else f"https://{url}"
@@ -434,11 +701,11 @@ def _extract_github(text: str) -> Optional[str]:
 def _extract_location(text: str) -> Optional[str]:
     """Extract location (City, State/Country)."""
     # Pattern: "City, ST" or "City, State"
-    match = re.search(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})\b', text)
+    match = _LOCATION_STATE_CODE_RE.search(text)
     if match:
         return match.group(0)
     # Broader: "City, State Name"
-    match = re.search(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', text)
+    match = _LOCATION_STATE_NAME_RE.search(text)
     if match:
         return match.group(0)
     return None
@@ -450,15 +717,8 @@ def _extract_location(text: str) -> Optional[str]:
 
 def _is_date_line(line: str) -> Optional[str]:
     """Check if a line is primarily a date range. Returns the date string or None."""
-    patterns = [
-        # "May 2024 - Aug 2024", "Jan 2020 – Present"
-        r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\.?\s+\d{4})\s*[-–—]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\.?\s+\d{4}|Present|Current)',
-        # "08/2023 - 05/2025", "2023 - Present"
-        r'(\d{1,2}/\d{4})\s*[-–—]\s*(\d{1,2}/\d{4}|Present|Current)',
-        r'(\d{4})\s*[-–—]\s*(\d{4}|Present|Current)',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, line, re.IGNORECASE)
+    for pattern in _DATE_LINE_RES:
+        match = pattern.search(line)
         if match:
             return match.group(0)
     return None
@@ -467,11 +727,8 @@ def _is_date_line(line: str) -> Optional[str]:
 def _is_company_location_line(line: str) -> Optional[str]:
     """Check if a line is a company + location (e.g., 'Oracle Corporation, Austin, TX')."""
     # Company, City, State  OR  Company Name, City, State Country
-    match = re.match(
-        r'^([A-Z][\w\s&.\'-]+?)(?:\s*,\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),?\s*([A-Z]{2})?)?\s*$',
-        line.strip()
-    )
-    if match and not re.match(r'^[•\-\*◦▪►]', line.strip()):
+    match = _COMPANY_LOCATION_RE.match(line.strip())
+    if match and not _BULLET_RE.match(line.strip()):
         return match.group(1).strip()
     return None
 
@@ -482,21 +739,20 @@ def _is_title_only_line(line: str) -> bool:
     if not stripped or len(stripped) < 5:
         return False
     # Skip bullets, dates, skill lines
-    if re.match(r'^[•\-\*◦▪►]', stripped):
+    if _BULLET_RE.match(stripped):
         return False
     if _is_date_line(stripped):
         return False
-    if re.match(r'^[\w\s/&]+:\s*\w+.*,', stripped):  # skill line
+    if _TITLE_SKILL_LINE_RE.match(stripped):  # skill line
         return False
     # Title-like: starts with capital, 2-8 words, common title keywords
     words = stripped.split()
     if not (2 <= len(words) <= 8):
         return False
-    title_keywords = r'(?:engineer|developer|intern|analyst|manager|lead|architect|consultant|assistant|associate|specialist|coordinator|director|designer|scientist|administrator|technician|researcher|fellow)'
-    return bool(re.search(title_keywords, stripped, re.IGNORECASE))
+    return bool(_TITLE_KEYWORDS_RE.search(stripped))
 
 
-def _extract_experience(lines: List[str], boundaries: Dict[str, int]) -> List[Experience]:
+def _extract_experience(section_lines: List[str]) -> List[Experience]:
     """
     Extract work experience with robust pattern matching.
 
@@ -508,7 +764,6 @@ def _extract_experience(lines: List[str], boundaries: Dict[str, int]) -> List[Ex
         May 2024 - Aug 2024
         - Built microservices handling 50M+ requests
     """
-    section_lines = _get_section_lines(lines, boundaries, "experience")
     if not section_lines:
         return []
 
@@ -526,7 +781,7 @@ def _extract_experience(lines: List[str], boundaries: Dict[str, int]) -> List[Ex
 
         # Format 0: Pipe-separated segments — "Title | Company | Location | Date"
         # Split by pipes and identify which segment is title/company/date/location
-        if '|' in line and not re.match(r'^[•\-\*◦▪►]', line):
+        if '|' in line and not _BULLET_RE.match(line):
             segments = [s.strip() for s in line.split('|') if s.strip()]
             if len(segments) >= 2:
                 seg_title = None
@@ -548,22 +803,13 @@ def _extract_experience(lines: List[str], boundaries: Dict[str, int]) -> List[Ex
             seg_title = seg_company = seg_dates = None
 
             # Format 1: "Title [|,] Company [|,spaces] Date"
-            title_match = re.match(
-                r'^([A-Z][\w\s/&-]+?)\s*[,]\s*([A-Z][\w\s&.\'-]+?)(?:\s{2,}|\s*[,]\s*|\s+)((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[\w\s–\-]+(?:Present|\d{4}))?\s*$',
-                line
-            )
+            title_match = _EXP_TITLE_COMPANY_DATE_RE.match(line)
             if not title_match:
                 # Format 2: "Title, Company, Location, Date"
-                title_match = re.match(
-                    r'^([A-Z][\w\s/&-]+?)\s*,\s*([A-Z][\w\s&.\'-]+?)\s*,\s*(?:[A-Z][\w\s]+,\s*[A-Z]{2}\s*,?\s*)?((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[\w\s–\-]+(?:Present|\d{4}))\s*$',
-                    line, re.IGNORECASE
-                )
+                title_match = _EXP_TITLE_COMPANY_LOCATION_DATE_RE.match(line)
             if not title_match:
                 # Format 3: "Title at/@ Company"
-                title_match = re.match(
-                    r'^([A-Z][\w\s/&-]+?)\s+(?:at|@)\s+([A-Z][\w\s&.\'-]+)',
-                    line
-                )
+                title_match = _EXP_TITLE_AT_COMPANY_RE.match(line)
 
             if title_match:
                 seg_title = title_match.group(1).strip()
@@ -612,10 +858,7 @@ def _extract_experience(lines: List[str], boundaries: Dict[str, int]) -> List[Ex
                         continue
                 # Also handle "Company, City, ST  |  Date" on same line
                 if not peek_company and not peek_dates:
-                    combo = re.match(
-                        r'^([A-Z][\w\s&.\'-]+?)\s*(?:,\s*[A-Z][\w\s]+(?:,\s*[A-Z]{2})?)?\s*[|]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec).*)',
-                        next_line, re.IGNORECASE
-                    )
+                    combo = _EXP_COMPANY_DATE_RE.match(next_line)
                     if combo:
                         peek_company = combo.group(1).strip()
                         peek_dates = combo.group(2).strip()
@@ -660,7 +903,7 @@ def _extract_experience(lines: List[str], boundaries: Dict[str, int]) -> List[Ex
 
         # ─── Bullet points ───
         if current:
-            bullet_match = re.match(r'^[•\-\*◦▪►]\s*(.*)', line)
+            bullet_match = _BULLET_TEXT_RE.match(line)
             if bullet_match:
                 if multi_line_bullet:
                     bullets.append(multi_line_bullet.strip())
@@ -669,7 +912,7 @@ def _extract_experience(lines: List[str], boundaries: Dict[str, int]) -> List[Ex
                 continue
             # Continuation of a wrapped bullet
             if multi_line_bullet and line:
-                if not _is_title_only_line(line) and not re.match(r'^[A-Z][\w\s/&-]+?\s*[|,@]', line):
+                if not _is_title_only_line(line) and not _EXP_ENTRY_START_RE.match(line):
                     multi_line_bullet += " " + line
                     i += 1
                     continue
@@ -697,29 +940,19 @@ def _extract_experience(lines: List[str], boundaries: Dict[str, int]) -> List[Ex
 def _is_degree_line(line: str) -> Optional[re.Match]:
     """Check if a line contains a degree keyword. Returns the match or None."""
     # Full words first (most reliable)
-    match = re.search(
-        r"\b(Master'?s?|Bachelor'?s?|PhD|Ph\.D\.?|Doctorate|Associate'?s?|MBA)"
-        r"(?:\s+(?:of|in|degree\s+in))?\s*(.*)",
-        line, re.IGNORECASE
-    )
+    match = _DEGREE_WORD_RE.search(line)
     if match:
         return match
     # Abbreviations — must be at START of line, prevents "Melbourne" matching "M.E."
-    match = re.match(
-        r"^\s*(B\.S\.?|M\.S\.?|B\.A\.?|M\.A\.?|B\.Tech\.?|M\.Tech\.?|B\.E\.?|M\.E\.?)"
-        r"(?:\s+(?:in|of))?\s*(.*)",
-        line, re.IGNORECASE
-    )
-    return match
+    return _DEGREE_ABBREV_RE.match(line)
 
 
 def _is_university_line(line: str) -> bool:
     """Check if a line looks like a university/institution name."""
-    uni_keywords = r'(?:university|college|institute|school|academy|polytechnic|JNTU|IIT|NIT|MIT|Stanford|Harvard|Georgia\s+Tech)'
-    return bool(re.search(uni_keywords, line, re.IGNORECASE))
+    return bool(_UNIVERSITY_RE.search(line))
 
 
-def _extract_education(lines: List[str], boundaries: Dict[str, int]) -> List[Education]:
+def _extract_education(section_lines: List[str]) -> List[Education]:
     """
     Extract education entries.
 
@@ -730,7 +963,6 @@ def _extract_education(lines: List[str], boundaries: Dict[str, int]) -> List[Edu
         Florida Institute of Technology, Melbourne, FL
         Aug 2023 - May 2025 | GPA: 3.9/4.0
     """
-    section_lines = _get_section_lines(lines, boundaries, "education")
     if not section_lines:
         return []
 
@@ -750,7 +982,7 @@ def _extract_education(lines: List[str], boundaries: Dict[str, int]) -> List[Edu
 
             # Try to find university on the SAME line
             # Format: "Master's in Computer Science — University Name, City, ST (2024)"
-            parts = re.split(r'\s*[—–]\s*', rest, maxsplit=1)
+            parts = _DASH_SPLIT_RE.split(rest, maxsplit=1)
             major = parts[0].strip().rstrip(",")
             university = ""
             location = ""
@@ -759,13 +991,13 @@ def _extract_education(lines: List[str], boundaries: Dict[str, int]) -> List[Edu
             if len(parts) > 1:
                 uni_part = parts[1]
                 # Extract year in parens
-                year_match = re.search(r'\((\d{4})\)', uni_part)
+                year_match = _PAREN_YEAR_RE.search(uni_part)
                 if year_match:
                     dates = year_match.group(1)
                     uni_part = uni_part[:year_match.start()].strip().rstrip(",")
 
                 # Extract location
-                loc_match = re.search(r',\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),?\s*([A-Z]{2})?\s*$', uni_part)
+                loc_match = _TRAILING_LOCATION_RE.search(uni_part)
                 if loc_match:
                     location = loc_match.group(0).strip().lstrip(",").strip()
                     uni_part = uni_part[:loc_match.start()].strip().rstrip(",")
@@ -778,14 +1010,14 @@ def _extract_education(lines: List[str], boundaries: Dict[str, int]) -> List[Edu
                 major_parts = [p.strip() for p in major.split(",")]
                 # Extract dates from the end
                 for idx in range(len(major_parts) - 1, -1, -1):
-                    d = re.search(r'(\d{4})\s*[-–—]\s*(\d{4}|Present)', major_parts[idx])
+                    d = _YEAR_RANGE_RE.search(major_parts[idx])
                     if d:
                         if not dates:
                             dates = d.group(0)
                         major_parts.pop(idx)
                         break
                     # Also catch standalone year
-                    if re.match(r'^\d{4}$', major_parts[idx].strip()):
+                    if _YEAR_ONLY_RE.match(major_parts[idx].strip()):
                         major_parts.pop(idx)
                         break
                 # Find university in remaining parts
@@ -808,7 +1040,7 @@ def _extract_education(lines: List[str], boundaries: Dict[str, int]) -> List[Edu
         # ── University on a separate line (multi-line format) ──
         if current and not current.university and _is_university_line(line):
             # "Florida Institute of Technology, Melbourne, FL"
-            loc_match = re.search(r',\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),?\s*([A-Z]{2})?\s*$', line)
+            loc_match = _TRAILING_LOCATION_RE.search(line)
             if loc_match:
                 current.location = loc_match.group(0).strip().lstrip(",").strip()
                 current.university = line[:loc_match.start()].strip().rstrip(",")
@@ -818,31 +1050,31 @@ def _extract_education(lines: List[str], boundaries: Dict[str, int]) -> List[Edu
 
         if current:
             # ── GPA ──
-            gpa_match = re.search(r'GPA[:\s]+([\d.]+)', line, re.IGNORECASE)
+            gpa_match = _GPA_RE.search(line)
             if gpa_match:
                 current.gpa = gpa_match.group(1)
 
             # ── Coursework ──
-            if re.search(r'coursework|courses', line, re.IGNORECASE):
-                coursework_text = re.sub(r'.*(?:coursework|courses)\s*:?\s*', '', line, flags=re.IGNORECASE)
+            labels = list(_COURSEWORK_LABEL_RE.finditer(line))
+            if labels:
+                # Items follow the last label (a leading ".*" here re-scans
+                # the rest of the line from every position: quadratic)
+                coursework_text = line[labels[-1].end():]
                 if coursework_text:
-                    items = [c.strip() for c in re.split(r'[,;•]', coursework_text) if c.strip()]
+                    items = [c.strip() for c in _COURSEWORK_SPLIT_RE.split(coursework_text) if c.strip()]
                     current.coursework = items
 
             # ── Dates on own line ──
             if not current.dates:
                 # "Aug 2023 - May 2025", "2020 - 2024", also with pipe: "Aug 2023 - May 2025 | GPA: 3.9"
-                date_match = re.search(
-                    r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\.?\s+\d{4})\s*[-–—]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\.?\s+\d{4}|Present|Current)',
-                    line, re.IGNORECASE
-                )
+                date_match = _MONTH_RANGE_RE.search(line)
                 if not date_match:
-                    date_match = re.search(r'(\d{4})\s*[-–—]\s*(\d{4}|Present)', line)
+                    date_match = _YEAR_RANGE_RE.search(line)
                 if date_match:
                     current.dates = date_match.group(0)
                     # Check for GPA on same line as dates (e.g., "Aug 2023 - May 2025 | GPA: 3.9")
                     if not current.gpa:
-                        gpa2 = re.search(r'GPA[:\s]+([\d.]+)', line, re.IGNORECASE)
+                        gpa2 = _GPA_RE.search(line)
                         if gpa2:
                             current.gpa = gpa2.group(1)
 
@@ -856,7 +1088,7 @@ def _extract_education(lines: List[str], boundaries: Dict[str, int]) -> List[Edu
 # Skills Extraction
 # ═══════════════════════════════════════════════════════════
 
-def _extract_skills(lines: List[str], boundaries: Dict[str, int]) -> Dict[str, List[str]]:
+def _extract_skills(section_lines: List[str]) -> Dict[str, List[str]]:
     """
     Extract skills organized by category.
 
@@ -865,7 +1097,6 @@ def _extract_skills(lines: List[str], boundaries: Dict[str, int]) -> Dict[str, L
       • "Languages: Python, Java • Cloud: AWS"  (multiple on one line)
       • "Python, Java, JavaScript"              (no category)
     """
-    section_lines = _get_section_lines(lines, boundaries, "skills")
     if not section_lines:
         return {}
 
@@ -874,21 +1105,18 @@ def _extract_skills(lines: List[str], boundaries: Dict[str, int]) -> Dict[str, L
 
     for line in section_lines:
         # Skip bullet-style lines (those belong to experience, not skills)
-        if re.match(r'^[•\-\*◦▪►]\s+', line):
+        if _BULLET_SPACE_RE.match(line):
             continue
 
         # Check if line has one or more "Category: items" patterns
         # e.g., "Languages: Python, Java • Cloud: AWS, GCP"
-        cat_parts = re.split(r'(?:\s*[•|]\s+|\s{3,})(?=[A-Z][\w/&\s]+?:\s)', line)
+        cat_parts = _SKILL_CATEGORY_SPLIT_RE.split(line)
 
         for part in cat_parts:
-            cat_match = re.match(r'^([A-Z][\w/&\s]+?):\s*(.*)', part.strip())
+            cat_match = _SKILL_CATEGORY_RE.match(part.strip())
             if cat_match:
                 current_category = cat_match.group(1).strip()
-                raw = cat_match.group(2).strip()
-                items = [s.strip() for s in re.split(r'[,;]', raw) if s.strip() and len(s.strip()) > 1]
-                # Filter out non-skill content
-                items = [s for s in items if not re.match(r'^[•|]\s*$', s)]
+                items = _split_skill_items(cat_match.group(2), _SKILL_ITEM_DELIMS)
                 if items:
                     if current_category in skills_dict:
                         skills_dict[current_category].extend(items)
@@ -896,7 +1124,7 @@ def _extract_skills(lines: List[str], boundaries: Dict[str, int]) -> Dict[str, L
                         skills_dict[current_category] = items
             else:
                 # No category label — append to current category
-                items = [s.strip() for s in re.split(r'[,;|]', part.strip()) if s.strip() and len(s.strip()) > 1]
+                items = _split_skill_items(part, _SKILL_UNLABELED_DELIMS)
                 if items:
                     if current_category not in skills_dict:
                         skills_dict[current_category] = []
@@ -905,11 +1133,22 @@ def _extract_skills(lines: List[str], boundaries: Dict[str, int]) -> Dict[str, L
     return skills_dict
 
 
+def _split_skill_items(text: str, delims: Dict[int, str]) -> List[str]:
+    """Split a run of skills on its delimiters, dropping 1-char fragments
+    (which also drops stray "•" / "|" separators)."""
+    items = []
+    for item in text.translate(delims).split(","):
+        item = item.strip()
+        if len(item) > 1:
+            items.append(item)
+    return items
+
+
 # ═══════════════════════════════════════════════════════════
 # Projects Extraction
 # ═══════════════════════════════════════════════════════════
 
-def _extract_projects(lines: List[str], boundaries: Dict[str, int]) -> List[Project]:
+def _extract_projects(section_lines: List[str]) -> List[Project]:
     """
     Extract projects from the Projects section.
 
@@ -919,7 +1158,6 @@ def _extract_projects(lines: List[str], boundaries: Dict[str, int]) -> List[Proj
       • "Project Name  (Jan 2024 – Mar 2024)"
       • Followed by bullet points describing the project
     """
-    section_lines = _get_section_lines(lines, boundaries, "projects")
     if not section_lines:
         return []
 
@@ -938,21 +1176,15 @@ def _extract_projects(lines: List[str], boundaries: Dict[str, int]) -> List[Proj
             description_parts = []
 
     for line in section_lines:
-        is_bullet = bool(re.match(r'^[•\-\*◦▪►]', line))
+        is_bullet = bool(_BULLET_RE.match(line))
 
         # ── Try to detect a project header line ──
         # Format 1: "Name — subtitle" or "Name – subtitle" or "Name - subtitle"
-        header_dash = re.match(
-            r'^([A-Z][\w\s&\'-]+?)(?:\s*[—–|-]\s*(.+))?$', line
-        )
+        header_dash = _PROJECT_DASH_HEADER_RE.match(line)
         # Format 2: "Name | Tech1, Tech2" (pipe separated)
-        header_pipe = re.match(
-            r'^([A-Z][\w\s&\'-]+?)\s*\|\s*(.+)$', line
-        )
+        header_pipe = _PROJECT_PIPE_HEADER_RE.match(line)
         # Format 3: "Name  (dates)" or just "Name"
-        header_plain = re.match(
-            r'^([A-Z][\w\s&\'-]+?)(?:\s*\(([^)]+)\))?$', line
-        )
+        header_plain = _PROJECT_PLAIN_HEADER_RE.match(line)
 
         is_header = (
             not is_bullet
@@ -971,7 +1203,7 @@ def _extract_projects(lines: List[str], boundaries: Dict[str, int]) -> List[Proj
                 name = header_pipe.group(1).strip()
                 # Pipe part is usually tech list
                 tech_str = header_pipe.group(2).strip()
-                technologies = [t.strip() for t in re.split(r'[,;]', tech_str) if t.strip()]
+                technologies = [t.strip() for t in tech_str.translate(_SKILL_ITEM_DELIMS).split(',') if t.strip()]
             elif header_dash and header_dash.group(2):
                 name = header_dash.group(1).strip()
                 subtitle = header_dash.group(2).strip()
@@ -983,16 +1215,16 @@ def _extract_projects(lines: List[str], boundaries: Dict[str, int]) -> List[Proj
 
             # Extract URL from subtitle/name
             url = ""
-            url_match = re.search(r'\(?([a-z][\w.-]+\.[a-z]{2,})\)?', subtitle)
+            url_match = _PROJECT_URL_RE.search(subtitle)
             if url_match:
                 url = url_match.group(1)
                 subtitle = subtitle[:url_match.start()].strip().rstrip("(").strip()
 
             # Extract techs from parenthesized list in subtitle
             if not technologies and subtitle:
-                tech_paren = re.search(r'(?:using|with|built\s+with|tech(?:nologies)?:?)\s+(.+)', subtitle, re.IGNORECASE)
+                tech_paren = _PROJECT_TECH_PREFIX_RE.search(subtitle)
                 if tech_paren:
-                    technologies = [t.strip() for t in re.split(r'[,;+]', tech_paren.group(1)) if t.strip() and len(t.strip()) > 1]
+                    technologies = [t.strip() for t in _PROJECT_TECH_SPLIT_RE.split(tech_paren.group(1)) if t.strip() and len(t.strip()) > 1]
                     subtitle = subtitle[:tech_paren.start()].strip()
 
             current = Project(
@@ -1003,16 +1235,13 @@ def _extract_projects(lines: List[str], boundaries: Dict[str, int]) -> List[Proj
             )
         elif current:
             # Bullet or continuation line — belongs to current project
-            clean = re.sub(r'^[•\-\*◦▪►]\s*', '', line).strip()
+            clean = _BULLET_PREFIX_RE.sub('', line).strip()
             if clean:
                 description_parts.append(clean)
                 # Extract technologies mentioned inline
-                tech_matches = re.findall(
-                    r'(?:using|with|built\s+with|technologies?:?|powered\s+by)\s+([^.]+?)(?:\.|$)',
-                    clean, re.IGNORECASE,
-                )
+                tech_matches = _PROJECT_INLINE_TECH_RE.findall(clean)
                 for tm in tech_matches:
-                    techs = [t.strip() for t in re.split(r'[,;+]', tm) if t.strip() and len(t.strip()) > 1]
+                    techs = [t.strip() for t in _PROJECT_TECH_SPLIT_RE.split(tm) if t.strip() and len(t.strip()) > 1]
                     for tech in techs:
                         if tech not in current.technologies:
                             current.technologies.append(tech)
@@ -1025,31 +1254,30 @@ def _extract_projects(lines: List[str], boundaries: Dict[str, int]) -> List[Proj
 # Certifications Extraction
 # ═══════════════════════════════════════════════════════════
 
-def _extract_certifications(lines: List[str], boundaries: Dict[str, int]) -> List[Certification]:
+def _extract_certifications(section_lines: List[str]) -> List[Certification]:
     """Extract certifications."""
-    section_lines = _get_section_lines(lines, boundaries, "certifications")
     if not section_lines:
         return []
 
     certifications_list: List[Certification] = []
 
     for line in section_lines:
-        clean = re.sub(r'^[•\-\*◦▪►]\s*', '', line).strip()
+        clean = _BULLET_PREFIX_RE.sub('', line).strip()
         if not clean or len(clean) < 5:
             continue
 
         # Extract year
-        year_match = re.search(r'\(?(\d{4})\)?', clean)
+        year_match = _CERT_YEAR_RE.search(clean)
         year = year_match.group(1) if year_match else ""
 
         # Try to split "Name | Issuer" or "Name – Issuer" or "Name, Issuer"
-        parts = re.split(r'\s*[|–—]\s*', clean)
+        parts = _CERT_SPLIT_RE.split(clean)
         name = parts[0].strip()
         issuer = parts[1].strip() if len(parts) > 1 else ""
 
         # Clean up: remove "View Credential" etc.
-        name = re.sub(r'\s*\|?\s*View\s+Credential.*', '', name, flags=re.IGNORECASE).strip()
-        issuer = re.sub(r'\s*\|?\s*View\s+Credential.*', '', issuer, flags=re.IGNORECASE).strip()
+        name = _VIEW_CREDENTIAL_RE.sub('', name).strip()
+        issuer = _VIEW_CREDENTIAL_RE.sub('', issuer).strip()
 
         if name:
             certifications_list.append(Certification(name=name, issuer=issuer, year=year))
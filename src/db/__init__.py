@@ -22,6 +22,7 @@ from .operations import (
     # Tasks
     save_task,
     update_task,
+    upsert_tasks_batch,
     get_task_db,
     list_tasks_db,
     mark_stale_tasks_failed,
@@ -49,6 +50,7 @@ __all__ = [
     # Tasks
     "save_task",
     "update_task",
+    "upsert_tasks_batch",
     "get_task_db",
     "list_tasks_db",
     "mark_stale_tasks_failed",
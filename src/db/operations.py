@@ -18,6 +18,10 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _epoch_iso(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat() if timestamp else None
+
+
 def _safe_execute(table: str, operation: str, fn):
     """
     Execute a Supabase operation, swallowing errors so the main
@@ -279,13 +283,7 @@ def update_task(
     """Update a task's status and result."""
     update_data: Dict[str, Any] = {"status": status}
     if result is not None:
-        # Only store serialisable results
-        try:
-            import json
-            json.dumps(result)
-            update_data["result"] = result
-        except (TypeError, ValueError):
-            update_data["result"] = {"__repr__": str(result)}
+        update_data["result"] = _serialisable_result(result)
     if error is not None:
         update_data["error"] = error
     if started_at:
@@ -301,6 +299,42 @@ def update_task(
     ))
 
 
+def upsert_tasks_batch(rows: List[Dict[str, Any]]) -> Optional[Dict]:
+    """
+    Insert or update several tasks in one round-trip.
+
+    Each row must be a full task row (every column set) so rows in the
+    same batch agree on their columns. Timestamps are Unix epoch seconds
+    (or None) and are formatted for the timestamptz columns here.
+    """
+    if not rows:
+        return None
+    batch = []
+    for row in rows:
+        row = {
+            **row,
+            "created_at": _epoch_iso(row["created_at"]),
+            "started_at": _epoch_iso(row["started_at"]),
+            "completed_at": _epoch_iso(row["completed_at"]),
+        }
+        if row.get("result") is not None:
+            row["result"] = _serialisable_result(row["result"])
+        batch.append(row)
+    return _safe_execute("tasks", "upsert", lambda c: (
+        c.table("tasks").upsert(batch, on_conflict="task_id").execute()
+    ))
+
+
+def _serialisable_result(result: Any) -> Any:
+    """Only store serialisable results."""
+    try:
+        import json
+        json.dumps(result)
+        return result
+    except (TypeError, ValueError):
+        return {"__repr__": str(result)}
+
+
 def get_task_db(task_id: str) -> Optional[Dict]:
     """Fetch a single task by task_id."""
     result = _safe_execute("tasks", "select", lambda c: (
@@ -10,10 +10,11 @@ Uses expert ATS prompts (15+ years experience) for:
 
 import json
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from ..utils import deduplicate_preserve_order, normalize_keyword
+from ..utils import json_loads, normalize_keywords
 from ..models import Experience, Project
+from ..core.cache import cache_section_rewrite, persistent_get, persistent_set
 from .prompts import (
     KEYWORD_EXTRACTION_SYSTEM,
     KEYWORD_EXTRACTION_PROMPT,
@@ -22,8 +23,11 @@ from .prompts import (
     ACTION_VERBS_REFERENCE,
     PROJECT_REWRITE_SYSTEM,
     PROJECT_REWRITE_PROMPT,
+    BATCH_REWRITE_SYSTEM,
+    BATCH_REWRITE_PROMPT,
     EXPERIENCE_RANK_SYSTEM,
     EXPERIENCE_RANK_PROMPT,
+    REWRITE_PROMPT_VERSION,
 )
 from .provider import client, MODEL
 
@@ -79,22 +83,19 @@ def extract_keywords(job_description: str) -> List[str]:
         raw_output = _clean_json_response(response.choices[0].message.content.strip())
         
         try:
-            keywords = json.loads(raw_output)
+            keywords = json_loads(raw_output)
             if isinstance(keywords, list):
-                normalized = [normalize_keyword(str(k)) for k in keywords if k]
-                return deduplicate_preserve_order(normalized)[:50]
+                return normalize_keywords(keywords, limit=50)
             elif isinstance(keywords, dict):
                 # Handle {"required": [...], "preferred": [...]} format
                 all_kw = []
                 for category_list in keywords.values():
                     if isinstance(category_list, list):
                         all_kw.extend(category_list)
-                normalized = [normalize_keyword(str(k)) for k in all_kw if k]
-                return deduplicate_preserve_order(normalized)[:50]
+                return normalize_keywords(all_kw, limit=50)
         except json.JSONDecodeError:
             keywords = [line.strip("-• ").strip() for line in raw_output.splitlines() if line.strip()]
-            normalized = [normalize_keyword(k) for k in keywords if k]
-            return deduplicate_preserve_order(normalized)[:50]
+            return normalize_keywords(keywords, limit=50)
     
     except Exception as e:
         print(f"OpenAI API error: {e}. Falling back to basic keyword extraction.")
@@ -135,6 +136,12 @@ def rewrite_experience_bullets(
     if not experience.bullets:
         return []
     
+    # Same key as a batched rewrite of this experience (see rewrite_all_sections)
+    cache_key = _rewrite_cache_key(_experience_text(experience), job_description, keywords, MODEL)
+    cached = persistent_get(cache_key)
+    if cached is not None:
+        return cached
+    
     original_bullets = "\n".join([f"- {bullet}" for bullet in experience.bullets])
     keywords_str = ", ".join(keywords[:20])
     
@@ -160,17 +167,20 @@ def rewrite_experience_bullets(
         
         raw_output = _clean_json_response(response.choices[0].message.content.strip())
         
+        bullets = None
         try:
-            rewritten_bullets = json.loads(raw_output)
+            rewritten_bullets = json_loads(raw_output)
+            if isinstance(rewritten_bullets, dict):
+                rewritten_bullets = rewritten_bullets.get("bullets", rewritten_bullets.get("points", []))
             if isinstance(rewritten_bullets, list):
-                return [str(bullet).strip() for bullet in rewritten_bullets if bullet][:6]
-            elif isinstance(rewritten_bullets, dict):
-                bullets = rewritten_bullets.get("bullets", rewritten_bullets.get("points", []))
-                if isinstance(bullets, list):
-                    return [str(b).strip() for b in bullets if b][:6]
+                bullets = [str(bullet).strip() for bullet in rewritten_bullets if bullet][:6]
         except json.JSONDecodeError:
-            bullets = [line.strip("-• ").strip() for line in raw_output.splitlines() if line.strip()]
-            return bullets[:6]
+            bullets = [line.strip("-• ").strip() for line in raw_output.splitlines() if line.strip()][:6]
+        
+        if bullets is not None:
+            if bullets:
+                persistent_set(cache_key, bullets)
+            return bullets
     
     except Exception as e:
         print(f"OpenAI API error during bullet rewriting: {e}. Using original bullets with keyword injection.")
@@ -229,7 +239,7 @@ def match_experience_with_jd(
         raw_output = _clean_json_response(response.choices[0].message.content.strip())
         
         try:
-            indices = json.loads(raw_output)
+            indices = json_loads(raw_output)
             if isinstance(indices, list) and all(isinstance(i, int) for i in indices):
                 ranked_experiences = [experiences[i] for i in indices if 0 <= i < len(experiences)]
                 for exp in experiences:
@@ -270,6 +280,12 @@ def rewrite_project_description(
     if not client or not project.description:
         return project.description
     
+    # Same key as a batched rewrite of this project (see rewrite_all_sections)
+    cache_key = _rewrite_cache_key(_project_text(project), job_description, keywords, MODEL)
+    cached = persistent_get(cache_key)
+    if cached is not None:
+        return cached
+    
     keywords_str = ", ".join(keywords[:20])
     
     user_prompt = PROJECT_REWRITE_PROMPT.format(
@@ -299,13 +315,171 @@ def rewrite_project_description(
         if rewritten.startswith("'") and rewritten.endswith("'"):
             rewritten = rewritten[1:-1]
         
-        return rewritten[:250]
+        rewritten = rewritten[:250]
+        if rewritten:
+            persistent_set(cache_key, rewritten)
+        return rewritten
     
     except Exception as e:
         print(f"OpenAI API error during project rewriting: {e}. Using original description.")
         return project.description
 
 
+# ═══════════════════════════════════════════════════════════════
+# Batched Section Rewriting
+# ═══════════════════════════════════════════════════════════════
+
+# Sections per batched request — larger prompts start to degrade output
+BATCH_REWRITE_MAX_ITEMS = 8
+
+
+def rewrite_all_sections(
+    experiences: List[Experience],
+    projects: List[Project],
+    job_description: str,
+    keywords: List[str]
+) -> Tuple[Dict[int, List[str]], Dict[int, str]]:
+    """
+    Rewrite experience bullets and project descriptions in one LLM call
+    per BATCH_REWRITE_MAX_ITEMS sections instead of one call per section.
+    
+    Args:
+        experiences: Experiences whose bullets should be rewritten
+        projects: Projects whose descriptions should be rewritten
+        job_description: Target job description
+        keywords: Extracted keywords from job description
+    
+    Returns:
+        (bullets, descriptions) keyed by position in ``experiences`` /
+        ``projects``. Sections missing from the batched reply fall back to
+        rewrite_experience_bullets / rewrite_project_description.
+        Batched rewrites are cached by section content, JD, keywords and
+        model, so regenerating for the same JD skips the LLM entirely.
+    """
+    sections = _batch_sections(experiences, projects)
+    keys, rewritten = _cached_sections(sections, job_description, keywords, MODEL)
+    pending = [section for section in sections if section[0] not in rewritten]
+    
+    if client:
+        for start in range(0, len(pending), BATCH_REWRITE_MAX_ITEMS):
+            chunk = pending[start:start + BATCH_REWRITE_MAX_ITEMS]
+            try:
+                response = client.chat.completions.create(
+                    model=MODEL,
+                    messages=[
+                        {"role": "system", "content": BATCH_REWRITE_SYSTEM},
+                        {"role": "user", "content": _batch_rewrite_prompt(chunk, job_description, keywords)}
+                    ],
+                    temperature=0.3,
+                    max_tokens=_batch_max_tokens(chunk),
+                )
+                rewritten.update(_store_sections(keys, _parse_batch_rewrite(response.choices[0].message.content, chunk)))
+            except Exception as e:
+                print(f"OpenAI API error during batched rewriting: {e}. Rewriting sections individually.")
+    
+    bullets = {
+        i: rewritten[f"exp_{i}"] if f"exp_{i}" in rewritten
+        else rewrite_experience_bullets(exp, job_description, keywords)
+        for i, exp in enumerate(experiences)
+    }
+    descriptions = {
+        i: rewritten[f"proj_{i}"] if f"proj_{i}" in rewritten
+        else rewrite_project_description(project, job_description, keywords)
+        for i, project in enumerate(projects)
+    }
+    return bullets, descriptions
+
+
+def _cached_sections(
+    sections: List[Tuple[str, str]],
+    job_description: str,
+    keywords: List[str],
+    model: str
+) -> Tuple[Dict[str, str], Dict[str, object]]:
+    """Return (cache key per section id, previously cached rewrites by section id)."""
+    keys = {
+        section_id: _rewrite_cache_key(text, job_description, keywords, model)
+        for section_id, text in sections
+    }
+    cached: Dict[str, object] = {}
+    for section_id, key in keys.items():
+        value = persistent_get(key)
+        if value is not None:
+            cached[section_id] = value
+    return keys, cached
+
+
+def _rewrite_cache_key(text: str, job_description: str, keywords: List[str], model: str) -> str:
+    """Content cache key for a section rewrite, scoped to the model and prompt version."""
+    return cache_section_rewrite(text, job_description, keywords, f"{model}/v{REWRITE_PROMPT_VERSION}")
+
+
+def _store_sections(keys: Dict[str, str], rewritten: Dict[str, object]) -> Dict[str, object]:
+    """Persist freshly rewritten sections under their content keys."""
+    for section_id, value in rewritten.items():
+        persistent_set(keys[section_id], value)
+    return rewritten
+
+
+def _batch_sections(experiences: List[Experience], projects: List[Project]) -> List[Tuple[str, str]]:
+    """``(section_id, section_text)`` for every section that has text to rewrite."""
+    sections = [
+        (f"exp_{i}", _experience_text(exp))
+        for i, exp in enumerate(experiences) if exp.bullets
+    ]
+    sections.extend(
+        (f"proj_{i}", _project_text(project))
+        for i, project in enumerate(projects) if project.description
+    )
+    return sections
+
+
+def _experience_text(experience: Experience) -> str:
+    """Position-independent text of an experience — also its rewrite cache identity."""
+    return f"{experience.title} at {experience.company}\n" + "\n".join(f"- {b}" for b in experience.bullets)
+
+
+def _project_text(project: Project) -> str:
+    """Position-independent text of a project — also its rewrite cache identity."""
+    return f"{project.name} ({', '.join(project.technologies[:10])})\n{project.description}"
+
+
+def _batch_rewrite_prompt(sections: List[Tuple[str, str]], job_description: str, keywords: List[str]) -> str:
+    """Format the batched rewrite prompt for one chunk of sections."""
+    return BATCH_REWRITE_PROMPT.format(
+        keywords=", ".join(keywords[:20]),
+        job_description=job_description[:1200],
+        sections="\n\n".join(f"[{section_id}] {text}" for section_id, text in sections),
+    )
+
+
+def _batch_max_tokens(sections: List[Tuple[str, str]]) -> int:
+    """Same per-section token allowance as the single-item rewriters."""
+    return sum(1000 if section_id.startswith("exp_") else 250 for section_id, _ in sections)
+
+
+def _parse_batch_rewrite(raw: str, sections: List[Tuple[str, str]]) -> Dict[str, object]:
+    """Pull each requested section out of a batched JSON reply, skipping malformed ones."""
+    try:
+        data = json_loads(_clean_json_response(raw.strip()))
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    
+    parsed: Dict[str, object] = {}
+    for section_id, _ in sections:
+        value = data.get(section_id)
+        if section_id.startswith("exp_"):
+            if isinstance(value, list):
+                bullets = [str(b).strip() for b in value if b][:6]
+                if bullets:
+                    parsed[section_id] = bullets
+        elif isinstance(value, str) and value.strip():
+            parsed[section_id] = value.strip().strip('"\'')[:250]
+    return parsed
+
+
 # ═══════════════════════════════════════════════════════════════
 # Fallback / Helpers
 # ═══════════════════════════════════════════════════════════════
@@ -363,8 +537,7 @@ def _fallback_keyword_extraction(job_description: str) -> List[str]:
     
     # Combine found skills + candidates, deduplicate
     all_keywords = found_skills + candidates
-    normalized = [normalize_keyword(c) for c in all_keywords]
-    return deduplicate_preserve_order(normalized)[:50]
+    return normalize_keywords(all_keywords, limit=50)
 
 
 def _inject_keywords_into_bullets(bullets: List[str], keywords: List[str]) -> List[str]:
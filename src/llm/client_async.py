@@ -7,9 +7,9 @@ All LLM calls run truly in parallel via asyncio.gather.
 
 import asyncio
 import json
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from ..utils import deduplicate_preserve_order, normalize_keyword
+from ..utils import json_loads, normalize_keywords
 from ..models import Experience, Project, ResumeData
 from .prompts import (
     KEYWORD_EXTRACTION_SYSTEM,
@@ -23,8 +23,18 @@ from .prompts import (
     PROJECT_REWRITE_PROMPT_SHORT,
     EXPERIENCE_RANK_SYSTEM,
     EXPERIENCE_RANK_PROMPT_SHORT,
+    BATCH_REWRITE_SYSTEM,
+)
+from .provider import async_client, llm_semaphore, ASYNC_MODEL as MODEL
+from .client import (
+    BATCH_REWRITE_MAX_ITEMS,
+    _batch_sections,
+    _cached_sections,
+    _store_sections,
+    _batch_rewrite_prompt,
+    _batch_max_tokens,
+    _parse_batch_rewrite,
 )
-from .provider import async_client, ASYNC_MODEL as MODEL
 
 
 def _clean_json_response(raw: str) -> str:
@@ -47,34 +57,32 @@ async def extract_keywords_async(job_description: str) -> List[str]:
     user_prompt = KEYWORD_EXTRACTION_PROMPT.format(job_description=job_description)
 
     try:
-        response = await async_client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": KEYWORD_EXTRACTION_SYSTEM},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.1,
-            max_tokens=500,
-        )
+        async with llm_semaphore:
+            response = await async_client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {"role": "system", "content": KEYWORD_EXTRACTION_SYSTEM},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.1,
+                max_tokens=500,
+            )
         
         raw_output = _clean_json_response(response.choices[0].message.content.strip())
         
         try:
-            keywords = json.loads(raw_output)
+            keywords = json_loads(raw_output)
             if isinstance(keywords, list):
-                normalized = [normalize_keyword(str(k)) for k in keywords if k]
-                return deduplicate_preserve_order(normalized)[:50]
+                return normalize_keywords(keywords, limit=50)
             elif isinstance(keywords, dict):
                 all_kw = []
                 for category_list in keywords.values():
                     if isinstance(category_list, list):
                         all_kw.extend(category_list)
-                normalized = [normalize_keyword(str(k)) for k in all_kw if k]
-                return deduplicate_preserve_order(normalized)[:50]
+                return normalize_keywords(all_kw, limit=50)
         except json.JSONDecodeError:
             keywords = [line.strip("-• ").strip() for line in raw_output.splitlines() if line.strip()]
-            normalized = [normalize_keyword(k) for k in keywords if k]
-            return deduplicate_preserve_order(normalized)[:50]
+            return normalize_keywords(keywords, limit=50)
     
     except Exception as e:
         print(f"OpenAI API error: {e}. Falling back to basic keyword extraction.")
@@ -110,20 +118,21 @@ async def rewrite_experience_bullets_async(
     )
 
     try:
-        response = await async_client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": BULLET_REWRITE_SYSTEM},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
-            max_tokens=800,
-        )
+        async with llm_semaphore:
+            response = await async_client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {"role": "system", "content": BULLET_REWRITE_SYSTEM},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.3,
+                max_tokens=800,
+            )
         
         raw_output = _clean_json_response(response.choices[0].message.content.strip())
         
         try:
-            rewritten_bullets = json.loads(raw_output)
+            rewritten_bullets = json_loads(raw_output)
             if isinstance(rewritten_bullets, list):
                 return [str(bullet).strip() for bullet in rewritten_bullets if bullet][:6]
             elif isinstance(rewritten_bullets, dict):
@@ -163,20 +172,21 @@ async def match_experience_with_jd_async(
     )
 
     try:
-        response = await async_client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": EXPERIENCE_RANK_SYSTEM},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.1,
-            max_tokens=150,
-        )
+        async with llm_semaphore:
+            response = await async_client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {"role": "system", "content": EXPERIENCE_RANK_SYSTEM},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.1,
+                max_tokens=150,
+            )
         
         raw_output = _clean_json_response(response.choices[0].message.content.strip())
         
         try:
-            indices = json.loads(raw_output)
+            indices = json_loads(raw_output)
             if isinstance(indices, list) and all(isinstance(i, int) for i in indices):
                 ranked_experiences = [experiences[i] for i in indices if 0 <= i < len(experiences)]
                 for exp in experiences:
@@ -212,15 +222,16 @@ async def rewrite_project_description_async(
     )
 
     try:
-        response = await async_client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": PROJECT_REWRITE_SYSTEM},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
-            max_tokens=200,
-        )
+        async with llm_semaphore:
+            response = await async_client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {"role": "system", "content": PROJECT_REWRITE_SYSTEM},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.3,
+                max_tokens=200,
+            )
         
         rewritten = response.choices[0].message.content.strip()
         if rewritten.startswith('"') and rewritten.endswith('"'):
@@ -235,6 +246,75 @@ async def rewrite_project_description_async(
         return project.description
 
 
+async def rewrite_all_sections_async(
+    experiences: List[Experience],
+    projects: List[Project],
+    job_description: str,
+    keywords: List[str]
+) -> Tuple[Dict[int, List[str]], Dict[int, str]]:
+    """
+    Async rewrite_all_sections: batched requests run concurrently, then any
+    sections missing from the replies are rewritten one-by-one — also
+    concurrently — instead of in a sequential loop.
+    
+    Returns:
+        (bullets, descriptions) keyed by position in ``experiences`` / ``projects``
+    """
+    sections = _batch_sections(experiences, projects)
+    keys, rewritten = _cached_sections(sections, job_description, keywords, MODEL)
+    pending = [section for section in sections if section[0] not in rewritten]
+    
+    if async_client and pending:
+        chunks = [
+            pending[start:start + BATCH_REWRITE_MAX_ITEMS]
+            for start in range(0, len(pending), BATCH_REWRITE_MAX_ITEMS)
+        ]
+        replies = await asyncio.gather(
+            *(_rewrite_batch_async(chunk, job_description, keywords) for chunk in chunks),
+            return_exceptions=True,
+        )
+        for reply in replies:
+            if isinstance(reply, Exception):
+                print(f"OpenAI API error during batched rewriting: {reply}. Rewriting sections individually.")
+            else:
+                rewritten.update(_store_sections(keys, reply))
+    
+    missing_exps = [i for i in range(len(experiences)) if f"exp_{i}" not in rewritten]
+    missing_projects = [i for i in range(len(projects)) if f"proj_{i}" not in rewritten]
+    fallbacks = await asyncio.gather(
+        *(rewrite_experience_bullets_async(experiences[i], job_description, keywords) for i in missing_exps),
+        *(rewrite_project_description_async(projects[i], job_description, keywords) for i in missing_projects),
+        return_exceptions=True,
+    )
+    
+    bullets = {i: rewritten[f"exp_{i}"] for i in range(len(experiences)) if f"exp_{i}" in rewritten}
+    for i, result in zip(missing_exps, fallbacks):
+        bullets[i] = experiences[i].bullets if isinstance(result, Exception) else result
+    descriptions = {i: rewritten[f"proj_{i}"] for i in range(len(projects)) if f"proj_{i}" in rewritten}
+    for i, result in zip(missing_projects, fallbacks[len(missing_exps):]):
+        descriptions[i] = projects[i].description if isinstance(result, Exception) else result
+    return bullets, descriptions
+
+
+async def _rewrite_batch_async(
+    sections: List[Tuple[str, str]],
+    job_description: str,
+    keywords: List[str]
+) -> Dict[str, object]:
+    """Send one batched rewrite request and parse the sections it returned."""
+    async with llm_semaphore:
+        response = await async_client.chat.completions.create(
+            model=MODEL,
+            messages=[
+                {"role": "system", "content": BATCH_REWRITE_SYSTEM},
+                {"role": "user", "content": _batch_rewrite_prompt(sections, job_description, keywords)}
+            ],
+            temperature=0.3,
+            max_tokens=_batch_max_tokens(sections),
+        )
+    return _parse_batch_rewrite(response.choices[0].message.content, sections)
+
+
 async def prepare_resume_data_parallel(
     resume_data: Optional[ResumeData],
     job_description: str,
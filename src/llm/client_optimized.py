@@ -13,7 +13,7 @@ import asyncio
 import json
 from typing import List, Optional, Tuple
 
-from ..utils import deduplicate_preserve_order, normalize_keyword
+from ..utils import json_loads, normalize_keywords
 from ..models import Experience, Project, ResumeData
 from ..core.cache import cache_get, cache_set, cache_keywords, cache_resume_rewrite
 from .prompts import (
@@ -26,7 +26,7 @@ from .prompts import (
     EXPERIENCE_RANK_SYSTEM,
     EXPERIENCE_RANK_PROMPT_SHORT,
 )
-from .provider import async_client, ASYNC_MODEL as MODEL
+from .provider import async_client, llm_semaphore, ASYNC_MODEL as MODEL
 
 
 def _clean_json_response(raw: str) -> str:
@@ -72,19 +72,20 @@ async def extract_keywords_async_optimized(job_description: str, use_cache: bool
     )
 
     try:
-        response = await async_client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": KEYWORD_EXTRACTION_SYSTEM},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.1,
-            max_tokens=300,
-        )
+        async with llm_semaphore:
+            response = await async_client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {"role": "system", "content": KEYWORD_EXTRACTION_SYSTEM},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.1,
+                max_tokens=300,
+            )
         
         content = _clean_json_response(response.choices[0].message.content.strip())
         try:
-            data = json.loads(content)
+            data = json_loads(content)
             if isinstance(data, dict):
                 keywords = data.get("keywords", data.get("skills", []))
                 if not isinstance(keywords, list):
@@ -95,8 +96,7 @@ async def extract_keywords_async_optimized(job_description: str, use_cache: bool
             else:
                 keywords = data if isinstance(data, list) else []
             
-            normalized = [normalize_keyword(str(k)) for k in keywords if k]
-            result = deduplicate_preserve_order(normalized)[:40]
+            result = normalize_keywords(keywords, limit=40)
             
             if use_cache:
                 cache_set(cache_key, result)
@@ -104,8 +104,7 @@ async def extract_keywords_async_optimized(job_description: str, use_cache: bool
             return result
         except json.JSONDecodeError:
             keywords = [line.strip("-• ").strip() for line in content.splitlines() if line.strip()]
-            normalized = [normalize_keyword(k) for k in keywords if k]
-            result = deduplicate_preserve_order(normalized)[:40]
+            result = normalize_keywords(keywords, limit=40)
             if use_cache:
                 cache_set(cache_key, result)
             return result
@@ -157,19 +156,20 @@ async def rewrite_experience_bullets_optimized(
     )
 
     try:
-        response = await async_client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": BULLET_REWRITE_SYSTEM},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
-            max_tokens=500,
-        )
+        async with llm_semaphore:
+            response = await async_client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {"role": "system", "content": BULLET_REWRITE_SYSTEM},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.3,
+                max_tokens=500,
+            )
         
         content = _clean_json_response(response.choices[0].message.content.strip())
         try:
-            data = json.loads(content)
+            data = json_loads(content)
             if isinstance(data, list):
                 bullets = data
             elif isinstance(data, dict):
@@ -231,15 +231,16 @@ async def rewrite_project_description_optimized(
     )
 
     try:
-        response = await async_client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": PROJECT_REWRITE_SYSTEM},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
-            max_tokens=200,
-        )
+        async with llm_semaphore:
+            response = await async_client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {"role": "system", "content": PROJECT_REWRITE_SYSTEM},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.3,
+                max_tokens=200,
+            )
         
         rewritten = response.choices[0].message.content.strip()
         if rewritten.startswith('"') and rewritten.endswith('"'):
@@ -280,19 +281,20 @@ async def match_experience_with_jd_optimized(
     )
 
     try:
-        response = await async_client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": EXPERIENCE_RANK_SYSTEM},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.1,
-            max_tokens=100,
-        )
+        async with llm_semaphore:
+            response = await async_client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {"role": "system", "content": EXPERIENCE_RANK_SYSTEM},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.1,
+                max_tokens=100,
+            )
         
         content = _clean_json_response(response.choices[0].message.content.strip())
         try:
-            data = json.loads(content)
+            data = json_loads(content)
             if isinstance(data, list):
                 indices = data
             elif isinstance(data, dict):
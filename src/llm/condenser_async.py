@@ -10,7 +10,7 @@ import os
 from typing import List, Dict
 
 from ..models import ResumeData, Education, Experience, Project
-from .provider import async_client, ASYNC_MODEL as MODEL
+from .provider import async_client, llm_semaphore, ASYNC_MODEL as MODEL
 
 
 async def condense_resume_for_one_page_async(
@@ -97,21 +97,22 @@ JSON structure:
 Return ONLY the JSON, no explanation."""
 
     try:
-        response = await async_client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert resume optimizer. Always return valid JSON."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.1,
-            max_tokens=400,  # Reduced for faster response
-        )
+        async with llm_semaphore:
+            response = await async_client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert resume optimizer. Always return valid JSON."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                temperature=0.1,
+                max_tokens=400,  # Reduced for faster response
+            )
         
         raw_output = response.choices[0].message.content.strip()
         
@@ -20,7 +20,7 @@ from .prompts import RESUME_PARSER_SYSTEM, RESUME_PARSER_PROMPT
 from .provider import client, MODEL, fallback_client, FALLBACK_MODEL
 
 
-def parse_resume_with_llm(resume_text: str) -> ResumeData:
+def parse_resume_with_llm(resume_text: str, fallback: bool = True) -> ResumeData:
     """
     Parse resume text using OpenAI LLM for high accuracy extraction.
     
@@ -28,11 +28,15 @@ def parse_resume_with_llm(resume_text: str) -> ResumeData:
     
     Args:
         resume_text: Raw text extracted from PDF/DOCX resume
+        fallback: Fall back to the basic parser when the LLM is unavailable
+            or fails; with False, the failure is raised instead
     
     Returns:
         ResumeData: Structured resume data
     """
     if not client:
+        if not fallback:
+            raise RuntimeError("No LLM client configured")
         # Fallback to basic parsing if no API key
         from ..core.resume_parser import _parse_text_to_resume_data
         return _parse_text_to_resume_data(resume_text)
@@ -78,11 +82,15 @@ def parse_resume_with_llm(resume_text: str) -> ResumeData:
                 except json.JSONDecodeError:
                     pass
             
+            if not fallback:
+                raise ValueError("LLM returned unparseable JSON")
             print("JSON repair failed. Falling back to basic parser.")
             from ..core.resume_parser import _parse_text_to_resume_data
             return _parse_text_to_resume_data(resume_text)
     
     except Exception as e:
+        if not fallback:
+            raise
         print(f"LLM parsing error: {e}. Falling back to basic parser.")
         from ..core.resume_parser import _parse_text_to_resume_data
         return _parse_text_to_resume_data(resume_text)
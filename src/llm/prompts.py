@@ -7,9 +7,19 @@ into system prompts and user prompt templates used across:
   • Keyword extraction (llm_client.py / async / optimized)
   • Bullet rewriting (llm_client.py / async / optimized)
   • Project rewriting
+  • Batched bullet + project rewriting
   • Experience ranking
 """
 
+# Bump whenever a bullet/project/batch rewrite prompt changes: it is part of
+# the rewrite cache key, so older cached rewrites stop matching.
+REWRITE_PROMPT_VERSION = 2
+
+# Prompt layout: providers cache identical prompt prefixes automatically
+# (OpenAI prompt caching, Gemini implicit caching), so rewrite templates put
+# static instructions first, then per-request context (keywords, JD), and
+# the per-section text last — every section of one resume shares the prefix.
+
 # ═══════════════════════════════════════════════════════════════
 # Core ATS Expert Identity
 # ═══════════════════════════════════════════════════════════════
@@ -204,7 +214,7 @@ REWRITING RULES:
 1. Start EVERY bullet with a strong action verb (past tense for past roles, present for current)
 2. Use CAR format: Challenge/Context → Action → Result with metrics
 3. Include quantifiable metrics: percentages (%), dollar amounts ($), time saved, team size, user counts
-4. Naturally incorporate these target keywords: {keywords}
+4. Naturally incorporate the target keywords listed below
 5. Keep each bullet to 1-2 lines maximum (under 150 characters ideal)
 6. Match EXACT terminology from the job description
 7. DO NOT fabricate metrics — if original has no numbers, add reasonable scope indicators (e.g., "production environment", "cross-functional teams")
@@ -218,14 +228,16 @@ CRITICAL ATS FORMAT RULES (Workday / Taleo / Greenhouse compatible):
 13. Use EXACT terminology from the JD (e.g., "PostgreSQL" not "Postgres", "Kubernetes" not "K8s")
 14. ATS scores keyword frequency × context: "Built REST APIs with Python/FastAPI" > just listing "Python" in skills
 
-Job Title: {title}
-Company: {company}
+Target Keywords: {keywords}
 
 Job Description Context:
 \"\"\"
 {job_description}
 \"\"\"
 
+Job Title: {title}
+Company: {company}
+
 Original Bullet Points:
 {bullets}
 
@@ -256,7 +268,7 @@ PROJECT_REWRITE_PROMPT = """Rewrite this project description to better match the
 
 RULES:
 1. Keep the project name and core technologies UNCHANGED
-2. Naturally incorporate these keywords: {keywords}
+2. Naturally incorporate the target keywords listed below
 3. Highlight aspects most relevant to the target role
 4. Use action-oriented language with quantifiable impact
 5. Keep it concise: 2-3 impactful sentences max
@@ -265,14 +277,16 @@ RULES:
 8. Use ONLY simple ASCII characters — no special symbols that could break ATS parsers
 9. Include keywords in context (ATS scores "Built REST APIs with FastAPI" higher than just "FastAPI")
 
-Project Name: {project_name}
-Technologies: {technologies}
+Target Keywords: {keywords}
 
 Job Description Context:
 \"\"\"
 {job_description}
 \"\"\"
 
+Project Name: {project_name}
+Technologies: {technologies}
+
 Original Description:
 {description}
 
@@ -287,6 +301,44 @@ Description: {description}
 Return rewritten description only (no quotes, no JSON)."""
 
 
+# ═══════════════════════════════════════════════════════════════
+# Batched Section Rewriting Prompt
+# ═══════════════════════════════════════════════════════════════
+
+BATCH_REWRITE_SYSTEM = (
+    f"{ATS_EXPERT_IDENTITY} "
+    "You rewrite several resume sections in one pass: experience bullets using the "
+    "CAR method with strong action verbs and metrics, and project descriptions that "
+    "highlight ATS-relevant achievements. "
+    "You NEVER fabricate achievements — only enhance and reframe existing ones. "
+    "Always return a single valid JSON object."
+)
+
+BATCH_REWRITE_PROMPT = """Rewrite each resume section below to maximize ATS score for the target job.
+
+RULES:
+1. Experience bullets: start with a strong action verb, include metrics where the original supports them, same count as original
+2. Project descriptions: 2-3 concise sentences; keep the project name and technologies unchanged
+3. Naturally incorporate the target keywords listed below
+4. Match EXACT terminology from the job description (ATS does exact string matching)
+5. Use ONLY simple ASCII characters — no fancy bullets, smart quotes, or em dashes
+6. DO NOT fabricate — only reframe and emphasize
+
+Target Keywords: {keywords}
+
+Job Description Context:
+\"\"\"
+{job_description}
+\"\"\"
+
+Sections:
+{sections}
+
+Return ONLY a JSON object with one entry per section id:
+  "exp_N": array of rewritten bullet strings
+  "proj_N": rewritten description string"""
+
+
 # ═══════════════════════════════════════════════════════════════
 # Experience Ranking Prompt
 # ═══════════════════════════════════════════════════════════════
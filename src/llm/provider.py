@@ -14,6 +14,7 @@ Setup:
   Option C (BOTH):  Set both → Gemini primary, OpenAI fallback
 """
 
+import asyncio
 from typing import Optional, Tuple
 
 from openai import OpenAI, AsyncOpenAI
@@ -151,6 +152,10 @@ async_client, ASYNC_MODEL = get_async_client()
 fallback_client, FALLBACK_MODEL = get_fallback_sync_client()
 fallback_async_client, FALLBACK_ASYNC_MODEL = get_fallback_async_client()
 
+# Caps concurrent async requests across every caller so parallel fan-out
+# (gather over sections, concurrent users) doesn't trip provider 429s
+llm_semaphore = asyncio.Semaphore(settings.llm_concurrency)
+
 logger.info(
     "LLM provider ready — primary: %s, fallback: %s",
     ACTIVE_PROVIDER,
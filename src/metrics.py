@@ -12,10 +12,65 @@ Usage:
     metrics.observe("llm_latency_seconds", 1.23)
 """
 
+import math
 import time
 import threading
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Relative width of each histogram bucket: quantiles are accurate to ~1%.
+HISTOGRAM_PRECISION = 0.02
+_LOG_GAMMA = math.log1p(HISTOGRAM_PRECISION)
+
+
+class _LogHistogram:
+    """
+    Log-bucketed histogram (HDR-style): constant memory, O(1) observe.
+
+    Each positive value lands in bucket ``floor(log(v) / log(1 + precision))``,
+    so a bucket spans a fixed relative range and quantiles come back within
+    ``precision / 2`` of the exact sample. Count and sum are exact.
+    """
+
+    __slots__ = ("_buckets", "_zeros", "count", "sum")
+
+    def __init__(self):
+        self._buckets: Dict[int, int] = defaultdict(int)
+        self._zeros = 0
+        self.count = 0
+        self.sum = 0.0
+
+    def append(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        if value > 0:
+            self._buckets[math.floor(math.log(value) / _LOG_GAMMA)] += 1
+        else:
+            self._zeros += 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """Approximate values at each quantile in ``qs`` (ascending), in one pass."""
+        ranks = [min(int(self.count * q), self.count - 1) for q in qs]
+        values: List[float] = []
+        seen = self._zeros
+        buckets = iter(sorted(self._buckets.items()))
+        index = None
+        for rank in ranks:
+            while seen <= rank:
+                index, n = next(buckets)
+                seen += n
+            # Geometric midpoint of the bucket (0 for the zero bucket)
+            values.append(0.0 if index is None else math.exp((index + 0.5) * _LOG_GAMMA))
+        return values
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    """Render sorted label pairs as Prometheus label text: k1="v1",k2="v2"."""
+    return ",".join(f'{k}="{v}"' for k, v in labels)
 
 
 class MetricsCollector:
@@ -24,10 +79,10 @@ class MetricsCollector:
     def __init__(self):
         self._lock = threading.Lock()
         self._counters: Dict[str, float] = defaultdict(float)
-        self._counter_labels: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        # (name, sorted label pairs) -> value; label text is only built on export
+        self._counter_labels: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = defaultdict(float)
         self._gauges: Dict[str, float] = {}
-        self._histograms: Dict[str, List[float]] = defaultdict(list)
-        self._histogram_max_samples = 1000  # Rolling window
+        self._histograms: Dict[str, _LogHistogram] = defaultdict(_LogHistogram)
 
     # ── Counters ──────────────────────────────────────
 
@@ -35,8 +90,7 @@ class MetricsCollector:
         """Increment a counter."""
         with self._lock:
             if labels:
-                label_key = ",".join(f'{k}="{v}"' for k, v in sorted(labels.items()))
-                self._counter_labels[name][label_key] += value
+                self._counter_labels[(name, tuple(sorted(labels.items())))] += value
             else:
                 self._counters[name] += value
 
@@ -62,11 +116,7 @@ class MetricsCollector:
     def observe(self, name: str, value: float) -> None:
         """Record an observation for a histogram."""
         with self._lock:
-            samples = self._histograms[name]
-            samples.append(value)
-            # Rolling window — keep last N samples
-            if len(samples) > self._histogram_max_samples:
-                self._histograms[name] = samples[-self._histogram_max_samples:]
+            self._histograms[name].append(value)
 
     # ── Timer Context Manager ─────────────────────────
 
@@ -102,10 +152,12 @@ class MetricsCollector:
                 lines.append(f"{name} {value}")
 
             # Counters (with labels)
-            for name, label_values in sorted(self._counter_labels.items()):
-                lines.append(f"# TYPE {name} counter")
-                for label_key, value in sorted(label_values.items()):
-                    lines.append(f"{name}{{{label_key}}} {value}")
+            last_name = None
+            for (name, labels), value in sorted(self._counter_labels.items()):
+                if name != last_name:
+                    lines.append(f"# TYPE {name} counter")
+                    last_name = name
+                lines.append(f"{name}{{{_format_labels(labels)}}} {value}")
 
             # Gauges
             for name, value in sorted(self._gauges.items()):
@@ -113,16 +165,12 @@ class MetricsCollector:
                 lines.append(f"{name} {value}")
 
             # Histograms (summary-style: count, sum, avg, p50, p95, p99)
-            for name, samples in sorted(self._histograms.items()):
-                if not samples:
+            for name, hist in sorted(self._histograms.items()):
+                if not hist:
                     continue
-                sorted_samples = sorted(samples)
-                count = len(sorted_samples)
-                total = sum(sorted_samples)
-                avg = total / count
-                p50 = sorted_samples[int(count * 0.5)]
-                p95 = sorted_samples[min(int(count * 0.95), count - 1)]
-                p99 = sorted_samples[min(int(count * 0.99), count - 1)]
+                count = hist.count
+                total = hist.sum
+                p50, p95, p99 = hist.quantiles((0.5, 0.95, 0.99))
 
                 lines.append(f"# TYPE {name} summary")
                 lines.append(f'{name}_count {count}')
@@ -143,24 +191,24 @@ class MetricsCollector:
                 "histograms": {},
             }
 
-            for name, samples in self._histograms.items():
-                if not samples:
+            for name, hist in self._histograms.items():
+                if not hist:
                     continue
-                sorted_samples = sorted(samples)
-                count = len(sorted_samples)
-                total = sum(sorted_samples)
+                count = hist.count
+                total = hist.sum
+                p50, p95, p99 = hist.quantiles((0.5, 0.95, 0.99))
                 result["histograms"][name] = {
                     "count": count,
                     "sum": round(total, 4),
                     "avg": round(total / count, 4),
-                    "p50": round(sorted_samples[int(count * 0.5)], 4),
-                    "p95": round(sorted_samples[min(int(count * 0.95), count - 1)], 4),
-                    "p99": round(sorted_samples[min(int(count * 0.99), count - 1)], 4),
+                    "p50": round(p50, 4),
+                    "p95": round(p95, 4),
+                    "p99": round(p99, 4),
                 }
 
             # Add labeled counters
-            for name, label_values in self._counter_labels.items():
-                result["counters"][name] = dict(label_values)
+            for (name, labels), value in self._counter_labels.items():
+                result["counters"].setdefault(name, {})[_format_labels(labels)] = value
 
             return result
 
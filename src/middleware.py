@@ -3,9 +3,8 @@ FastAPI middleware — rate limiting (Supabase-backed), request logging, metrics
 """
 
 import time
-from collections import defaultdict
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List
+from typing import Dict, Set, Tuple
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -15,7 +14,7 @@ from .metrics import metrics
 
 
 # ═══════════════════════════════════════════════════════════
-# IP-based Sliding-Window Rate Limiter (Supabase-persisted)
+# IP-based Fixed-Window Rate Limiter (Supabase-persisted)
 # ═══════════════════════════════════════════════════════════
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
@@ -23,15 +22,16 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     Rate limiter that persists hit counts to Supabase.
 
     Architecture:
-      - In-memory dict is the fast-path (avoids DB query on every request)
+      - In-memory counters are the fast-path (avoids DB query on every request):
+        one integer per (IP, window) pair, incremented once per request
       - Every hit is ALSO recorded in Supabase `rate_limits` table
       - On startup (fresh memory), the first request from an IP loads its
-        recent hit count from Supabase, so limits survive restarts
+        hit count for the current window from Supabase, so limits survive restarts
       - Old rate_limit rows are cleaned up periodically
 
     Parameters:
         max_requests:   Max allowed requests within the window.
-        window_seconds: Length of the sliding window.
+        window_seconds: Length of each fixed window.
         exclude_paths:  Paths that should never be rate-limited.
     """
 
@@ -46,32 +46,46 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
         self.exclude_paths = exclude_paths
-        # ip -> list of request timestamps (in-memory fast path)
-        self._hits: Dict[str, List[float]] = defaultdict(list)
+        # (ip, window index) -> request count (in-memory fast path)
+        self._buckets: Dict[Tuple[str, int], int] = {}
+        # Window index of the last stale-bucket sweep
+        self._swept_window = -1
         # Track which IPs we've loaded from DB (to avoid repeated DB lookups)
-        self._loaded_from_db: set = set()
+        self._loaded_from_db: Set[str] = set()
         # Periodic cleanup tracker
         self._last_cleanup = time.time()
         self._cleanup_interval = 600  # Clean up DB every 10 minutes
 
     def _client_ip(self, request: Request) -> str:
         """Extract client IP (supports X-Forwarded-For behind a proxy)."""
-        forwarded = request.headers.get("x-forwarded-for")
-        if forwarded:
-            return forwarded.split(",")[0].strip()
-        return request.client.host if request.client else "unknown"
-
-    def _prune(self, ip: str, now: float) -> None:
-        """Remove timestamps older than the window."""
-        cutoff = now - self.window_seconds
-        self._hits[ip] = [t for t in self._hits[ip] if t > cutoff]
-        # Garbage-collect empty entries
-        if not self._hits[ip]:
-            del self._hits[ip]
-            self._loaded_from_db.discard(ip)
-
-    def _load_from_db(self, ip: str) -> None:
-        """Load hit count from Supabase for an IP we haven't seen since restart."""
+        # Scan the raw ASGI header list: ASGI lowercases names already, and
+        # only the first hop is needed, so skip building Headers and split()
+        for name, value in request.scope["headers"]:
+            if name == b"x-forwarded-for":
+                if value:
+                    end = value.find(b",")
+                    return (value[:end] if end >= 0 else value).strip().decode("latin-1")
+                break
+        client = request.scope.get("client")
+        return client[0] if client else "unknown"
+
+    def _window(self, now: float) -> int:
+        """Index of the fixed window containing ``now``."""
+        return int(now // self.window_seconds)
+
+    def _sweep(self, window: int) -> None:
+        """Drop counters from past windows (runs once per window)."""
+        if window == self._swept_window:
+            return
+        self._swept_window = window
+        stale = [key for key in self._buckets if key[1] != window]
+        for key in stale:
+            del self._buckets[key]
+        # IPs without a live counter reload from the DB on their next request
+        self._loaded_from_db = {ip for ip in self._loaded_from_db if (ip, window) in self._buckets}
+
+    def _load_from_db(self, ip: str, window: int) -> None:
+        """Load the current window's hit count from Supabase for an unseen IP."""
         if ip in self._loaded_from_db:
             return
         self._loaded_from_db.add(ip)
@@ -80,14 +94,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             from .db import count_rate_limit_hits, is_db_enabled
             if not is_db_enabled():
                 return
-            since = datetime.now(timezone.utc) - timedelta(seconds=self.window_seconds)
+            since = datetime.fromtimestamp(window * self.window_seconds, tz=timezone.utc)
             count = count_rate_limit_hits(ip, since.isoformat())
             if count > 0:
-                # Backfill in-memory with approximate timestamps
-                now = time.time()
-                step = self.window_seconds / max(count, 1)
-                for i in range(count):
-                    self._hits[ip].append(now - (count - i) * step)
+                key = (ip, window)
+                self._buckets[key] = max(self._buckets.get(key, 0), count)
                 logger.debug("Loaded %d rate-limit hits from DB for IP %s", count, ip)
         except Exception as exc:
             logger.debug("Rate limit DB load failed for %s: %s", ip, exc)
@@ -127,18 +138,20 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         ip = self._client_ip(request)
         now = time.time()
+        window = self._window(now)
+        self._sweep(window)
 
         # Load from DB if first time seeing this IP since restart
-        self._load_from_db(ip)
-
-        self._prune(ip, now)
+        self._load_from_db(ip, window)
 
-        if len(self._hits[ip]) >= self.max_requests:
-            remaining_seconds = int(self.window_seconds - (now - self._hits[ip][0]))
+        key = (ip, window)
+        count = self._buckets.get(key, 0)
+        if count >= self.max_requests:
+            remaining_seconds = int((window + 1) * self.window_seconds - now)
             logger.warning(
                 "Rate limit exceeded for %s — %d requests in window",
                 ip,
-                len(self._hits[ip]),
+                count,
                 extra={"endpoint": path},
             )
             return Response(
@@ -148,7 +161,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 headers={"Retry-After": str(remaining_seconds)},
             )
 
-        self._hits[ip].append(now)
+        self._buckets[key] = count + 1
 
         # Persist hit to Supabase
         self._record_hit_db(ip, path)
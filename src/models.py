@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 from datetime import datetime
 
 from pydantic import BaseModel, Field
@@ -65,6 +65,15 @@ class Certification(BaseModel):
     year: str = Field(default="", description="Year obtained")
 
 
+# Nested list fields of ResumeData and the model each item is built as
+_RESUME_NESTED_MODELS = {
+    "education": Education,
+    "experience": Experience,
+    "projects": Project,
+    "certifications": Certification,
+}
+
+
 class ResumeData(BaseModel):
     """Structured resume data extracted from uploaded resume file."""
     name: str = Field(..., description="Full name")
@@ -82,6 +91,23 @@ class ResumeData(BaseModel):
     projects: List[Project] = Field(default_factory=list, description="Projects")
     certifications: List[Certification] = Field(default_factory=list, description="Certifications")
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "ResumeData":
+        """
+        Build a ResumeData from parser output without re-running validation.
+
+        Only for dicts produced by our own parsers — external input
+        (uploads, Supabase rows) must still go through ResumeData(**data).
+        """
+        fields = dict(data)
+        for key, model in _RESUME_NESTED_MODELS.items():
+            if key in fields:
+                fields[key] = [
+                    item if isinstance(item, model) else model.model_construct(**item)
+                    for item in fields[key]
+                ]
+        return cls.model_construct(**fields)
+
 
 # ═══════════════════════════════════════════════════════════════
 # ATS Analysis Models
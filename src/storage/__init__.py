@@ -17,18 +17,25 @@ Usage:
     files = storage.list_files("resumes/")
 """
 
+import threading
+
 from .base import StorageBackend
 from .local import LocalStorage
 
 # Lazy import to avoid requiring boto3 when not using S3
 _storage_instance = None
+_storage_lock = threading.Lock()
 
 
 def get_storage() -> StorageBackend:
     """Get the configured storage backend (singleton)."""
     global _storage_instance
     if _storage_instance is None:
-        _storage_instance = _create_storage()
+        # Double-checked so concurrent first calls build a single backend
+        # (each S3Storage creates its own boto3 session)
+        with _storage_lock:
+            if _storage_instance is None:
+                _storage_instance = _create_storage()
     return _storage_instance
 
 
@@ -53,9 +60,16 @@ def _create_storage() -> StorageBackend:
     return LocalStorage(base_dir=str(OUTPUT_DIR.parent))
 
 
+class _StorageProxy:
+    """Module-level stand-in that forwards to the backend, created on first use."""
+
+    def __getattr__(self, name: str):
+        return getattr(get_storage(), name)
+
+
 # Convenience alias
-storage = property(lambda self: get_storage())
+storage = _StorageProxy()
 
 
 # Re-export for type checking
-__all__ = ["StorageBackend", "LocalStorage", "get_storage"]
+__all__ = ["StorageBackend", "LocalStorage", "get_storage", "storage"]
@@ -4,11 +4,44 @@ Abstract storage backend interface.
 All storage implementations (local, S3, GCS, etc.) must implement this interface.
 """
 
+import asyncio
+import mimetypes
+import os
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from types import MappingProxyType
+from typing import BinaryIO, Dict, List, Optional
 from dataclasses import dataclass
 
 
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+# Extensions we serve, pinned so every backend agrees regardless of the
+# host's mime.types; anything else falls back to the mimetypes registry
+_CONTENT_TYPES = MappingProxyType({
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".doc": "application/msword",
+    ".tex": "application/x-tex",
+    ".txt": "text/plain",
+    ".json": "application/json",
+    ".html": "text/html",
+    ".css": "text/css",
+    ".js": "application/javascript",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".svg": "image/svg+xml",
+})
+
+
+def guess_content_type(key: str) -> str:
+    """Guess a MIME type from the extension of a storage key or path."""
+    ext = os.path.splitext(key)[1].lower()
+    content_type = _CONTENT_TYPES.get(ext)
+    if content_type is None:
+        content_type = mimetypes.types_map.get(ext, DEFAULT_CONTENT_TYPE)
+    return content_type
+
+
 @dataclass
 class StorageFile:
     """Metadata for a stored file."""
@@ -36,6 +69,18 @@ class StorageBackend(ABC):
         """
         ...
 
+    def save_stream(self, key: str, fileobj: BinaryIO, content_type: str = "application/octet-stream") -> str:
+        """
+        Save the remaining contents of a binary file object.
+
+        Backends that can copy without buffering the whole file in memory
+        should override this.
+
+        Returns:
+            Full path or URL to the saved file
+        """
+        return self.save(key, fileobj.read(), content_type)
+
     @abstractmethod
     def read(self, key: str) -> Optional[bytes]:
         """
@@ -62,11 +107,37 @@ class StorageBackend(ABC):
         """
         ...
 
+    def delete_many(self, keys: List[str]) -> Dict[str, bool]:
+        """
+        Delete several files from storage.
+
+        Backends with a bulk delete API should override this to avoid
+        one round-trip per key.
+
+        Args:
+            keys: Storage keys / paths
+
+        Returns:
+            Mapping of key to True if deleted, False if not found or failed
+        """
+        return {key: self.delete(key) for key in keys}
+
     @abstractmethod
     def exists(self, key: str) -> bool:
         """Check if a file exists in storage."""
         ...
 
+    def exists_many(self, keys: List[str]) -> Dict[str, bool]:
+        """
+        Check several keys at once.
+
+        Backends that can answer with a single listing should override this.
+
+        Returns:
+            Mapping of key to whether it exists
+        """
+        return {key: self.exists(key) for key in keys}
+
     @abstractmethod
     def list_files(self, prefix: str = "") -> List[StorageFile]:
         """
@@ -105,3 +176,19 @@ class StorageBackend(ABC):
             Filesystem path, or None for remote storage
         """
         ...
+
+    # ── Async variants (for use from the event loop) ──
+    # Default to running the blocking call on a worker thread; backends
+    # with a native async client can override these.
+
+    async def aread(self, key: str) -> Optional[bytes]:
+        """Async read() that doesn't block the event loop."""
+        return await asyncio.to_thread(self.read, key)
+
+    async def asave(self, key: str, data: bytes, content_type: str = "application/octet-stream") -> str:
+        """Async save() that doesn't block the event loop."""
+        return await asyncio.to_thread(self.save, key, data, content_type)
+
+    async def alist_files(self, prefix: str = "") -> List[StorageFile]:
+        """Async list_files() that doesn't block the event loop."""
+        return await asyncio.to_thread(self.list_files, prefix)
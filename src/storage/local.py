@@ -5,11 +5,14 @@ Stores files on the local disk. This is the default backend.
 """
 
 import os
+import shutil
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
 
-from .base import StorageBackend, StorageFile
+from .base import StorageBackend, StorageFile, guess_content_type
+
+COPY_BUFFER_SIZE = 1024 * 1024
 
 
 class LocalStorage(StorageBackend):
@@ -18,11 +21,18 @@ class LocalStorage(StorageBackend):
     def __init__(self, base_dir: str):
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # Resolved once: resolve() costs an lstat per path component
+        self._base_resolved = self.base_dir.resolve()
+        self._base_str = str(self._base_resolved)
+        self._base_prefix = os.path.join(self._base_str, "")
 
     def _resolve(self, key: str) -> Path:
         """Resolve a key to an absolute path (prevent path traversal)."""
-        resolved = (self.base_dir / key).resolve()
-        if not str(resolved).startswith(str(self.base_dir.resolve())):
+        resolved = (self._base_resolved / key).resolve()
+        path = str(resolved)
+        # Compare with a trailing separator so a sibling such as
+        # "<base>-other" is not mistaken for a child of the base
+        if path != self._base_str and not path.startswith(self._base_prefix):
             raise ValueError(f"Path traversal detected: {key}")
         return resolved
 
@@ -32,6 +42,37 @@ class LocalStorage(StorageBackend):
         path.write_bytes(data)
         return str(path)
 
+    def save_stream(self, key: str, fileobj: BinaryIO, content_type: str = "application/octet-stream") -> str:
+        path = self._resolve(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as out:
+            if not self._sendfile(fileobj, out):
+                shutil.copyfileobj(fileobj, out, COPY_BUFFER_SIZE)
+        return str(path)
+
+    @staticmethod
+    def _sendfile(src: BinaryIO, dst: BinaryIO) -> bool:
+        """Copy a real file in-kernel with os.sendfile; False if src isn't one."""
+        try:
+            src_fd = src.fileno()
+            offset = src.tell()
+            size = os.fstat(src_fd).st_size
+        except (AttributeError, OSError, ValueError):
+            return False  # in-memory buffer, pipe wrapper, ...
+        try:
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            # Unsupported for this pair, or failed midway: the caller's
+            # fallback copies whatever is left
+            src.seek(offset)
+            return False
+        src.seek(offset)
+        return True
+
     def read(self, key: str) -> Optional[bytes]:
         path = self._resolve(key)
         if path.exists() and path.is_file():
@@ -50,25 +91,35 @@ class LocalStorage(StorageBackend):
         return path.exists() and path.is_file()
 
     def list_files(self, prefix: str = "") -> List[StorageFile]:
-        search_dir = self._resolve(prefix) if prefix else self.base_dir
+        search_dir = self._resolve(prefix) if prefix else self._base_resolved
         if not search_dir.exists():
             return []
 
-        files = []
-        base_resolved = self.base_dir.resolve()
-
-        iterator = search_dir.rglob("*") if search_dir.is_dir() else [search_dir]
-        for path in iterator:
-            if path.is_file():
-                stat = path.stat()
-                relative_key = str(path.resolve().relative_to(base_resolved))
-                content_type = self._guess_content_type(path.suffix)
-                files.append(StorageFile(
-                    key=relative_key,
-                    size=stat.st_size,
-                    last_modified=stat.st_mtime,
-                    content_type=content_type,
-                ))
+        files: List[StorageFile] = []
+        base_len = len(self._base_prefix)
+
+        def add(path: str, stat: os.stat_result) -> None:
+            files.append(StorageFile(
+                key=path[base_len:],
+                size=stat.st_size,
+                last_modified=stat.st_mtime,
+                content_type=guess_content_type(path),
+            ))
+
+        def walk(directory: str) -> None:
+            # scandir hands back type info from the directory read itself,
+            # so only files cost a stat() call
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        walk(entry.path)
+                    elif entry.is_file():
+                        add(entry.path, entry.stat())
+
+        if search_dir.is_dir():
+            walk(str(search_dir))
+        elif search_dir.is_file():
+            add(str(search_dir), search_dir.stat())
 
         return sorted(files, key=lambda f: f.last_modified, reverse=True)
 
@@ -85,21 +136,3 @@ class LocalStorage(StorageBackend):
         if path.exists():
             return str(path)
         return None
-
-    @staticmethod
-    def _guess_content_type(suffix: str) -> str:
-        """Guess MIME type from file extension."""
-        types = {
-            ".pdf": "application/pdf",
-            ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            ".doc": "application/msword",
-            ".txt": "text/plain",
-            ".json": "application/json",
-            ".html": "text/html",
-            ".css": "text/css",
-            ".js": "application/javascript",
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".svg": "image/svg+xml",
-        }
-        return types.get(suffix.lower(), "application/octet-stream")
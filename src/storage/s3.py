@@ -13,13 +13,27 @@ Set these env vars:
 Or use IAM roles / instance profiles (recommended in production).
 """
 
+import io
+import os
 import time
-from typing import List, Optional
+from typing import BinaryIO, Dict, List, Optional
 
-from .base import StorageBackend, StorageFile
+from .base import StorageBackend, StorageFile, guess_content_type
+
+# S3 DeleteObjects accepts at most this many keys per request
+DELETE_BATCH_SIZE = 1000
+
+# exists_many lists at most this many pages before reverting to per-key HEADs
+EXISTS_LIST_MAX_PAGES = 5
+
+# Objects at least this large are uploaded as parallel multipart parts;
+# smaller ones (e.g. resume PDFs) stay a single put_object call.
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
     from botocore.exceptions import ClientError
     BOTO3_AVAILABLE = True
 except ImportError:
@@ -50,6 +64,19 @@ class S3Storage(StorageBackend):
             "s3",
             region_name=region,
             endpoint_url=endpoint_url,
+            # One client is shared by every request thread: size its pool for
+            # that, keep idle connections alive, and back off when throttled
+            config=Config(
+                max_pool_connections=50,
+                tcp_keepalive=True,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+            ),
+        )
+        self._transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_THRESHOLD,
+            max_concurrency=10,
+            use_threads=True,
         )
 
     def _full_key(self, key: str) -> str:
@@ -58,11 +85,33 @@ class S3Storage(StorageBackend):
 
     def save(self, key: str, data: bytes, content_type: str = "application/octet-stream") -> str:
         full_key = self._full_key(key)
-        self._s3.put_object(
-            Bucket=self.bucket,
-            Key=full_key,
-            Body=data,
-            ContentType=content_type,
+        if len(data) < MULTIPART_THRESHOLD:
+            self._s3.put_object(
+                Bucket=self.bucket,
+                Key=full_key,
+                Body=data,
+                ContentType=content_type,
+            )
+        else:
+            self._s3.upload_fileobj(
+                io.BytesIO(data),
+                self.bucket,
+                full_key,
+                ExtraArgs={"ContentType": content_type},
+                Config=self._transfer_config,
+            )
+        return f"s3://{self.bucket}/{full_key}"
+
+    def save_stream(self, key: str, fileobj: BinaryIO, content_type: str = "application/octet-stream") -> str:
+        # upload_fileobj reads in chunks and switches to multipart past the
+        # threshold, so the file never has to fit in memory
+        full_key = self._full_key(key)
+        self._s3.upload_fileobj(
+            fileobj,
+            self.bucket,
+            full_key,
+            ExtraArgs={"ContentType": content_type},
+            Config=self._transfer_config,
         )
         return f"s3://{self.bucket}/{full_key}"
 
@@ -82,12 +131,60 @@ class S3Storage(StorageBackend):
         except ClientError:
             return False
 
+    def delete_many(self, keys: List[str]) -> Dict[str, bool]:
+        """Delete keys with DeleteObjects — one request per 1000 keys."""
+        results: Dict[str, bool] = {}
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            batch = keys[start:start + DELETE_BATCH_SIZE]
+            by_full_key = {self._full_key(key): key for key in batch}
+            try:
+                response = self._s3.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={"Objects": [{"Key": k} for k in by_full_key], "Quiet": True},
+                )
+            except ClientError:
+                results.update((key, False) for key in batch)
+                continue
+            failed = {by_full_key.get(err.get("Key")) for err in response.get("Errors", [])}
+            results.update((key, key not in failed) for key in batch)
+        return results
+
     def exists(self, key: str) -> bool:
+        full_key = self._full_key(key)
         try:
-            self._s3.head_object(Bucket=self.bucket, Key=self._full_key(key))
+            self._s3.head_object(Bucket=self.bucket, Key=full_key)
             return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in ("403", "AccessDenied"):
+                return False
+        # HEAD needs s3:GetObject; least-privilege roles may only allow listing
+        try:
+            response = self._s3.list_objects_v2(Bucket=self.bucket, Prefix=full_key, MaxKeys=1)
         except ClientError:
             return False
+        contents = response.get("Contents", [])
+        return bool(contents) and contents[0]["Key"] == full_key
+
+    def exists_many(self, keys: List[str]) -> Dict[str, bool]:
+        """Check keys by listing their common prefix — one request per 1000 objects.
+
+        Keys spread across directories share too short a prefix to list
+        cheaply, so those (and listings that run past EXISTS_LIST_MAX_PAGES)
+        fall back to one exists() call per key.
+        """
+        if not keys:
+            return {}
+        common = os.path.commonprefix(keys)
+        if any(len(common) < len(key.rpartition("/")[0]) for key in keys):
+            return {key: self.exists(key) for key in keys}
+        found = set()
+        paginator = self._s3.get_paginator("list_objects_v2")
+        pages = paginator.paginate(Bucket=self.bucket, Prefix=self._full_key(common))
+        for page_number, page in enumerate(pages, start=1):
+            if page_number > EXISTS_LIST_MAX_PAGES:
+                return {key: self.exists(key) for key in keys}
+            found.update(obj["Key"] for obj in page.get("Contents", []))
+        return {key: self._full_key(key) in found for key in keys}
 
     def list_files(self, prefix: str = "") -> List[StorageFile]:
         full_prefix = self._full_key(prefix)
@@ -105,7 +202,7 @@ class S3Storage(StorageBackend):
                     key=relative_key,
                     size=obj["Size"],
                     last_modified=obj["LastModified"].timestamp(),
-                    content_type=self._guess_content_type(relative_key),
+                    content_type=guess_content_type(relative_key),
                 ))
 
         return sorted(files, key=lambda f: f.last_modified, reverse=True)
@@ -125,15 +222,3 @@ class S3Storage(StorageBackend):
     def get_path(self, key: str) -> Optional[str]:
         """S3 doesn't have local paths — return None."""
         return None
-
-    @staticmethod
-    def _guess_content_type(key: str) -> str:
-        """Guess MIME type from key extension."""
-        ext = key.rsplit(".", 1)[-1].lower() if "." in key else ""
-        types = {
-            "pdf": "application/pdf",
-            "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            "txt": "text/plain",
-            "json": "application/json",
-        }
-        return types.get(ext, "application/octet-stream")
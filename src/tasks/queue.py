@@ -23,10 +23,12 @@ Usage:
 import asyncio
 import time
 import traceback
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Coroutine, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Coroutine, Deque, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from ..logger import logger
@@ -40,6 +42,10 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+_TERMINAL_TASK_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+
 @dataclass
 class TaskResult:
     """Result of a completed (or failed) task."""
@@ -67,6 +73,47 @@ class _TaskEntry:
     started_at: float = 0.0
     completed_at: float = 0.0
     asyncio_task: Optional[asyncio.Task] = None
+    # Created on the first wait(); resolved once the task finishes
+    done: Optional[asyncio.Future] = None
+    # Built on first read once the task has finished (it can't change after)
+    result_snapshot: Optional[TaskResult] = None
+    listing_snapshot: Optional[TaskResult] = None
+
+    def snapshot(self, include_result: bool = True) -> TaskResult:
+        """Public view of this entry; cached once the task has finished."""
+        cached = self.result_snapshot if include_result else self.listing_snapshot
+        if cached is not None:
+            return cached
+
+        view = TaskResult(
+            task_id=self.task_id,
+            status=self.status,
+            result=self.result if include_result and self.status == TaskStatus.COMPLETED else None,
+            error=self.error,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            completed_at=self.completed_at,
+            duration_seconds=round(
+                (self.completed_at - self.started_at) if self.completed_at else 0, 3
+            ),
+        )
+        if self.completed_at and self.status in _TERMINAL_TASK_STATUSES:
+            if include_result:
+                self.result_snapshot = view
+            else:
+                self.listing_snapshot = view
+        return view
+
+    def invalidate_snapshots(self) -> None:
+        self.result_snapshot = None
+        self.listing_snapshot = None
+
+
+# Under memory pressure the result TTL shrinks, but not below this
+MIN_RESULT_TTL = 60
+
+DB_CACHE_SIZE = 1024
+DB_CACHE_TTL = 5.0  # seconds, for rows of tasks that may still change
 
 
 def _now_iso() -> str:
@@ -77,44 +124,148 @@ class TaskQueue:
     """
     Async task queue with Supabase persistence.
 
-    - Tasks run in-process via asyncio
-    - State is persisted to Supabase `tasks` table
+    - Tasks run in-process on ``max_concurrency`` worker coroutines that
+      pull from a FIFO queue; the worker count is the only concurrency limit
+    - State is persisted to Supabase `tasks` table in batches: status
+      changes are coalesced per task and flushed every ``flush_interval``
+      seconds, or sooner once ``buffer_size`` tasks are waiting
     - On cache miss, falls back to Supabase lookup
     - On startup, stale tasks are marked as failed
     """
 
-    def __init__(self, max_concurrency: int = 3, result_ttl_seconds: int = 3600):
+    def __init__(
+        self,
+        max_concurrency: int = 3,
+        result_ttl_seconds: int = 3600,
+        buffer_size: int = 50,
+        flush_interval: float = 0.5,
+        max_pending: int = 1000,
+        max_tasks: int = 10000,
+    ):
         self._tasks: Dict[str, _TaskEntry] = {}
-        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._max_concurrency = max_concurrency
         self._result_ttl = result_ttl_seconds
-
-    def _get_semaphore(self) -> asyncio.Semaphore:
-        """Lazily create semaphore in the current event loop."""
-        if self._semaphore is None:
-            self._semaphore = asyncio.Semaphore(self._max_concurrency)
-        return self._semaphore
-
-    def _persist_new(self, task_id: str, func_name: str) -> None:
-        """Persist a new task to Supabase (fire-and-forget)."""
-        try:
-            from ..db import save_task
-            save_task(task_id=task_id, func_name=func_name, status="pending")
-        except Exception:
-            pass  # DB persistence is best-effort
+        # Soft cap on in-memory entries: between 70% and 90% of it the
+        # result TTL scales down linearly (see _effective_ttl)
+        self._pressure_low = 0.7 * max_tasks
+        self._pressure_high = 0.9 * max_tasks
+        # Latest unsaved row per task_id, written by the flusher
+        self._dirty: Dict[str, dict] = {}
+        # Last state handed to _dirty per task, to drop no-op updates
+        self._last_persisted: Dict[str, tuple] = {}
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._flush_wakeup: Optional[asyncio.Event] = None
+        self._flushed: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        # Read-through cache for Supabase lookups of tasks not in memory
+        # (e.g. from a previous run), so status polling doesn't hit the DB
+        self._db_cache: OrderedDict[str, tuple] = OrderedDict()
+        # Kept in step with _tasks so stats doesn't scan every entry
+        self._status_counts: Dict[TaskStatus, int] = defaultdict(int)
+        # (completed_at, task_id) in completion order, for TTL cleanup
+        self._expiry_queue: Deque[Tuple[float, str]] = deque()
+
+    def _ensure_workers(self) -> asyncio.Queue:
+        """Lazily create the queue and worker pool in the current event loop."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._workers = [
+                asyncio.create_task(self._worker_loop(self._queue))
+                for _ in range(self._max_concurrency)
+            ]
+            self._flush_wakeup = asyncio.Event()
+            self._flushed = asyncio.Event()
+            self._flusher = asyncio.create_task(self._flush_loop(self._flush_wakeup))
+        return self._queue
+
+    async def _worker_loop(self, queue: asyncio.Queue) -> None:
+        """Run queued tasks one at a time until cancelled."""
+        while True:
+            entry = await queue.get()
+            try:
+                await self._run(entry)
+            finally:
+                queue.task_done()
+
+    def _set_status(self, entry: _TaskEntry, status: TaskStatus) -> None:
+        """Move a tracked entry to a new status, keeping the counters in step."""
+        if self._tasks.get(entry.task_id) is entry:
+            self._status_counts[entry.status] -= 1
+            self._status_counts[status] += 1
+        entry.status = status
+        entry.invalidate_snapshots()
+
+    def _mark_completed(self, entry: _TaskEntry) -> None:
+        """Stamp completed_at and schedule the entry for TTL cleanup."""
+        entry.completed_at = time.time()
+        entry.invalidate_snapshots()
+        self._expiry_queue.append((entry.completed_at, entry.task_id))
+        if entry.done is not None and not entry.done.done():
+            entry.done.set_result(None)
+
+    def _forget(self, task_id: str) -> None:
+        """Drop an entry from memory."""
+        entry = self._tasks.pop(task_id, None)
+        if entry is not None:
+            self._status_counts[entry.status] -= 1
+        self._last_persisted.pop(task_id, None)
 
     def _persist_update(self, entry: _TaskEntry) -> None:
-        """Persist task status update to Supabase (fire-and-forget)."""
+        """Queue the task's current state for the next batched write."""
+        state = (entry.status, entry.started_at, entry.completed_at, entry.error)
+        if self._last_persisted.get(entry.task_id) == state:
+            return  # Nothing changed since the last write
+        self._last_persisted[entry.task_id] = state
+        self._db_cache.pop(entry.task_id, None)
+        self._dirty[entry.task_id] = {
+            "task_id": entry.task_id,
+            "func_name": getattr(entry.func, "__name__", ""),
+            "status": entry.status.value,
+            "result": entry.result if entry.status == TaskStatus.COMPLETED else None,
+            "error": entry.error,
+            # Raw epochs: formatted once per flushed row, off the event loop
+            "created_at": entry.created_at,
+            "started_at": entry.started_at or None,
+            "completed_at": entry.completed_at or None,
+        }
+        if len(self._dirty) >= self._buffer_size and self._flush_wakeup is not None:
+            self._flush_wakeup.set()
+
+    async def _flush_loop(self, wakeup: asyncio.Event) -> None:
+        """Write buffered task rows every flush_interval (or when the buffer fills)."""
+        while True:
+            try:
+                await asyncio.wait_for(wakeup.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            await self._flush_now()
+            # Release submitters waiting on buffer space
+            self._flushed.set()
+            self._flushed = asyncio.Event()
+
+    async def _wait_for_buffer_space(self) -> None:
+        """Back-pressure: hold submissions while max_pending rows are unsaved."""
+        while len(self._dirty) >= self._max_pending:
+            self._flush_wakeup.set()
+            await self._flushed.wait()
+
+    async def _flush_now(self) -> None:
+        """Write every buffered row in a single upsert."""
+        if not self._dirty:
+            return
+        rows, self._dirty = list(self._dirty.values()), {}
         try:
-            from ..db import update_task
-            update_task(
-                task_id=entry.task_id,
-                status=entry.status.value,
-                result=entry.result if entry.status == TaskStatus.COMPLETED else None,
-                error=entry.error,
-                started_at=datetime.fromtimestamp(entry.started_at, tz=timezone.utc).isoformat() if entry.started_at else None,
-                completed_at=datetime.fromtimestamp(entry.completed_at, tz=timezone.utc).isoformat() if entry.completed_at else None,
-            )
+            from ..db import upsert_tasks_batch
+            # The Supabase client is synchronous; keep it off the event loop
+            await asyncio.to_thread(upsert_tasks_batch, rows)
         except Exception:
             pass  # DB persistence is best-effort
 
@@ -134,53 +285,123 @@ class TaskQueue:
         if task_id is None:
             task_id = f"task_{uuid4().hex[:12]}"
 
+        # A slow database delays new work instead of growing the buffer
+        queue = self._ensure_workers()
+        await self._wait_for_buffer_space()
+
         entry = _TaskEntry(
             task_id=task_id,
             func=func,
             args=args,
             kwargs=kwargs,
         )
+        if len(self._tasks) >= self._pressure_low:
+            self.cleanup_old_tasks()
+
+        # _tasks is kept in submission (= created_at) order; re-inserting
+        # moves a reused task_id to the newest end
+        self._forget(task_id)
         self._tasks[task_id] = entry
+        self._status_counts[entry.status] += 1
 
         # Persist to Supabase
-        self._persist_new(task_id, func.__name__)
+        self._persist_update(entry)
 
-        # Schedule execution
-        entry.asyncio_task = asyncio.create_task(self._execute(entry))
+        # Hand off to the worker pool; nothing runs (or is allocated) for the
+        # entry beyond this until a worker is free
+        queue.put_nowait(entry)
 
         logger.info("Task submitted: %s (%s)", task_id, func.__name__)
         return task_id
 
-    async def _execute(self, entry: _TaskEntry) -> None:
-        """Execute a task with concurrency control."""
-        async with self._get_semaphore():
-            entry.status = TaskStatus.RUNNING
-            entry.started_at = time.time()
+    async def _run(self, entry: _TaskEntry) -> None:
+        """Execute a task on the calling worker."""
+        if entry.status != TaskStatus.PENDING:
+            return  # Cancelled while still queued
+
+        self._set_status(entry, TaskStatus.RUNNING)
+        entry.started_at = time.time()
+        self._persist_update(entry)
+
+        # Run as a child task so cancel() can stop this task alone
+        entry.asyncio_task = asyncio.create_task(entry.func(*entry.args, **entry.kwargs))
+        try:
+            entry.result = await entry.asyncio_task
+            self._set_status(entry, TaskStatus.COMPLETED)
+            logger.info(
+                "Task completed: %s (%.2fs)",
+                entry.task_id,
+                time.time() - entry.started_at,
+            )
+        except asyncio.CancelledError:
+            self._set_status(entry, TaskStatus.CANCELLED)
+            logger.warning("Task cancelled: %s", entry.task_id)
+            if asyncio.current_task().cancelling():
+                raise  # The worker itself is being shut down
+        except Exception as exc:
+            self._set_status(entry, TaskStatus.FAILED)
+            entry.error = f"{type(exc).__name__}: {exc}"
+            logger.error(
+                "Task failed: %s — %s",
+                entry.task_id,
+                entry.error,
+                exc_info=True,
+            )
+        finally:
+            entry.asyncio_task = None
+            self._mark_completed(entry)
             self._persist_update(entry)
 
-            try:
-                entry.result = await entry.func(*entry.args, **entry.kwargs)
-                entry.status = TaskStatus.COMPLETED
-                logger.info(
-                    "Task completed: %s (%.2fs)",
-                    entry.task_id,
-                    time.time() - entry.started_at,
-                )
-            except asyncio.CancelledError:
-                entry.status = TaskStatus.CANCELLED
-                logger.warning("Task cancelled: %s", entry.task_id)
-            except Exception as exc:
-                entry.status = TaskStatus.FAILED
-                entry.error = f"{type(exc).__name__}: {exc}"
-                logger.error(
-                    "Task failed: %s — %s",
-                    entry.task_id,
-                    entry.error,
-                    exc_info=True,
-                )
-            finally:
-                entry.completed_at = time.time()
+    async def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for queued tasks to finish, then stop the workers.
+
+        Tasks still running after ``timeout`` seconds are cancelled.
+        """
+        if self._queue is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Task queue shutdown timed out; cancelling remaining tasks")
+        for entry in self._tasks.values():
+            if entry.status == TaskStatus.PENDING:
+                self._set_status(entry, TaskStatus.CANCELLED)
+                self._mark_completed(entry)
                 self._persist_update(entry)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._flusher.cancel()
+        await asyncio.gather(self._flusher, return_exceptions=True)
+        await self._flush_now()
+        self._queue = None
+        self._workers = []
+        self._flusher = None
+        self._flush_wakeup = None
+        self._flushed = None
+        self._loop = None
+
+    def _get_task_row(self, task_id: str) -> Optional[Dict]:
+        """Fetch a task row from Supabase through the LRU cache."""
+        cached = self._db_cache.get(task_id)
+        if cached is not None:
+            fetched_at, row = cached
+            # Finished tasks never change again, so only live ones expire
+            if row["status"] in _TERMINAL_STATUSES or time.monotonic() - fetched_at < DB_CACHE_TTL:
+                self._db_cache.move_to_end(task_id)
+                return row
+
+        from ..db import get_task_db
+        row = get_task_db(task_id)
+        if row:
+            self._db_cache[task_id] = (time.monotonic(), row)
+            self._db_cache.move_to_end(task_id)
+            if len(self._db_cache) > DB_CACHE_SIZE:
+                self._db_cache.popitem(last=False)
+        else:
+            self._db_cache.pop(task_id, None)
+        return row
 
     def get_status(self, task_id: str) -> Optional[TaskStatus]:
         """Get the current status of a task (memory first, then Supabase)."""
@@ -191,8 +412,7 @@ class TaskQueue:
 
         # Fall back to Supabase
         try:
-            from ..db import get_task_db
-            row = get_task_db(task_id)
+            row = self._get_task_row(task_id)
             if row:
                 return TaskStatus(row["status"])
         except Exception:
@@ -205,23 +425,11 @@ class TaskQueue:
         # Check in-memory first
         entry = self._tasks.get(task_id)
         if entry:
-            return TaskResult(
-                task_id=entry.task_id,
-                status=entry.status,
-                result=entry.result if entry.status == TaskStatus.COMPLETED else None,
-                error=entry.error,
-                created_at=entry.created_at,
-                started_at=entry.started_at,
-                completed_at=entry.completed_at,
-                duration_seconds=round(
-                    (entry.completed_at - entry.started_at) if entry.completed_at else 0, 3
-                ),
-            )
+            return entry.snapshot()
 
         # Fall back to Supabase
         try:
-            from ..db import get_task_db
-            row = get_task_db(task_id)
+            row = self._get_task_row(task_id)
             if row:
                 return TaskResult(
                     task_id=row["task_id"],
@@ -238,6 +446,25 @@ class TaskQueue:
 
         return None
 
+    async def wait(self, task_id: str, timeout: Optional[float] = None) -> Optional[TaskResult]:
+        """
+        Wait for a task to finish and return its result.
+
+        Resolved by the worker when the task completes, fails or is
+        cancelled, so callers don't poll. Tasks no longer in memory are
+        looked up like get_result(). Raises asyncio.TimeoutError if the
+        task is still running after ``timeout`` seconds.
+        """
+        entry = self._tasks.get(task_id)
+        if entry is None:
+            return self.get_result(task_id)
+        if not entry.completed_at:
+            if entry.done is None:
+                entry.done = asyncio.get_running_loop().create_future()
+            # Shielded so one caller's timeout doesn't cancel it for the rest
+            await asyncio.wait_for(asyncio.shield(entry.done), timeout)
+        return entry.snapshot()
+
     async def cancel(self, task_id: str) -> bool:
         """Cancel a running or pending task."""
         entry = self._tasks.get(task_id)
@@ -247,8 +474,8 @@ class TaskQueue:
         if entry.status in (TaskStatus.PENDING, TaskStatus.RUNNING):
             if entry.asyncio_task:
                 entry.asyncio_task.cancel()
-            entry.status = TaskStatus.CANCELLED
-            entry.completed_at = time.time()
+            self._set_status(entry, TaskStatus.CANCELLED)
+            self._mark_completed(entry)
             self._persist_update(entry)
             return True
 
@@ -260,29 +487,15 @@ class TaskQueue:
         limit: int = 50,
     ) -> List[TaskResult]:
         """List tasks from memory. For historical tasks, use list_tasks_from_db()."""
-        entries = list(self._tasks.values())
+        # Newest first: walk the insertion-ordered dict backwards and stop
+        # after `limit` matches instead of copying and sorting every entry
+        entries = reversed(self._tasks.values())
         if status:
-            entries = [e for e in entries if e.status == status]
-
-        # Sort by created_at descending
-        entries.sort(key=lambda e: e.created_at, reverse=True)
-        entries = entries[:limit]
-
-        return [
-            TaskResult(
-                task_id=e.task_id,
-                status=e.status,
-                result=None,  # Don't include large results in listing
-                error=e.error,
-                created_at=e.created_at,
-                started_at=e.started_at,
-                completed_at=e.completed_at,
-                duration_seconds=round(
-                    (e.completed_at - e.started_at) if e.completed_at else 0, 3
-                ),
-            )
-            for e in entries
-        ]
+            entries = (e for e in entries if e.status == status)
+        entries = islice(entries, limit)
+
+        # Don't include large results in listing
+        return [e.snapshot(include_result=False) for e in entries]
 
     def list_tasks_from_db(
         self,
@@ -296,20 +509,35 @@ class TaskQueue:
         except Exception:
             return []
 
+    def _effective_ttl(self) -> float:
+        """Result TTL, shortened as the in-memory task count nears max_tasks."""
+        pressure = (len(self._tasks) - self._pressure_low) / (self._pressure_high - self._pressure_low)
+        if pressure <= 0:
+            return self._result_ttl
+        scaled = self._result_ttl * (1 - min(pressure, 1.0))
+        return max(min(self._result_ttl, MIN_RESULT_TTL), scaled)
+
     def cleanup_old_tasks(self) -> int:
         """Remove completed/failed tasks older than TTL from memory."""
-        now = time.time()
-        to_remove = []
-
-        for task_id, entry in self._tasks.items():
-            if entry.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED):
-                if entry.completed_at and (now - entry.completed_at) > self._result_ttl:
-                    to_remove.append(task_id)
-
-        for task_id in to_remove:
-            del self._tasks[task_id]
-
-        return len(to_remove)
+        cutoff = time.time() - self._effective_ttl()
+        removed = 0
+
+        # Completion times are appended in order, so only the expired
+        # prefix of the deque is ever looked at
+        while self._expiry_queue and self._expiry_queue[0][0] < cutoff:
+            completed_at, task_id = self._expiry_queue.popleft()
+            entry = self._tasks.get(task_id)
+            # Skip stale records: the entry was replaced, re-stamped (a
+            # cancel followed by the worker finishing), or already removed
+            if (
+                entry is not None
+                and entry.completed_at == completed_at
+                and entry.status in _TERMINAL_TASK_STATUSES
+            ):
+                self._forget(task_id)
+                removed += 1
+
+        return removed
 
     def startup_cleanup(self) -> None:
         """Mark stale tasks from previous server run as failed. Call on app startup."""
@@ -322,12 +550,11 @@ class TaskQueue:
     @property
     def stats(self) -> dict:
         """Get queue statistics."""
-        statuses = {}
-        for entry in self._tasks.values():
-            statuses[entry.status.value] = statuses.get(entry.status.value, 0) + 1
+        statuses = {status.value: count for status, count in self._status_counts.items() if count}
 
         return {
             "total_tasks": len(self._tasks),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
             "max_concurrency": self._max_concurrency,
             "by_status": statuses,
         }
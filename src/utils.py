@@ -1,6 +1,16 @@
-from typing import Iterable, List
+import json
+import re
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Union
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+
+@lru_cache(maxsize=4096)
 def normalize_keyword(keyword: str) -> str:
     """Basic normalization for keywords before inserting into resume."""
     cleaned = keyword.strip()
@@ -10,14 +20,56 @@ def normalize_keyword(keyword: str) -> str:
     return cleaned.replace("_", " ").strip()
 
 
-def deduplicate_preserve_order(items: Iterable[str]) -> List[str]:
-    """Remove duplicates while preserving the original order."""
+def deduplicate_preserve_order(items: Iterable[str], limit: Optional[int] = None) -> List[str]:
+    """Remove duplicates while preserving the original order, stopping at ``limit`` items."""
+    if limit is None:
+        # Whole input consumed anyway: let dict do the loop in C
+        return list(dict.fromkeys(filter(None, items)))
     seen = set()
     result: List[str] = []
     for item in items:
         if item and item not in seen:
             seen.add(item)
             result.append(item)
+            if len(result) >= limit:
+                break
+    return result
+
+
+def normalize_keywords(keywords: Iterable, limit: Optional[int] = None) -> List[str]:
+    """Normalize and deduplicate keywords in a single pass, preserving order."""
+    seen = set()
+    result: List[str] = []
+    for keyword in keywords:
+        if not keyword:
+            continue
+        normalized = normalize_keyword(str(keyword))
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            result.append(normalized)
+            if limit is not None and len(result) >= limit:
+                break
     return result
 
 
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(text: str, limit: Optional[int] = None) -> List[str]:
+    """Split prose into sentences, each ending in terminal punctuation."""
+    # maxsplit stops scanning after the last sentence we keep; the unsplit
+    # tail lands in the final element and is sliced off
+    sentences = [s for s in _SENTENCE_BREAK.split(text.strip(), maxsplit=limit or 0) if s][:limit]
+    return [s if s[-1] in ".!?" else f"{s}." for s in sentences]
+
+
+def json_loads(raw: Union[str, bytes]) -> Any:
+    """
+    Parse JSON, using orjson when it's installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+    catching the stdlib exception either way.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -4,7 +4,6 @@ Railway startup script that reads PORT from environment variable.
 """
 import os
 import sys
-import subprocess
 
 # Get PORT from environment (Railway sets this automatically)
 port = os.getenv("PORT", "8000")
@@ -21,6 +20,7 @@ cmd = [
     str(port)
 ]
 
-# Execute the command
-sys.exit(subprocess.run(cmd).returncode)
+# Replace this process with uvicorn: no idle parent interpreter, and
+# SIGTERM from the platform reaches uvicorn directly
+os.execv(sys.executable, cmd)
 
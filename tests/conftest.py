@@ -26,6 +26,21 @@ os.environ.setdefault("SUPABASE_ANON_KEY", "")
 os.environ.setdefault("DEBUG", "true")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _prewarm_imports():
+    """Import the app's heavy modules once, before the first test runs.
+
+    Set PYTEST_DISABLE_PREWARM=1 to measure cold-import cost instead.
+    """
+    if os.environ.get("PYTEST_DISABLE_PREWARM"):
+        return
+    import src.main
+    import src.models
+    import src.api.deps
+    import src.llm.client_async
+    import src.core.ats_scorer
+
+
 # ── App / Client Fixtures ──────────────────────────────
 
 @pytest.fixture(scope="session")
@@ -35,18 +50,22 @@ def app():
     return fastapi_app
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def client(app) -> Generator:
-    """FastAPI test client — no real server needed."""
+    """FastAPI test client — no real server needed.
+
+    Session-scoped so the app's startup/shutdown runs once for the whole
+    suite; per-test state (e.g. session_with_resume) cleans up after itself.
+    """
     with TestClient(app) as c:
         yield c
 
 
 # ── Resume Data Fixtures ───────────────────────────────
 
-@pytest.fixture()
-def sample_resume_data():
-    """A realistic ResumeData object for testing."""
+@pytest.fixture(scope="session")
+def _sample_resume_template():
+    """Built and validated once; tests get deep copies via sample_resume_data."""
     from src.models import ResumeData, Education, Experience, Project, Certification
 
     return ResumeData(
@@ -123,6 +142,12 @@ def sample_resume_data():
     )
 
 
+@pytest.fixture()
+def sample_resume_data(_sample_resume_template):
+    """A realistic ResumeData object for testing (safe to mutate)."""
+    return _sample_resume_template.model_copy(deep=True)
+
+
 @pytest.fixture()
 def sample_job_description():
     """A realistic software engineer job description."""
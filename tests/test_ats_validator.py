@@ -5,6 +5,7 @@ from src.core.ats_validator import (
     validate_resume_output,
     sanitize_for_ats,
     ATSValidationResult,
+    ATS_BREAKING_CHARS,
 )
 from src.models import ResumeData
 
@@ -107,6 +108,12 @@ class TestValidateResumeOutput:
         )
         assert has_char_issue
 
+    def test_breaking_chars_are_non_ascii(self):
+        """The special-character check skips pure-ASCII text outright."""
+        assert not any(c.isascii() for c in ATS_BREAKING_CHARS)
+        result = validate_resume_output(GOOD_RESUME_TEXT.encode("ascii", "ignore").decode())
+        assert not any(i.check == "special_characters" for i in result.issues)
+
     def test_resume_data_verification(self):
         """Should verify contact info against original data."""
         resume_data = ResumeData(
@@ -57,6 +57,12 @@ class TestKeyManagement:
         assert validate_key(key1) is False
         assert validate_key(key2) is True
 
+    def test_keys_not_stored_in_plaintext(self):
+        key = "test_key_plain"
+        add_api_key(key)
+        assert key not in _valid_keys
+        assert all(isinstance(k, bytes) and key.encode() not in k for k in _valid_keys)
+
     def test_revoke_nonexistent(self):
         assert revoke_api_key("nonexistent") is False
 
@@ -84,3 +84,16 @@ class TestCleanupExpiredSessions:
         # Cleanup
         resume_data_cache.pop(session_id, None)
         session_timestamps.pop(session_id, None)
+
+    def test_reregistered_session_not_expired(self):
+        """A stale timestamp left behind by re-registration should be ignored."""
+        from src.api.deps import session_timestamps
+
+        session_id = "reregistered-test-session"
+        session_timestamps[session_id] = time.time() - 48 * 3600
+        session_timestamps[session_id] = time.time()
+
+        _cleanup_expired_sessions(max_age_seconds=24 * 3600)
+        assert session_id in session_timestamps
+
+        session_timestamps.pop(session_id, None)
@@ -0,0 +1,191 @@
+"""Tests for the LLM client helpers (no network — the provider client is faked)."""
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import cache
+from src.llm import client as llm_client
+from src.llm import client_async as llm_client_async
+from src.models import Experience, Project
+
+
+def _fake_client(reply: str, calls: list):
+    def create(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+EXPERIENCES = [
+    Experience(title="Engineer", company="Acme", bullets=["Built APIs", "Wrote tests"]),
+    Experience(title="Intern", company="Initech", bullets=["Fixed bugs"]),
+]
+PROJECTS = [Project(name="Scheduler", description="Job scheduler.", technologies=["Go"])]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    """Isolate tests from each other's cached rewrites."""
+    cache.clear()
+    monkeypatch.setattr(cache, "_DISK_DIR", None)
+    yield
+    cache.clear()
+
+
+class TestParseBatchRewrite:
+    def test_extracts_requested_sections(self):
+        sections = [("exp_0", ""), ("proj_0", "")]
+        raw = '```json\n{"exp_0": ["A", "", "B"], "proj_0": "\\"Desc\\"", "exp_9": ["x"]}\n```'
+        assert llm_client._parse_batch_rewrite(raw, sections) == {"exp_0": ["A", "B"], "proj_0": "Desc"}
+
+    def test_malformed_reply(self):
+        assert llm_client._parse_batch_rewrite("not json", [("exp_0", "")]) == {}
+        assert llm_client._parse_batch_rewrite('["a"]', [("exp_0", "")]) == {}
+
+
+class TestRewriteAllSections:
+    def test_single_call_for_all_sections(self, monkeypatch):
+        calls = []
+        reply = '{"exp_0": ["Led APIs"], "exp_1": ["Fixed 40 bugs"], "proj_0": "Built a Go scheduler."}'
+        monkeypatch.setattr(llm_client, "client", _fake_client(reply, calls))
+
+        bullets, descriptions = llm_client.rewrite_all_sections(EXPERIENCES, PROJECTS, "JD text", ["Go"])
+
+        assert len(calls) == 1
+        assert bullets == {0: ["Led APIs"], 1: ["Fixed 40 bugs"]}
+        assert descriptions == {0: "Built a Go scheduler."}
+
+    def test_missing_sections_fall_back_to_single_rewrites(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(llm_client, "client", _fake_client('{"exp_0": ["Led APIs"]}', calls))
+        monkeypatch.setattr(llm_client, "rewrite_experience_bullets", lambda exp, jd, kw: ["single"])
+        monkeypatch.setattr(llm_client, "rewrite_project_description", lambda p, jd, kw: "single desc")
+
+        bullets, descriptions = llm_client.rewrite_all_sections(EXPERIENCES, PROJECTS, "JD text", ["Go"])
+
+        assert bullets == {0: ["Led APIs"], 1: ["single"]}
+        assert descriptions == {0: "single desc"}
+
+    def test_chunks_large_batches(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(llm_client, "client", _fake_client("{}", calls))
+        many = EXPERIENCES * 5  # 10 sections
+        llm_client.rewrite_all_sections(many, [], "JD text", ["Go"])
+        # 2 batched calls (8 + 2); every section then falls back individually
+        assert len(calls) == 2 + len(many)
+
+
+class TestRewriteCache:
+    def test_warm_rewrite_skips_llm(self, monkeypatch):
+        calls = []
+        reply = '{"exp_0": ["Led APIs"], "exp_1": ["Fixed 40 bugs"], "proj_0": "Built a Go scheduler."}'
+        monkeypatch.setattr(llm_client, "client", _fake_client(reply, calls))
+
+        first = llm_client.rewrite_all_sections(EXPERIENCES, PROJECTS, "JD text", ["Go"])
+        second = llm_client.rewrite_all_sections(EXPERIENCES, PROJECTS, "JD text", ["Go"])
+
+        assert len(calls) == 1
+        assert first == second
+
+    def test_single_rewrites_cached_and_shared_with_batches(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(llm_client, "client", _fake_client('["Led APIs"]', calls))
+        assert llm_client.rewrite_experience_bullets(EXPERIENCES[1], "JD text", ["Go"]) == ["Led APIs"]
+        assert llm_client.rewrite_experience_bullets(EXPERIENCES[1], "JD text", ["Go"]) == ["Led APIs"]
+        assert len(calls) == 1
+
+        # Same experience at a different position in a batch: no new request
+        bullets, _ = llm_client.rewrite_all_sections([EXPERIENCES[1]], [], "JD text", ["Go"])
+        assert bullets == {0: ["Led APIs"]}
+        assert len(calls) == 1
+
+    def test_key_depends_on_jd_and_keywords(self):
+        key = cache.cache_section_rewrite("text", "JD", ["Go", "AWS"], "model")
+        assert key == cache.cache_section_rewrite("text", "JD", ["AWS", "Go"], "model")
+        assert key != cache.cache_section_rewrite("text", "Other JD", ["Go", "AWS"], "model")
+        assert key != cache.cache_section_rewrite("text", "JD", ["Go"], "model")
+        assert key != cache.cache_section_rewrite("text", "JD", ["Go", "AWS"], "other-model")
+
+    def test_disk_cache_survives_memory_clear(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(cache, "_DISK_DIR", tmp_path)
+        cache.persistent_set("section:abc", ["Led APIs"])
+        cache.clear()
+        assert cache.persistent_get("section:abc") == ["Led APIs"]
+        assert cache.persistent_get("section:missing") is None
+
+    def test_memory_tier_is_bounded_and_copies_lists(self, monkeypatch):
+        monkeypatch.setattr(cache, "PERSISTENT_CACHE_SIZE", 2)
+        cache.clear()
+        for key in ("a", "b", "c"):
+            cache.persistent_set(f"section:{key}", [key])
+        assert cache.persistent_get("section:a") is None
+        assert list(cache._persistent) == ["section:b", "section:c"]
+
+        cache.persistent_get("section:b").append("mutated")
+        assert cache.persistent_get("section:b") == ["b"]
+
+    def test_cleanup_disk_cache_removes_expired(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(cache, "_DISK_DIR", tmp_path)
+        cache.persistent_set("section:old", ["x"])
+        cache.persistent_set("section:new", ["y"])
+        old = cache._disk_path("section:old")
+        stale = time.time() - cache.CACHE_TTL.total_seconds() - 60
+        os.utime(old, (stale, stale))
+
+        assert cache.cleanup_disk_cache() == 1
+        assert not old.exists()
+        assert cache._disk_path("section:new").exists()
+
+
+class TestRewriteAllSectionsAsync:
+    @pytest.mark.asyncio
+    async def test_batched_reply_and_concurrent_fallbacks(self, monkeypatch):
+        calls = []
+
+        async def create(**kwargs):
+            calls.append(kwargs)
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content='{"exp_0": ["Led APIs"]}'))])
+
+        async def single_bullets(exp, jd, kw):
+            return [f"single {exp.company}"]
+
+        async def single_description(project, jd, kw):
+            raise RuntimeError("provider down")
+
+        fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        monkeypatch.setattr(llm_client_async, "async_client", fake)
+        monkeypatch.setattr(llm_client_async, "rewrite_experience_bullets_async", single_bullets)
+        monkeypatch.setattr(llm_client_async, "rewrite_project_description_async", single_description)
+
+        bullets, descriptions = await llm_client_async.rewrite_all_sections_async(
+            EXPERIENCES, PROJECTS, "JD text", ["Go"]
+        )
+
+        assert len(calls) == 1
+        assert bullets == {0: ["Led APIs"], 1: ["single Initech"]}
+        # A failed single rewrite keeps the original text
+        assert descriptions == {0: "Job scheduler."}
+
+    @pytest.mark.asyncio
+    async def test_requests_bounded_by_semaphore(self, monkeypatch):
+        in_flight, peak = 0, 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="{}"))])
+
+        fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        monkeypatch.setattr(llm_client_async, "async_client", fake)
+        monkeypatch.setattr(llm_client_async, "llm_semaphore", asyncio.Semaphore(2))
+
+        await llm_client_async.rewrite_all_sections_async(EXPERIENCES * 10, [], "JD text", ["Go"])
+
+        assert peak == 2
@@ -21,7 +21,21 @@ class TestCounters:
         collector.inc("requests", labels={"method": "GET", "status": "200"})
         collector.inc("requests", labels={"method": "GET", "status": "200"})
         collector.inc("requests", labels={"method": "POST", "status": "201"})
-        assert len(collector._counter_labels["requests"]) == 2
+        assert collector._counter_labels == {
+            ("requests", (("method", "GET"), ("status", "200"))): 2,
+            ("requests", (("method", "POST"), ("status", "201"))): 1,
+        }
+
+    def test_labeled_counter_export(self, collector):
+        collector.inc("requests", labels={"status": "200", "method": "GET"})
+        collector.inc("requests", labels={"method": "POST", "status": "201"})
+        output = collector.to_prometheus()
+        assert output.count("# TYPE requests counter") == 1
+        assert 'requests{method="GET",status="200"} 1.0' in output
+        assert collector.to_dict()["counters"]["requests"] == {
+            'method="GET",status="200"': 1,
+            'method="POST",status="201"': 1,
+        }
 
 
 class TestGauges:
@@ -43,11 +57,23 @@ class TestHistograms:
             collector.observe("response_time", v)
         assert len(collector._histograms["response_time"]) == 5
 
-    def test_rolling_window(self, collector):
-        collector._histogram_max_samples = 10
-        for i in range(20):
-            collector.observe("test_hist", float(i))
-        assert len(collector._histograms["test_hist"]) == 10
+    def test_constant_memory(self, collector):
+        for i in range(20000):
+            collector.observe("test_hist", 0.001 * (i % 500 + 1))
+        hist = collector._histograms["test_hist"]
+        assert len(hist) == 20000
+        assert len(hist._buckets) < 400
+        assert hist.sum == pytest.approx(sum(0.001 * (i % 500 + 1) for i in range(20000)))
+
+    def test_quantiles_within_precision(self, collector):
+        values = [0.0] + [i / 100 for i in range(1, 1000)]
+        for v in values:
+            collector.observe("latency", v)
+        hist = collector._histograms["latency"]
+        p0, p50, p95, p99 = hist.quantiles((0.0, 0.5, 0.95, 0.99))
+        assert p0 == 0.0
+        for approx, exact in ((p50, values[500]), (p95, values[950]), (p99, values[990])):
+            assert approx == pytest.approx(exact, rel=0.011)
 
 
 class TestTimer:
@@ -56,7 +82,7 @@ class TestTimer:
         with collector.timer("test_timer"):
             time.sleep(0.01)
         assert len(collector._histograms["test_timer"]) == 1
-        assert collector._histograms["test_timer"][0] >= 0.01
+        assert collector._histograms["test_timer"].sum >= 0.01
 
 
 class TestExport:
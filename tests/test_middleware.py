@@ -1,51 +1,101 @@
 """Tests for middleware — rate limiting and request logging."""
 
-import time
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import AsyncMock
 
 import pytest
+from starlette.requests import Request
+
 from src.middleware import RateLimitMiddleware
 
 
+def _request(headers=None, client=("127.0.0.1", 50000), path="/api/test"):
+    """Build a real Starlette request from a minimal ASGI scope."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [(k.encode(), v.encode()) for k, v in (headers or {}).items()],
+        "client": client,
+    })
+
+
+async def _app(scope, receive, send):
+    """Inner ASGI app placeholder; dispatch() is called directly in these tests."""
+
+
+@pytest.fixture(scope="module")
+def _shared_mw():
+    return RateLimitMiddleware(app=_app)
+
+
+@pytest.fixture()
+def rl_mw(_shared_mw):
+    """One middleware per module, reset to a small limit before each test."""
+    _shared_mw.max_requests = 5
+    _shared_mw.window_seconds = 60
+    _shared_mw.exclude_paths = ("/health",)
+    _shared_mw._buckets.clear()
+    _shared_mw._loaded_from_db.clear()
+    _shared_mw._swept_window = -1
+    return _shared_mw
+
+
 class TestRateLimitMiddleware:
-    def test_prune_removes_old(self):
-        """Prune should remove timestamps outside the window."""
-        mw = RateLimitMiddleware(app=MagicMock(), max_requests=5, window_seconds=60)
-        now = time.time()
+    def test_window_counter(self, rl_mw):
+        """Requests in one window share a single counter; the next window starts fresh."""
+        mw = rl_mw
         ip = "1.2.3.4"
-        # Add timestamps: 3 old + 2 recent
-        mw._hits[ip] = [now - 120, now - 90, now - 70, now - 10, now - 5]
-        mw._prune(ip, now)
-        assert len(mw._hits[ip]) == 2  # only the two within 60s window
-
-    def test_prune_cleans_empty(self):
-        """Should garbage-collect IP entry when all timestamps are old."""
-        mw = RateLimitMiddleware(app=MagicMock(), max_requests=5, window_seconds=60)
-        now = time.time()
+        mw._buckets[(ip, 10)] = 3
+        mw._buckets[(ip, 11)] = 2
+        mw._loaded_from_db.add(ip)
+        mw._sweep(11)
+        assert mw._buckets == {(ip, 11): 2}
+        assert ip in mw._loaded_from_db
+        assert mw._window(11 * 60 + 59.9) == 11
+        assert mw._window(12 * 60) == 12
+
+    def test_sweep_cleans_empty(self, rl_mw):
+        """Should garbage-collect an IP once all its counters are stale."""
+        mw = rl_mw
         ip = "5.6.7.8"
-        mw._hits[ip] = [now - 120]  # all old
-        mw._prune(ip, now)
-        assert ip not in mw._hits
+        mw._buckets[(ip, 10)] = 4
+        mw._loaded_from_db.add(ip)
+        mw._sweep(12)
+        assert not mw._buckets
+        assert ip not in mw._loaded_from_db
+
+    @pytest.mark.asyncio
+    async def test_dispatch_rejects_over_limit(self, rl_mw):
+        """The request past max_requests in a window gets a 429 and is not counted."""
+        mw = rl_mw
+        mw.max_requests = 2
+        mw.window_seconds = 3600
+        request = _request(client=("9.9.9.9", 50000))
+        call_next = AsyncMock(return_value="ok")
+        assert await mw.dispatch(request, call_next) == "ok"
+        assert await mw.dispatch(request, call_next) == "ok"
+        blocked = await mw.dispatch(request, call_next)
+        assert blocked.status_code == 429
+        assert 0 <= int(blocked.headers["Retry-After"]) <= 3600
+        assert call_next.await_count == 2
+        assert list(mw._buckets.values()) == [2]
 
-    def test_client_ip_forwarded(self):
+    def test_client_ip_forwarded(self, rl_mw):
         """Should extract IP from X-Forwarded-For header."""
-        mw = RateLimitMiddleware(app=MagicMock())
-        request = MagicMock()
-        request.headers = {"x-forwarded-for": "10.0.0.1, 10.0.0.2"}
+        mw = rl_mw
+        request = _request(headers={"x-forwarded-for": "10.0.0.1, 10.0.0.2"})
         assert mw._client_ip(request) == "10.0.0.1"
+        assert mw._client_ip(_request(headers={"x-forwarded-for": " 10.0.0.3 "})) == "10.0.0.3"
 
-    def test_client_ip_direct(self):
+    def test_client_ip_direct(self, rl_mw):
         """Should use client.host when no forwarded header."""
-        mw = RateLimitMiddleware(app=MagicMock())
-        request = MagicMock()
-        request.headers = {}
-        request.client.host = "192.168.1.1"
+        mw = rl_mw
+        request = _request(client=("192.168.1.1", 50000))
         assert mw._client_ip(request) == "192.168.1.1"
 
-    def test_client_ip_unknown(self):
+    def test_client_ip_unknown(self, rl_mw):
         """Should return 'unknown' when no client info."""
-        mw = RateLimitMiddleware(app=MagicMock())
-        request = MagicMock()
-        request.headers = {}
-        request.client = None
+        mw = rl_mw
+        request = _request(client=None)
         assert mw._client_ip(request) == "unknown"
@@ -54,6 +54,25 @@ class TestResumeData:
         restored = ResumeData.model_validate_json(json_str)
         assert restored.name == sample_resume_data.name
 
+    def test_resume_json_round_trip_via_dict(self, sample_resume_data):
+        """JSON parsed to a dict (as in API responses) should validate back."""
+        from src.utils import json_loads
+        restored = ResumeData.model_validate(json_loads(sample_resume_data.model_dump_json()))
+        assert restored == sample_resume_data
+
+    def test_from_trusted_builds_nested_models(self):
+        """from_trusted should build nested models from plain dicts."""
+        data = ResumeData.from_trusted({
+            "name": "John Doe",
+            "experience": [{"title": "Engineer", "company": "Acme", "bullets": ["Built X"]}],
+            "certifications": [Certification(name="CKA")],
+        })
+        assert data.email == ""
+        assert isinstance(data.experience[0], Experience)
+        assert data.experience[0].dates == ""
+        assert data.certifications[0].name == "CKA"
+        assert data.model_dump()["experience"][0]["bullets"] == ["Built X"]
+
 
 class TestEducation:
     def test_defaults(self):
@@ -0,0 +1,84 @@
+"""Tests for the PDF text extractor's strategy order."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import pdf_extractor
+from src.core.pdf_extractor import extract_text_from_pdf
+
+SPACED = "Jane Doe Senior Software Engineer with Python FastAPI and AWS experience"
+UNSPACED = "JaneDoeSeniorSoftwareEngineerwithPythonFastAPIandAWSexperience" * 2
+
+
+class _StubDoc:
+    def __init__(self, pages):
+        self._pages = pages
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __iter__(self):
+        return iter(self._pages)
+
+
+def _stub_fitz(page_text=None, error=None):
+    def get_text(kind, flags=0):
+        if error:
+            raise error
+        return page_text
+
+    def open_(path):
+        return _StubDoc([SimpleNamespace(get_text=get_text)])
+
+    return SimpleNamespace(TEXT_PRESERVE_LIGATURES=1, TEXT_DEHYPHENATE=2, open=open_)
+
+
+class TestPyMuPDFStrategy:
+    @pytest.fixture
+    def pdf_file(self, tmp_path):
+        path = tmp_path / "resume.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        return str(path)
+
+    @pytest.fixture
+    def char_gap_calls(self, monkeypatch):
+        calls = []
+
+        def char_gaps(file_path):
+            calls.append(file_path)
+            return "char gap " + SPACED
+
+        monkeypatch.setattr(pdf_extractor, "_extract_with_char_gaps", char_gaps)
+        return calls
+
+    def _use_fitz(self, monkeypatch, stub):
+        monkeypatch.setattr(pdf_extractor, "PYMUPDF_AVAILABLE", True)
+        monkeypatch.setattr(pdf_extractor, "fitz", stub, raising=False)
+
+    def test_well_spaced_text_returned_directly(self, pdf_file, char_gap_calls, monkeypatch):
+        self._use_fitz(monkeypatch, _stub_fitz(page_text=SPACED))
+
+        assert extract_text_from_pdf(pdf_file) == SPACED
+        assert char_gap_calls == []
+
+    def test_unspaced_text_falls_through_to_char_gaps(self, pdf_file, char_gap_calls, monkeypatch):
+        self._use_fitz(monkeypatch, _stub_fitz(page_text=UNSPACED))
+
+        assert extract_text_from_pdf(pdf_file) == "char gap " + SPACED
+        assert char_gap_calls == [pdf_file]
+
+    def test_raising_extractor_falls_through_to_char_gaps(self, pdf_file, char_gap_calls, monkeypatch):
+        self._use_fitz(monkeypatch, _stub_fitz(error=RuntimeError("corrupt xref")))
+
+        assert extract_text_from_pdf(pdf_file) == "char gap " + SPACED
+        assert char_gap_calls == [pdf_file]
+
+    def test_skipped_when_unavailable(self, pdf_file, char_gap_calls, monkeypatch):
+        monkeypatch.setattr(pdf_extractor, "PYMUPDF_AVAILABLE", False)
+
+        assert extract_text_from_pdf(pdf_file) == "char gap " + SPACED
+        assert char_gap_calls == [pdf_file]
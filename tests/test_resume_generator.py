@@ -0,0 +1,181 @@
+"""Tests for the DOCX resume generator."""
+
+import zipfile
+
+import pytest
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
+from docx.shared import Pt
+
+from src.core import resume_generator
+from src.core.resume_generator import BULLET_INDENT, FONT_NAME, FONT_SIZE_BODY, FONT_SIZE_NAME, FONT_SIZE_SECTION, MARGIN_LEFT, MAX_PARAGRAPHS, _categorize_skill, _estimate_paragraphs, _keyword_coverage, generate_resume
+
+
+class TestGenerateResume:
+    @pytest.mark.asyncio
+    async def test_writes_readable_docx(self, tmp_path, sample_resume_data):
+        output = tmp_path / "resume.docx"
+        await generate_resume(str(output), ["Python", "AWS"], sample_resume_data, use_parallel=False)
+
+        with zipfile.ZipFile(output) as archive:
+            assert "word/styles.xml" in archive.namelist()
+        text = "\n".join(p.text for p in Document(str(output)).paragraphs)
+        assert "JANE DOE" in text
+        assert "Google" in text
+        assert "Stanford University" in text
+
+    @pytest.mark.asyncio
+    async def test_template_page_setup_applied(self, tmp_path, sample_resume_data):
+        output = tmp_path / "resume.docx"
+        await generate_resume(str(output), [], sample_resume_data, use_parallel=False)
+
+        document = Document(str(output))
+        assert document.sections[0].left_margin == MARGIN_LEFT
+        normal = document.styles["Normal"].font
+        assert (normal.name, normal.size) == (FONT_NAME, FONT_SIZE_BODY)
+        spacing = document.styles["Normal"].paragraph_format
+        assert spacing.space_before == 0 and spacing.space_after == 0
+
+    @pytest.mark.asyncio
+    async def test_styled_runs(self, tmp_path, sample_resume_data):
+        output = tmp_path / "resume.docx"
+        await generate_resume(str(output), [], sample_resume_data, use_parallel=False)
+
+        paragraphs = Document(str(output)).paragraphs
+        name_run = paragraphs[0].runs[0]
+        assert name_run.bold and name_run.font.size == FONT_SIZE_NAME
+        company = next(p for p in paragraphs if p.text == "Google")
+        assert company.runs[0].italic and company.runs[0].font.size is None
+
+    @pytest.mark.asyncio
+    async def test_section_heading_format(self, tmp_path, sample_resume_data):
+        output = tmp_path / "resume.docx"
+        await generate_resume(str(output), [], sample_resume_data, use_parallel=False)
+
+        heading = next(p for p in Document(str(output)).paragraphs if p.text == "WORK EXPERIENCE")
+        assert heading.alignment == WD_ALIGN_PARAGRAPH.LEFT
+        assert heading.paragraph_format.space_before == Pt(6)
+        assert heading._p.pPr.find(qn("w:pBdr")) is not None
+        assert heading.runs[0].bold and heading.runs[0].font.size == FONT_SIZE_SECTION
+
+    @pytest.mark.asyncio
+    async def test_without_resume_data(self, tmp_path):
+        output = tmp_path / "blank.docx"
+        await generate_resume(str(output), ["Python", "Kubernetes"], None)
+
+        text = "\n".join(p.text for p in Document(str(output)).paragraphs)
+        assert "YOUR NAME" in text
+        assert "TECHNICAL SKILLS" in text and "Python" in text
+        assert "WORK EXPERIENCE" not in text
+
+    @pytest.mark.asyncio
+    async def test_bullets_escaped_and_indented(self, tmp_path, sample_resume_data):
+        sample_resume_data.experience[0].bullets.append("Cut R&D costs <50% via caching")
+        output = tmp_path / "resume.docx"
+        await generate_resume(str(output), [], sample_resume_data, use_parallel=False)
+
+        paragraphs = Document(str(output)).paragraphs
+        bullets = [p for p in paragraphs if p.text.startswith("- ")]
+        assert len(bullets) == 5 + 3 + 2  # Google + Meta + one line per project
+        assert "- Cut R&D costs <50% via caching" in {p.text for p in bullets}
+        assert all(p.paragraph_format.left_indent == BULLET_INDENT for p in bullets)
+
+    @pytest.mark.asyncio
+    async def test_outputs_do_not_share_body(self, tmp_path, sample_resume_data):
+        first, second = tmp_path / "a.docx", tmp_path / "b.docx"
+        await generate_resume(str(first), [], sample_resume_data, use_parallel=False)
+        sample_resume_data.name = "John Smith"
+        await generate_resume(str(second), [], sample_resume_data, use_parallel=False)
+
+        second_text = "\n".join(p.text for p in Document(str(second)).paragraphs)
+        assert "JOHN SMITH" in second_text
+        assert "JANE DOE" not in second_text
+
+    @pytest.mark.asyncio
+    async def test_template_document_reused_from_pool(self, tmp_path, sample_resume_data, monkeypatch):
+        monkeypatch.setattr(resume_generator, "_DOCUMENT_POOL", [])
+        await generate_resume(str(tmp_path / "a.docx"), [], sample_resume_data, use_parallel=False)
+        pooled = resume_generator._DOCUMENT_POOL[0]
+        await generate_resume(str(tmp_path / "b.docx"), [], sample_resume_data, use_parallel=False)
+
+        assert resume_generator._DOCUMENT_POOL == [pooled]
+        # Released documents hold no paragraphs from the previous build
+        assert pooled.paragraphs == []
+
+    @pytest.mark.asyncio
+    async def test_stops_at_page_budget(self, tmp_path, sample_resume_data):
+        exp = sample_resume_data.experience[0]
+        exp.bullets = exp.bullets * 10
+        sample_resume_data.experience = [exp] * 12
+        project = sample_resume_data.projects[0]
+        project.description = "Built the API. Shipped the UI. Cut latency in half."
+        sample_resume_data.projects = [project] * 4
+        output = tmp_path / "long.docx"
+        await generate_resume(str(output), [], sample_resume_data, use_parallel=False)
+
+        paragraphs = Document(str(output)).paragraphs
+        assert len(paragraphs) <= MAX_PARAGRAPHS
+        # Sections after the budget ran out are dropped whole, heading included
+        assert "CERTIFICATIONS" not in {p.text for p in paragraphs}
+
+    @pytest.mark.asyncio
+    async def test_keyword_injection_leaves_input_skills_untouched(self, tmp_path, sample_resume_data):
+        before = {k: list(v) for k, v in sample_resume_data.skills.items()}
+        await generate_resume(str(tmp_path / "r.docx"), ["Rust", "Kafka"], sample_resume_data, use_parallel=False)
+
+        assert sample_resume_data.skills == before
+
+
+class TestKeywordCoverage:
+    def test_fraction_of_keywords_present(self):
+        bullets = ["Built APIs in Python", "Deployed on AWS"]
+        assert _keyword_coverage(bullets, ["python", "AWS", "Go", "Rust"]) == 0.5
+
+    def test_empty_inputs(self):
+        assert _keyword_coverage([], ["python"]) == 0.0
+        assert _keyword_coverage(["x"], []) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_covered_experience_skips_rewrite(self, tmp_path, sample_resume_data, monkeypatch):
+        calls = []
+
+        async def fake_rewrite(experiences, projects, jd, kws):
+            calls.append([exp.company for exp in experiences])
+            return {i: ["Rewritten bullet"] for i in range(len(experiences))}, {}
+
+        monkeypatch.setattr("src.core.resume_generator.rewrite_all_sections_async", fake_rewrite)
+        output = tmp_path / "r.docx"
+        await generate_resume(
+            str(output), ["PostgreSQL", "Terraform"], sample_resume_data,
+            job_description="Backend role using PostgreSQL and Terraform", use_parallel=False,
+        )
+        # One batched call; only the Meta role lacks both keywords
+        assert calls == [["Meta"]]
+        texts = [p.text for p in Document(str(output)).paragraphs]
+        assert texts[texts.index("Meta") + 1] == "- Rewritten bullet"
+        # The caller's data is not rewritten in place
+        assert sample_resume_data.experience[1].bullets[0].startswith("Developed RESTful APIs")
+
+
+class TestEstimateParagraphs:
+    @pytest.mark.asyncio
+    async def test_matches_rendered_paragraphs(self, tmp_path, sample_resume_data):
+        output = tmp_path / "r.docx"
+        await generate_resume(str(output), [], sample_resume_data, use_parallel=False)
+        assert _estimate_paragraphs(sample_resume_data) == len(Document(str(output)).paragraphs)
+
+    def test_short_resume_fits_page(self, sample_resume_data):
+        assert _estimate_paragraphs(sample_resume_data) <= MAX_PARAGRAPHS
+
+
+class TestCategorizeSkill:
+    def test_first_matching_category_wins(self):
+        assert _categorize_skill("Hugging Face") == "AI/ML & LLMs"
+        assert _categorize_skill("AWS") == "Cloud Platforms"
+        assert _categorize_skill("Kafka") == "Data Engineering"
+        # "postgresql" also contains "sql" — languages are checked first
+        assert _categorize_skill("PostgreSQL") == "Programming Languages"
+
+    def test_uncategorized(self):
+        assert _categorize_skill("Excel") is None
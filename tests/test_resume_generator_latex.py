@@ -0,0 +1,123 @@
+"""Tests for the LaTeX resume generator helpers."""
+
+import pytest
+
+from src.core import resume_generator_latex
+from src.core.resume_generator_latex import escape_latex, generate_resume_latex, generate_resumes_latex_batch
+
+
+class TestEscapeLatex:
+    def test_special_characters(self):
+        assert escape_latex("R&D 50% $5 #1 a_b {x}") == r"R\&D 50\% \$5 \#1 a\_b \{x\}"
+
+    def test_commands_with_braces_not_double_escaped(self):
+        assert escape_latex("a\\b^c~d") == r"a\textbackslash{}b\textasciicircum{}c\textasciitilde{}d"
+
+    def test_unicode_punctuation(self):
+        assert escape_latex("A → B — C • D") == r"A $\rightarrow$ B --- C \textbullet{} D"
+
+    def test_empty(self):
+        assert escape_latex("") == ""
+
+
+class TestPdfCache:
+    def _fake_compile(self, calls):
+        def compile_latex(tex_file, pdf_file):
+            calls.append(tex_file)
+            pdf_file.write_bytes(b"%PDF " + tex_file.read_bytes()[:20])
+            return pdf_file
+        return compile_latex
+
+    def test_identical_source_compiled_once(self, tmp_path, sample_resume_data, monkeypatch):
+        calls = []
+        monkeypatch.setattr(resume_generator_latex, "PDF_CACHE_DIR", tmp_path / "cache")
+        monkeypatch.setattr(resume_generator_latex, "_compile_latex", self._fake_compile(calls))
+
+        first = generate_resume_latex(str(tmp_path / "a.pdf"), [], sample_resume_data)
+        second = generate_resume_latex(str(tmp_path / "b.pdf"), [], sample_resume_data)
+
+        assert len(calls) == 1
+        assert open(first, "rb").read() == open(second, "rb").read()
+
+    def test_evicts_beyond_limit(self, tmp_path, sample_resume_data, monkeypatch):
+        calls = []
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(resume_generator_latex, "PDF_CACHE_DIR", cache_dir)
+        monkeypatch.setattr(resume_generator_latex, "PDF_CACHE_MAX_FILES", 1)
+        monkeypatch.setattr(resume_generator_latex, "_compile_latex", self._fake_compile(calls))
+
+        generate_resume_latex(str(tmp_path / "a.pdf"), [], sample_resume_data)
+        sample_resume_data.name = "John Smith"
+        generate_resume_latex(str(tmp_path / "b.pdf"), [], sample_resume_data)
+
+        assert len(calls) == 2
+        assert len(list(cache_dir.glob("*.pdf"))) == 1
+
+    def test_batch_returns_paths_in_order(self, tmp_path, sample_resume_data, monkeypatch):
+        calls = []
+        monkeypatch.setattr(resume_generator_latex, "PDF_CACHE_DIR", tmp_path / "cache")
+        monkeypatch.setattr(resume_generator_latex, "_compile_latex", self._fake_compile(calls))
+        other = sample_resume_data.model_copy(update={"name": "John Smith"})
+
+        paths = generate_resumes_latex_batch([
+            (str(tmp_path / "a.pdf"), [], sample_resume_data, None),
+            (str(tmp_path / "b.pdf"), [], other, None),
+        ], max_workers=2)
+
+        assert paths == [str(tmp_path / "a.pdf"), str(tmp_path / "b.pdf")]
+        assert len(calls) == 2
+
+    def test_store_leaves_no_temp_files(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(resume_generator_latex, "PDF_CACHE_DIR", cache_dir)
+        pdf = tmp_path / "out.pdf"
+        pdf.write_bytes(b"%PDF compiled")
+
+        resume_generator_latex._store_cached_pdf(pdf, cache_dir / "abc.pdf")
+
+        assert (cache_dir / "abc.pdf").read_bytes() == b"%PDF compiled"
+        # The writer's own temp file was renamed into place, not left behind
+        assert [f.name for f in cache_dir.iterdir()] == ["abc.pdf"]
+
+
+class TestBuildDocument:
+    def test_sections_rewritten_in_one_call(self, sample_resume_data, monkeypatch):
+        calls = []
+
+        def fake_rewrite(experiences, projects, job_description, keywords):
+            calls.append((len(experiences), len(projects)))
+            return {0: ["Rewritten bullet"]}, {1: "Rewritten description."}
+
+        monkeypatch.setattr(resume_generator_latex, "rewrite_all_sections", fake_rewrite)
+        source = resume_generator_latex._build_document(sample_resume_data, ["Python"], "JD text")
+
+        assert calls == [(2, 2)]
+        assert "\\item Rewritten bullet" in source
+        assert "\\item Rewritten description." in source
+        assert escape_latex(sample_resume_data.experience[1].bullets[0]) in source
+
+    def test_no_rewrite_without_job_description(self, sample_resume_data, monkeypatch):
+        def fail(*args):
+            raise AssertionError("rewrite should not be called")
+
+        monkeypatch.setattr(resume_generator_latex, "rewrite_all_sections", fail)
+        source = resume_generator_latex._build_document(sample_resume_data, ["Python"], None)
+        assert escape_latex(sample_resume_data.experience[0].bullets[0]) in source
+
+
+class TestCompileLatex:
+    def test_missing_engine(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(resume_generator_latex, "LATEX_ENGINE", None)
+        with pytest.raises(RuntimeError, match="No LaTeX engine found"):
+            resume_generator_latex._compile_latex(tmp_path / "r.tex", tmp_path / "r.pdf")
+
+
+class TestBuildSkills:
+    def test_injects_only_uncovered_keywords(self, sample_resume_data):
+        before = {k: list(v) for k, v in sample_resume_data.skills.items()}
+        latex = resume_generator_latex._build_skills(sample_resume_data, ["python", "AWS", "Flask", "Flask"])
+
+        assert latex.count("Flask") == 1
+        assert "python" not in latex  # already listed as "Python"
+        # The caller's skill lists are not extended in place
+        assert sample_resume_data.skills == before
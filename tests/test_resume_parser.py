@@ -0,0 +1,166 @@
+"""Tests for the regex resume parser."""
+
+from docx import Document
+
+from src.core import resume_parser
+from src.core.resume_parser import _parse_text_to_resume_data, parse_resume, parse_resumes
+
+
+RESUME_TEXT = """Jane Doe
+San Francisco, CA | jane.doe@example.com | (555) 123-4567 | linkedin.com/in/janedoe | github.com/janedoe
+WORK EXPERIENCE
+Senior Software Engineer | Acme Corp | Remote | Jan 2021 - Present
+• Architected a microservices platform serving 10M+ daily requests
+• Led migration to Kubernetes using Terraform and Helm
+  across 40 services
+Software Engineer Intern
+Oracle Corporation, Austin, TX
+May 2017 - Aug 2017
+* Wrote Java tooling for CI pipelines
+EDUCATION
+Bachelor of Science in Computer Engineering
+Florida Institute of Technology, Melbourne, FL
+Aug 2012 - May 2016 | GPA: 3.9/4.0
+TECHNICAL SKILLS
+Languages: Python, Java, Go
+Cloud: AWS, GCP • DevOps: Docker, Kubernetes
+PROJECTS
+Chat Bot | Python, LangChain, Redis
+- Retrieval-augmented chatbot using Pinecone + OpenAI
+CERTIFICATIONS
+Certified Kubernetes Administrator | CNCF | 2022 | View Credential
+"""
+
+
+class TestParseText:
+    def test_contact(self):
+        data = _parse_text_to_resume_data(RESUME_TEXT)
+        assert data.name == "Jane Doe"
+        assert data.email == "jane.doe@example.com"
+        assert data.phone == "(555) 123-4567"
+        assert data.linkedin == "https://linkedin.com/in/janedoe"
+        assert data.github == "https://github.com/janedoe"
+
+    def test_experience(self):
+        data = _parse_text_to_resume_data(RESUME_TEXT)
+        assert [(e.title, e.company, e.dates) for e in data.experience] == [
+            ("Senior Software Engineer", "Acme Corp", "Jan 2021 - Present"),
+            ("Software Engineer Intern", "Oracle Corporation", "May 2017 - Aug 2017"),
+        ]
+        assert data.experience[0].bullets[1] == "Led migration to Kubernetes using Terraform and Helm across 40 services"
+        assert data.experience[1].bullets == ["Wrote Java tooling for CI pipelines"]
+
+    def test_education(self):
+        edu = _parse_text_to_resume_data(RESUME_TEXT).education
+        assert len(edu) == 1
+        assert edu[0].university == "Florida Institute of Technology"
+        assert edu[0].location == "Melbourne, FL"
+        assert edu[0].dates == "Aug 2012 - May 2016"
+        assert edu[0].gpa == "3.9"
+
+    def test_skills(self):
+        skills = _parse_text_to_resume_data(RESUME_TEXT).skills
+        assert skills == {
+            "Languages": ["Python", "Java", "Go"],
+            "Cloud": ["AWS", "GCP"],
+            "DevOps": ["Docker", "Kubernetes"],
+        }
+
+    def test_skill_delimiters(self):
+        skills = resume_parser._extract_skills([
+            "Languages: Python; Java, C, SQL",
+            "Terraform | Ansible; Helm,  ,",
+        ])
+        assert skills == {"Languages": ["Python", "Java", "SQL", "Terraform", "Ansible", "Helm"]}
+
+    def test_projects_and_certifications(self):
+        data = _parse_text_to_resume_data(RESUME_TEXT)
+        assert data.projects[0].name == "Chat Bot"
+        assert data.projects[0].technologies == ["Python", "LangChain", "Redis", "Pinecone", "OpenAI"]
+        cert = data.certifications[0]
+        assert (cert.name, cert.issuer, cert.year) == ("Certified Kubernetes Administrator", "CNCF", "2022")
+
+
+class TestExtractTextFromDocx:
+    def test_matches_python_docx(self, tmp_path):
+        doc = Document()
+        doc.add_paragraph("Jane Doe")
+        run = doc.add_paragraph("Python").add_run()
+        run.add_tab()
+        run.add_text("Go")
+        run.add_break()
+        run.add_text("Rust")
+        table = doc.add_table(rows=3, cols=3)
+        for i in range(3):
+            for j in range(3):
+                table.cell(i, j).text = f"c{i}{j}"
+        table.cell(0, 0).merge(table.cell(0, 1))
+        table.cell(1, 2).merge(table.cell(2, 2))
+        path = str(tmp_path / "resume.docx")
+        doc.save(path)
+
+        text = resume_parser._extract_text_from_docx(path)
+        assert text == resume_parser._extract_text_from_docx_document(path)
+        assert text.startswith("Jane Doe\nPython\tGo\nRust\n")
+
+
+class TestParseResumeCache:
+    def test_identical_file_parsed_once(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(resume_parser, "_parsed_cache", resume_parser.OrderedDict())
+        calls = []
+        parse_file = resume_parser._parse_resume_file
+        monkeypatch.setattr(resume_parser, "_parse_resume_file", lambda path: calls.append(path) or parse_file(path))
+        for name in ("a.txt", "b.txt"):
+            (tmp_path / name).write_text(RESUME_TEXT)
+
+        first = parse_resume(str(tmp_path / "a.txt"))
+        first.experience[0].bullets.append("Mutated by caller")
+        second = parse_resume(str(tmp_path / "b.txt"))
+
+        assert len(calls) == 1
+        assert "Mutated by caller" not in second.experience[0].bullets
+        assert second.name == "Jane Doe"
+
+    def test_cache_is_bounded_lru(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(resume_parser, "_parsed_cache", resume_parser.OrderedDict())
+        monkeypatch.setattr(resume_parser, "PARSED_CACHE_SIZE", 2)
+        paths = []
+        for name in ("Jane Doe", "John Smith", "Alex Kim"):
+            path = tmp_path / f"{name.split()[0]}.txt"
+            path.write_text(RESUME_TEXT.replace("Jane Doe", name))
+            paths.append(str(path))
+
+        parse_resume(paths[0])
+        parse_resume(paths[1])
+        parse_resume(paths[0])  # refresh: paths[1] is now least recently used
+        parse_resume(paths[2])
+
+        cached_names = [data.name for data in resume_parser._parsed_cache.values()]
+        assert cached_names == ["Jane Doe", "Alex Kim"]
+
+    def test_failed_llm_escalation_not_cached(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(resume_parser, "_parsed_cache", resume_parser.OrderedDict())
+        monkeypatch.setattr(resume_parser, "LLM_PARSER_AVAILABLE", True)
+
+        def failing_llm(text, fallback=True):
+            raise RuntimeError("LLM down")
+
+        monkeypatch.setattr(resume_parser, "parse_resume_with_llm", failing_llm, raising=False)
+        path = tmp_path / "sparse.txt"
+        path.write_text("Jane Doe\njane.doe@example.com\n")
+
+        assert parse_resume(str(path)).email == "jane.doe@example.com"
+        assert not resume_parser._parsed_cache
+
+
+class TestParseResumes:
+    def test_results_in_input_order(self, tmp_path):
+        paths = []
+        for name in ("Jane Doe", "John Smith", "Alex Kim"):
+            path = tmp_path / f"{name.split()[0]}.txt"
+            path.write_text(RESUME_TEXT.replace("Jane Doe", name))
+            paths.append(str(path))
+
+        results = parse_resumes(paths, max_workers=2)
+        assert [r.name for r in results] == ["Jane Doe", "John Smith", "Alex Kim"]
+        assert results[1].skills == results[0].skills
@@ -1,7 +1,10 @@
 """Tests for the storage abstraction layer."""
 
+import io
+
 import pytest
 from src.storage.local import LocalStorage
+from src.storage.base import guess_content_type
 
 
 @pytest.fixture()
@@ -33,6 +36,24 @@ class TestLocalStorage:
     def test_delete_nonexistent(self, storage):
         assert storage.delete("nope.txt") is False
 
+    def test_delete_many(self, storage):
+        storage.save("a.txt", b"a")
+        storage.save("b.txt", b"b")
+        assert storage.delete_many(["a.txt", "b.txt", "nope.txt"]) == {
+            "a.txt": True, "b.txt": True, "nope.txt": False,
+        }
+        assert storage.exists("a.txt") is False
+
+    @pytest.mark.asyncio
+    async def test_async_variants(self, storage):
+        await storage.asave("async/a.txt", b"data")
+        assert await storage.aread("async/a.txt") == b"data"
+        assert [f.key for f in await storage.alist_files("async/")] == ["async/a.txt"]
+
+    def test_exists_many(self, storage):
+        storage.save("here.txt", b"x")
+        assert storage.exists_many(["here.txt", "gone.txt"]) == {"here.txt": True, "gone.txt": False}
+
     def test_read_nonexistent(self, storage):
         assert storage.read("nope.txt") is None
 
@@ -75,10 +96,32 @@ class TestLocalStorage:
         with pytest.raises(ValueError, match="Path traversal"):
             storage.save("../../etc/passwd", b"hack")
 
+    def test_sibling_directory_is_traversal(self, storage):
+        sibling = storage.base_dir.name + "-other/leak.txt"
+        with pytest.raises(ValueError, match="Path traversal"):
+            storage.save(f"../{sibling}", b"hack")
+
     def test_content_type_guessing(self):
-        assert LocalStorage._guess_content_type(".pdf") == "application/pdf"
-        assert LocalStorage._guess_content_type(".docx").startswith("application/")
-        assert LocalStorage._guess_content_type(".unknown") == "application/octet-stream"
+        assert guess_content_type("a/resume.pdf") == "application/pdf"
+        assert guess_content_type("resume.DOCX").startswith("application/")
+        assert guess_content_type("file.unknown") == "application/octet-stream"
+        assert guess_content_type("no_extension") == "application/octet-stream"
+
+    def test_list_files_content_type(self, storage):
+        storage.save("out/resume.pdf", b"%PDF")
+        assert storage.list_files()[0].content_type == "application/pdf"
+
+    def test_save_stream_from_file(self, storage, tmp_dir):
+        src = tmp_dir / "src.bin"
+        src.write_bytes(b"header" + b"x" * 100_000)
+        with open(src, "rb") as f:
+            f.read(6)
+            storage.save_stream("copy.bin", f)
+        assert storage.read("copy.bin") == b"x" * 100_000
+
+    def test_save_stream_from_buffer(self, storage):
+        storage.save_stream("buf.txt", io.BytesIO(b"in memory"))
+        assert storage.read("buf.txt") == b"in memory"
 
     def test_overwrite(self, storage):
         storage.save("test.txt", b"version1")
@@ -91,3 +134,18 @@ class TestLocalStorage:
         assert len(files) == 1
         assert files[0].size == 5
         assert files[0].last_modified > 0
+
+
+class TestStorageSingleton:
+    def test_storage_alias_forwards_to_backend(self, tmp_dir, monkeypatch):
+        import src.storage as storage_module
+
+        backend = LocalStorage(base_dir=str(tmp_dir))
+        created = []
+        monkeypatch.setattr(storage_module, "_storage_instance", None)
+        monkeypatch.setattr(storage_module, "_create_storage", lambda: created.append(1) or backend)
+
+        storage_module.storage.save("alias.txt", b"data")
+        assert storage_module.get_storage() is backend
+        assert backend.read("alias.txt") == b"data"
+        assert created == [1]
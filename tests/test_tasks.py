@@ -1,6 +1,7 @@
 """Tests for the async task queue."""
 
 import asyncio
+from collections import deque
 import pytest
 from src.tasks.queue import TaskQueue, TaskStatus
 
@@ -18,10 +19,7 @@ class TestTaskQueue:
             return a + b
 
         task_id = await queue.submit(add, 3, 4)
-        # Give it time to complete
-        await asyncio.sleep(0.1)
-
-        result = queue.get_result(task_id)
+        result = await queue.wait(task_id)
         assert result is not None
         assert result.status == TaskStatus.COMPLETED
         assert result.result == 7
@@ -33,7 +31,7 @@ class TestTaskQueue:
 
         task_id = await queue.submit(noop, task_id="custom-123")
         assert task_id == "custom-123"
-        await asyncio.sleep(0.1)
+        await queue.wait(task_id)
         assert queue.get_status(task_id) == TaskStatus.COMPLETED
 
     async def test_failed_task(self, queue):
@@ -41,9 +39,7 @@ class TestTaskQueue:
             raise ValueError("Something went wrong")
 
         task_id = await queue.submit(failing)
-        await asyncio.sleep(0.1)
-
-        result = queue.get_result(task_id)
+        result = await queue.wait(task_id)
         assert result.status == TaskStatus.FAILED
         assert "ValueError" in result.error
 
@@ -61,8 +57,8 @@ class TestTaskQueue:
             tid = await queue.submit(slow_task, i)
             ids.append(tid)
 
-        # Wait for all to complete (4 tasks, 2 concurrent, 0.05s each = ~0.1s + margin)
-        await asyncio.sleep(0.5)
+        for tid in ids:
+            await queue.wait(tid, timeout=1)
 
         for tid in ids:
             assert queue.get_status(tid) == TaskStatus.COMPLETED
@@ -73,8 +69,7 @@ class TestTaskQueue:
             pass
 
         await queue.submit(noop)
-        await queue.submit(noop)
-        await asyncio.sleep(0.1)
+        await queue.wait(await queue.submit(noop))
 
         tasks = queue.list_tasks()
         assert len(tasks) == 2
@@ -83,8 +78,7 @@ class TestTaskQueue:
         async def noop():
             pass
 
-        await queue.submit(noop)
-        await asyncio.sleep(0.1)
+        await queue.wait(await queue.submit(noop))
 
         completed = queue.list_tasks(status=TaskStatus.COMPLETED)
         assert len(completed) >= 1
@@ -95,8 +89,7 @@ class TestTaskQueue:
         async def noop():
             pass
 
-        await queue.submit(noop)
-        await asyncio.sleep(0.1)
+        await queue.wait(await queue.submit(noop))
 
         stats = queue.stats
         assert stats["total_tasks"] == 1
@@ -113,8 +106,7 @@ class TestTaskQueue:
         async def noop():
             pass
 
-        await queue.submit(noop)
-        await asyncio.sleep(0.1)
+        await queue.wait(await queue.submit(noop))
 
         removed = queue.cleanup_old_tasks()
         assert removed >= 1
@@ -133,3 +125,333 @@ class TestTaskQueue:
 
         status = queue.get_status(task_id)
         assert status == TaskStatus.CANCELLED
+
+    async def test_wait(self, queue):
+        started = asyncio.Event()
+
+        async def gated():
+            started.set()
+            await asyncio.sleep(10)
+
+        task_id = await queue.submit(gated)
+        await started.wait()
+        with pytest.raises(asyncio.TimeoutError):
+            await queue.wait(task_id, timeout=0.01)
+
+        # Every waiter is resolved by the cancel, including one that timed out earlier
+        waiters = [asyncio.create_task(queue.wait(task_id)) for _ in range(2)]
+        await asyncio.sleep(0)
+        await queue.cancel(task_id)
+        results = await asyncio.gather(*waiters)
+        assert {r.status for r in results} == {TaskStatus.CANCELLED}
+
+        # Already finished or unknown: returns straight away
+        assert (await queue.wait(task_id)).status == TaskStatus.CANCELLED
+        assert await queue.wait("nope") is None
+
+    async def test_fifo_order(self, queue):
+        order = []
+
+        async def record(n):
+            order.append(n)
+
+        ids = [await queue.submit(record, i) for i in range(6)]
+        for tid in ids:
+            await queue.wait(tid)
+
+        assert order == list(range(6))
+
+    async def test_pending_tasks_not_materialized(self, queue):
+        async def noop():
+            pass
+
+        for _ in range(20):
+            await queue.submit(noop)
+
+        # Only the worker pool exists as tasks; queued entries are plain data
+        assert queue.stats["queued"] == 20
+        assert all(entry.asyncio_task is None for entry in queue._tasks.values())
+        await asyncio.sleep(0.1)
+        assert queue.stats["by_status"] == {"completed": 20}
+
+    async def test_cancel_pending(self, queue):
+        async def long_task():
+            await asyncio.sleep(10)
+
+        blockers = [await queue.submit(long_task) for _ in range(2)]
+        task_id = await queue.submit(long_task)
+        await asyncio.sleep(0.05)
+
+        assert queue.get_status(task_id) == TaskStatus.PENDING
+        assert await queue.cancel(task_id) is True
+        for tid in blockers:
+            await queue.cancel(tid)
+        await asyncio.sleep(0.05)
+
+        assert queue.get_status(task_id) == TaskStatus.CANCELLED
+        assert queue.get_result(task_id).started_at == 0
+
+    async def test_shutdown_drains_queue(self, queue):
+        async def slow(n):
+            await asyncio.sleep(0.02)
+            return n
+
+        ids = [await queue.submit(slow, i) for i in range(4)]
+        await queue.shutdown()
+
+        assert [queue.get_result(tid).result for tid in ids] == [0, 1, 2, 3]
+        assert queue.stats["queued"] == 0
+
+    async def test_shutdown_timeout_cancels(self, queue):
+        async def long_task():
+            await asyncio.sleep(10)
+
+        ids = [await queue.submit(long_task) for _ in range(3)]
+        await queue.shutdown(timeout=0.05)
+
+        assert {queue.get_status(tid) for tid in ids} == {TaskStatus.CANCELLED}
+
+    async def test_persistence_is_batched(self, queue, monkeypatch):
+        import src.db
+        batches = []
+        monkeypatch.setattr(src.db, "upsert_tasks_batch", lambda rows: batches.append(rows))
+
+        async def add(a, b):
+            return a + b
+
+        ids = [await queue.submit(add, i, i) for i in range(5)]
+        await asyncio.sleep(0.05)
+        await queue.shutdown()
+
+        # submit/running/completed for 5 tasks coalesce into one write
+        assert len(batches) == 1
+        rows = {row["task_id"]: row for row in batches[0]}
+        assert sorted(rows) == sorted(ids)
+        assert {row["status"] for row in rows.values()} == {"completed"}
+        assert rows[ids[2]]["result"] == 4
+        assert isinstance(rows[ids[2]]["completed_at"], float)
+
+    async def test_batch_upsert_formats_timestamps(self, monkeypatch):
+        from src.db import operations
+        sent = []
+
+        class FakeTable:
+            def upsert(self, rows, on_conflict):
+                sent.extend(rows)
+                return self
+
+            def execute(self):
+                return None
+
+        class FakeClient:
+            def table(self, name):
+                return FakeTable()
+
+        monkeypatch.setattr(operations, "get_supabase", lambda: FakeClient())
+        operations.upsert_tasks_batch([{
+            "task_id": "t1", "func_name": "f", "status": "running", "result": None,
+            "error": None, "created_at": 0.5, "started_at": 86400.0, "completed_at": None,
+        }])
+
+        assert sent[0]["started_at"] == "1970-01-02T00:00:00+00:00"
+        assert sent[0]["completed_at"] is None
+
+    async def test_full_buffer_flushes_early(self, monkeypatch):
+        import src.db
+        batches = []
+        monkeypatch.setattr(src.db, "upsert_tasks_batch", lambda rows: batches.append(rows))
+        queue = TaskQueue(max_concurrency=1, buffer_size=3, flush_interval=60)
+
+        async def noop():
+            pass
+
+        for _ in range(3):
+            await queue.submit(noop)
+        await asyncio.sleep(0.05)
+
+        assert batches and len(batches[0]) == 3
+        await queue.shutdown()
+
+    async def test_slow_database_applies_backpressure(self, monkeypatch):
+        import time
+        import src.db
+        monkeypatch.setattr(src.db, "upsert_tasks_batch", lambda rows: time.sleep(0.05))
+        queue = TaskQueue(max_concurrency=2, buffer_size=100, flush_interval=60, max_pending=2)
+
+        async def noop():
+            pass
+
+        for _ in range(6):
+            await queue.submit(noop)
+            assert len(queue._dirty) <= 2
+        await queue.shutdown()
+        assert queue._dirty == {}
+
+    async def test_db_fallback_is_cached(self, queue, monkeypatch):
+        import src.db
+        calls = []
+
+        def fake_get_task_db(task_id):
+            calls.append(task_id)
+            return {"task_id": task_id, "status": "completed", "result": {"ok": True}}
+
+        monkeypatch.setattr(src.db, "get_task_db", fake_get_task_db)
+
+        for _ in range(5):
+            assert queue.get_status("old-task") == TaskStatus.COMPLETED
+        assert queue.get_result("old-task").result == {"ok": True}
+        assert calls == ["old-task"]
+
+    async def test_db_cache_expires_live_rows(self, queue, monkeypatch):
+        import src.db
+        from src.tasks import queue as queue_module
+        calls = []
+
+        def fake_get_task_db(task_id):
+            calls.append(task_id)
+            return {"task_id": task_id, "status": "running"}
+
+        monkeypatch.setattr(src.db, "get_task_db", fake_get_task_db)
+        monkeypatch.setattr(queue_module, "DB_CACHE_TTL", 0)
+
+        queue.get_status("live-task")
+        queue.get_status("live-task")
+        assert calls == ["live-task", "live-task"]
+
+    async def test_list_tasks_newest_first(self, queue):
+        async def noop():
+            pass
+
+        ids = [await queue.submit(noop) for _ in range(4)]
+        await queue.submit(noop, task_id=ids[0])  # Reused id counts as newest
+        await asyncio.sleep(0.1)
+
+        listed = [t.task_id for t in queue.list_tasks(limit=3)]
+        assert listed == [ids[0], ids[3], ids[2]]
+
+    async def test_stats_counts_follow_transitions(self, queue):
+        async def noop():
+            pass
+
+        async def failing():
+            raise ValueError("boom")
+
+        async def long_task():
+            await asyncio.sleep(10)
+
+        await queue.submit(noop)
+        await queue.submit(failing)
+        running = [await queue.submit(long_task) for _ in range(2)]
+        pending = await queue.submit(long_task)
+        await asyncio.sleep(0.05)
+        assert queue.stats["by_status"] == {"completed": 1, "failed": 1, "running": 2, "pending": 1}
+
+        await queue.cancel(pending)
+        await queue.cancel(running[0])
+        await asyncio.sleep(0.05)
+        assert queue.stats["by_status"] == {"completed": 1, "failed": 1, "running": 1, "cancelled": 2}
+
+        queue._result_ttl = -1
+        queue.cleanup_old_tasks()
+        assert queue.stats["by_status"] == {"running": 1}
+        await queue.cancel(running[1])
+
+    async def test_cleanup_only_expired_prefix(self, queue):
+        async def noop():
+            pass
+
+        async def long_task():
+            await asyncio.sleep(10)
+
+        old = await queue.submit(noop)
+        cancelled = await queue.submit(long_task)
+        await asyncio.sleep(0.05)
+        await queue.cancel(cancelled)  # Stamped by cancel() and again by the worker
+        await asyncio.sleep(0.05)
+        queue._tasks[old].completed_at -= 120
+        queue._expiry_queue[0] = (queue._tasks[old].completed_at, old)
+
+        assert queue.cleanup_old_tasks() == 1
+        assert queue.get_status(old) is None
+        assert queue.get_status(cancelled) == TaskStatus.CANCELLED
+
+        queue._result_ttl = -1
+        assert queue.cleanup_old_tasks() == 1
+        assert not queue._expiry_queue
+
+    async def test_ttl_shrinks_under_memory_pressure(self):
+        queue = TaskQueue(max_concurrency=2, result_ttl_seconds=3600, max_tasks=100)
+
+        async def noop():
+            pass
+
+        for _ in range(70):
+            await queue.submit(noop)
+        assert queue._effective_ttl() == 3600
+
+        for _ in range(10):
+            await queue.submit(noop)
+        assert queue._effective_ttl() == 1800
+
+        for _ in range(20):
+            await queue.submit(noop)
+        assert queue._effective_ttl() == 60
+        await queue.shutdown()
+
+    async def test_submit_evicts_under_pressure(self):
+        queue = TaskQueue(max_concurrency=2, result_ttl_seconds=3600, max_tasks=10)
+
+        async def noop():
+            pass
+
+        for _ in range(8):
+            await queue.submit(noop)
+        await asyncio.sleep(0.05)
+        # Finished 50 minutes ago: inside the 1h TTL, outside the 30 min
+        # it shrinks to at 8/10 of max_tasks
+        for entry in queue._tasks.values():
+            entry.completed_at -= 3000
+        queue._expiry_queue = deque((e.completed_at, e.task_id) for e in queue._tasks.values())
+
+        await queue.submit(noop)
+        assert queue.stats["total_tasks"] == 1
+        await queue.shutdown()
+
+    async def test_finished_result_snapshot_is_reused(self, queue):
+        async def long_task():
+            await asyncio.sleep(10)
+
+        async def add(a, b):
+            return a + b
+
+        done = await queue.submit(add, 1, 2)
+        running = await queue.submit(long_task)
+        await asyncio.sleep(0.05)
+
+        assert queue.get_result(done) is queue.get_result(done)
+        assert queue.get_result(done).result == 3
+        assert queue.list_tasks()[1].result is None
+        assert queue.get_result(running) is not queue.get_result(running)
+
+        first = queue.get_result(running)
+        await queue.cancel(running)
+        await asyncio.sleep(0.05)
+        assert first.status == TaskStatus.RUNNING
+        assert queue.get_result(running).status == TaskStatus.CANCELLED
+
+    async def test_unchanged_state_not_persisted_again(self, queue, monkeypatch):
+        import src.db
+        batches = []
+        monkeypatch.setattr(src.db, "upsert_tasks_batch", lambda rows: batches.append(rows))
+
+        async def noop():
+            pass
+
+        task_id = await queue.submit(noop)
+        await asyncio.sleep(0.05)
+        await queue._flush_now()
+        queue._persist_update(queue._tasks[task_id])
+        await queue._flush_now()
+
+        assert len(batches) == 1
+        await queue.shutdown()
@@ -1,6 +1,10 @@
 """Tests for utility functions."""
 
-from src.utils import normalize_keyword, deduplicate_preserve_order
+import json
+
+import pytest
+
+from src.utils import json_loads, normalize_keyword, normalize_keywords, deduplicate_preserve_order, split_sentences
 
 
 class TestNormalizeKeyword:
@@ -33,3 +37,38 @@ class TestDeduplicatePreserveOrder:
 
     def test_all_same(self):
         assert deduplicate_preserve_order(["x", "x", "x"]) == ["x"]
+
+    def test_limit(self):
+        assert deduplicate_preserve_order(["a", "a", "b", "c", "d"], limit=3) == ["a", "b", "c"]
+
+
+class TestNormalizeKeywords:
+    def test_normalizes_and_dedups(self):
+        result = normalize_keywords(["machine_learning", " Python ", "machine learning", "", None, "Python"])
+        assert result == ["machine learning", "Python"]
+
+    def test_limit(self):
+        assert normalize_keywords(["a", "b", "a", "c", "d"], limit=3) == ["a", "b", "c"]
+
+    def test_non_string_items(self):
+        assert normalize_keywords([3, "3", "x"]) == ["3", "x"]
+
+
+class TestSplitSentences:
+    def test_splits_on_terminal_punctuation(self):
+        text = "Built the API. Shipped it!  Cut latency?\nAdded tests"
+        assert split_sentences(text) == ["Built the API.", "Shipped it!", "Cut latency?", "Added tests."]
+
+    def test_limit_and_empty(self):
+        assert split_sentences("One. Two. Three. Four.", limit=3) == ["One.", "Two.", "Three."]
+        assert split_sentences("   ") == []
+
+
+class TestJsonLoads:
+    def test_parses_str_and_bytes(self):
+        assert json_loads('["a", "b"]') == ["a", "b"]
+        assert json_loads(b'{"x": 1}') == {"x": 1}
+
+    def test_invalid_raises_stdlib_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("not json")